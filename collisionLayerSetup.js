@@ -1,8 +1,14 @@
+// Bodies registered by streamed map chunks carry their chunk key; the chunk
+// owns their colliders and removes them when it unloads.
+export function isChunkCollisionBody(body) {
+    return body?.tileInfo?.chunk !== undefined;
+}
+
 export function setupCollisionLayers(scene, layerNames, {
     createTileCollisionBodies,
     drawTileCollisionDebug
 } = {}) {
-    scene.customCollisionBodies = [];
+    scene.customCollisionBodies = (scene.customCollisionBodies ?? []).filter(isChunkCollisionBody);
 
     layerNames.forEach(layerName => {
         const layer = scene.map.getLayer(layerName);
@@ -3,7 +3,7 @@ import {
     getTileCollisionObjects as getTileCollisionObjectsForTile
 } from './collisionBodyFactory.js';
 import { clearCollisionBodiesDebug, drawCollisionBodiesDebug } from './collisionBodyDebug.js';
-import { setupCollisionLayers } from './collisionLayerSetup.js';
+import { isChunkCollisionBody, setupCollisionLayers } from './collisionLayerSetup.js';
 import { bindCollisionBodies } from './collisionColliderBinding.js';
 import { clearTileCollisionDebug, renderTileCollisionDebug } from './collisionTileDebug.js';
 
@@ -65,7 +65,7 @@ class CollisionManager {
     }
 
     static addColliders(scene) {
-        bindCollisionBodies(scene, scene.customCollisionBodies);
+        bindCollisionBodies(scene, scene.customCollisionBodies.filter(body => !isChunkCollisionBody(body)));
     }
 }
 
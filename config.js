@@ -9,11 +9,21 @@ const CONFIG = {
         PLAYER: 'player',
         MAP: 'map'
     },
+    MAP_CHUNKS: {
+        ENABLED: false,
+        MANIFEST: 'map_chunks',
+        DIRECTORY: 'chunks/map',
+        LOAD_RADIUS: 1
+    },
     CONTENT: {
         DOMAINS: 'technology_domains',
         DISCOVERY_TRAILS: 'discovery_trails',
         VENDORS: 'vendors'
     },
+    CONTENT_BUNDLE: {
+        ENABLED: false,
+        KEY: 'content_bundle'
+    },
     PLAYER: {
         FRAME_WIDTH: 32,
         FRAME_HEIGHT: 48,
@@ -0,0 +1,148 @@
+// Client side of content_bundle.py: one newline-delimited file holding the
+// boot content sections in first-paint order. Sections are decoded on first
+// use, so asking for the trails and vendors never parses the domains or help
+// lines that follow them.
+
+export const CONTENT_BUNDLE_FORMAT = 'tiletest-content-bundle';
+export const CONTENT_BUNDLE_VERSION = 1;
+
+const REFERENCE_PREFIX = '~';
+
+function decodeValue(value, strings) {
+    if (typeof value === 'string') {
+        if (!value.startsWith(REFERENCE_PREFIX)) {
+            return value;
+        }
+
+        const reference = value.slice(REFERENCE_PREFIX.length);
+        return reference.startsWith(REFERENCE_PREFIX) ? reference : strings[parseInt(reference, 36)];
+    }
+
+    if (Array.isArray(value)) {
+        for (let index = 0; index < value.length; index += 1) {
+            value[index] = decodeValue(value[index], strings);
+        }
+        return value;
+    }
+
+    if (value && typeof value === 'object') {
+        for (const key of Object.keys(value)) {
+            value[key] = decodeValue(value[key], strings);
+        }
+    }
+
+    return value;
+}
+
+export class ContentBundle {
+    constructor(text) {
+        const source = String(text ?? '');
+        const headerEnd = source.indexOf('\n');
+        const header = JSON.parse(headerEnd === -1 ? source : source.slice(0, headerEnd));
+        if (header?.format !== CONTENT_BUNDLE_FORMAT || header.version !== CONTENT_BUNDLE_VERSION) {
+            throw new Error(`Unsupported content bundle ${header?.format} v${header?.version}`);
+        }
+
+        this.sectionNames = Array.isArray(header.sections) ? header.sections : [];
+        this.source = source;
+        this.offset = headerEnd === -1 ? source.length : headerEnd + 1;
+        this.strings = [];
+        this.sections = new Map();
+    }
+
+    hasSection(name) {
+        return this.sectionNames.includes(name);
+    }
+
+    // Later sections may reference strings introduced by earlier ones, so
+    // lines are always decoded in order, up to the requested section.
+    getSection(name) {
+        if (!this.hasSection(name)) {
+            return undefined;
+        }
+
+        while (!this.sections.has(name) && this.offset < this.source.length) {
+            const lineEnd = this.source.indexOf('\n', this.offset);
+            const end = lineEnd === -1 ? this.source.length : lineEnd;
+            const line = this.source.slice(this.offset, end);
+            this.offset = end + 1;
+            if (!line) {
+                continue;
+            }
+
+            const section = JSON.parse(line);
+            this.strings.push(...section.strings);
+            this.sections.set(section.name, decodeValue(section.data, this.strings));
+        }
+
+        if (this.offset >= this.source.length) {
+            this.source = '';
+        }
+
+        return this.sections.get(name);
+    }
+}
+
+// Returns the bundle in text with its boot sections already decoded, or null
+// when it is corrupt, was built for another format version, or lacks one of
+// them.
+export function openContentBundle(text, bootSections = []) {
+    try {
+        const bundle = new ContentBundle(text);
+        bootSections.forEach(name => {
+            if (bundle.getSection(name) === undefined) {
+                throw new Error(`Content bundle has no ${name} section`);
+            }
+        });
+        return bundle;
+    } catch (error) {
+        console.error('Error reading content bundle:', error);
+        return null;
+    }
+}
+
+// Queues the bundle and opens it as soon as it arrives, keeping the result on
+// scene.contentBundle. When the bundle fails to load or cannot be used,
+// loadFallback queues the separate content files while the loader is still
+// running, so create() always finds one or the other.
+export function preloadContentBundle(scene, { key, url, bootSections = [], loadFallback }) {
+    const loader = scene.load;
+    let fellBack = false;
+    const fallBack = () => {
+        if (!fellBack) {
+            fellBack = true;
+            loadFallback();
+        }
+    };
+    const onLoadError = file => {
+        if (file?.key === key) {
+            scene.contentBundle = null;
+            fallBack();
+        }
+    };
+
+    loader.once(`filecomplete-text-${key}`, (_fileKey, _type, text) => {
+        scene.contentBundle = openContentBundle(text, bootSections);
+        if (!scene.contentBundle) {
+            fallBack();
+        }
+    });
+    loader.on('loaderror', onLoadError);
+    loader.once('complete', () => loader.off('loaderror', onLoadError));
+    loader.text(key, url);
+}
+
+// Returns the bundle opened during preload, or else the one Phaser loaded as
+// text under key; null when it is missing or unusable.
+export function readContentBundle(scene, key) {
+    if (scene.contentBundle !== undefined) {
+        return scene.contentBundle;
+    }
+
+    const text = scene.cache?.text?.get?.(key);
+    if (!text) {
+        return null;
+    }
+
+    return openContentBundle(text);
+}
@@ -0,0 +1,161 @@
+import argparse
+import gzip
+import hashlib
+import json
+import os
+from collections import Counter
+
+from content_cache import load_json
+
+# Packs the boot content into one versioned bundle the client fetches in a
+# single request:
+#
+#   content_bundle.json           newline-delimited: a header line, then one
+#                                 line per section in first-paint order
+#   content_bundle.json.gz        the same bytes precompressed for the server
+#   content_bundle.manifest.json  format version, SHA-256, and sizes
+#
+# Each section line is {"name", "strings", "data"}. Strings used more than once
+# anywhere in the bundle move to a string table, introduced by the first
+# section that needs them, and data refers to them as "~<base36 index>". Data
+# strings that really start with "~" are written with a second "~". Sections
+# only reference their own and earlier tables, so the client can decode the
+# first-paint sections without touching the rest.
+
+BUNDLE_FORMAT = 'tiletest-content-bundle'
+BUNDLE_VERSION = 1
+REFERENCE_PREFIX = '~'
+MIN_SHARED_STRING_LENGTH = 4
+
+
+def iter_strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        for entry in value:
+            yield from iter_strings(entry)
+    elif isinstance(value, dict):
+        for entry in value.values():
+            yield from iter_strings(entry)
+
+
+def to_base36(number):
+    digits = '0123456789abcdefghijklmnopqrstuvwxyz'
+    text = ''
+    while True:
+        number, remainder = divmod(number, 36)
+        text = digits[remainder] + text
+        if number == 0:
+            return text
+
+
+def encode_value(value, shared, table):
+    """Replace shared strings with table references, adding new ones to table"""
+    if isinstance(value, str):
+        if value not in shared:
+            return REFERENCE_PREFIX + value if value.startswith(REFERENCE_PREFIX) else value
+        index = shared[value]
+        if index is None:
+            index = shared[value] = len(table)
+            table.append(value)
+        return REFERENCE_PREFIX + to_base36(index)
+    if isinstance(value, list):
+        return [encode_value(entry, shared, table) for entry in value]
+    if isinstance(value, dict):
+        return {key: encode_value(entry, shared, table) for key, entry in value.items()}
+    return value
+
+
+def build_bundle(sections):
+    """Return the bundle bytes for [(name, data)] in first-paint order"""
+    counts = Counter(text for _, data in sections for text in iter_strings(data))
+    # Maps each shared string to its table index once a section introduces it.
+    shared = {text: None for text, count in counts.items() if count > 1 and len(text) >= MIN_SHARED_STRING_LENGTH}
+    table = []
+
+    lines = [{'format': BUNDLE_FORMAT, 'version': BUNDLE_VERSION, 'sections': [name for name, _ in sections]}]
+    for name, data in sections:
+        start = len(table)
+        encoded = encode_value(data, shared, table)
+        lines.append({'name': name, 'strings': table[start:], 'data': encoded})
+
+    return ''.join(json.dumps(line, separators=(',', ':'), ensure_ascii=False) + '\n' for line in lines).encode('utf-8')
+
+
+def decode_value(value, table):
+    if isinstance(value, str):
+        if not value.startswith(REFERENCE_PREFIX):
+            return value
+        reference = value[len(REFERENCE_PREFIX):]
+        return reference if reference.startswith(REFERENCE_PREFIX) else table[int(reference, 36)]
+    if isinstance(value, list):
+        return [decode_value(entry, table) for entry in value]
+    if isinstance(value, dict):
+        return {key: decode_value(entry, table) for key, entry in value.items()}
+    return value
+
+
+def decode_bundle(body):
+    """Return {section name: data} from bundle bytes or text"""
+    text = body.decode('utf-8') if isinstance(body, bytes) else body
+    header, *lines = [json.loads(line) for line in text.splitlines() if line]
+    if header.get('format') != BUNDLE_FORMAT or header.get('version') != BUNDLE_VERSION:
+        raise ValueError(f'Unsupported content bundle {header.get("format")} v{header.get("version")}.')
+
+    table = []
+    sections = {}
+    for line in lines:
+        table.extend(line['strings'])
+        sections[line['name']] = decode_value(line['data'], table)
+    return sections
+
+
+def write_bundle(sections, output_dir, name='content_bundle'):
+    """Write the bundle, its gzip variant, and its manifest; return the manifest"""
+    body = build_bundle(sections)
+    # mtime=0 keeps the gzip bytes identical for identical content.
+    compressed = gzip.compress(body, compresslevel=9, mtime=0)
+    manifest = {
+        'format': BUNDLE_FORMAT,
+        'version': BUNDLE_VERSION,
+        'bundle': f'{name}.json',
+        'sha256': hashlib.sha256(body).hexdigest(),
+        'bytes': len(body),
+        'gzipBytes': len(compressed),
+        'sections': [section_name for section_name, _ in sections]
+    }
+
+    os.makedirs(output_dir, exist_ok=True)
+    for file_name, data in (
+        (f'{name}.json', body),
+        (f'{name}.json.gz', compressed),
+        (f'{name}.manifest.json', (json.dumps(manifest, indent=2) + '\n').encode('utf-8'))
+    ):
+        path = os.path.join(output_dir, file_name)
+        with open(f'{path}.tmp', 'wb') as f:
+            f.write(data)
+        os.replace(f'{path}.tmp', path)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pack boot content into one versioned bundle.')
+    parser.add_argument('--trails', default='discovery_trails.json')
+    parser.add_argument('--vendors', default='vendors.json')
+    parser.add_argument('--domains', default='technology_domains.json')
+    parser.add_argument('--output-dir', default='assets')
+    args = parser.parse_args()
+
+    sources = (
+        ('discovery_trails', args.trails),
+        ('vendors', args.vendors),
+        ('technology_domains', args.domains)
+    )
+    manifest = write_bundle([(name, load_json(path)) for name, path in sources], args.output_dir)
+    source_bytes = sum(os.path.getsize(path) for _, path in sources)
+    print(f"Wrote {os.path.join(args.output_dir, manifest['bundle'])}: {manifest['bytes']} bytes "
+          f"({manifest['gzipBytes']} gzipped) from {source_bytes} bytes of sources, sha256 {manifest['sha256'][:12]}.")
+
+
+if __name__ == "__main__":
+    main()
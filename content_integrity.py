@@ -0,0 +1,177 @@
+import argparse
+import json
+import sys
+
+from content_cache import load_json
+
+# Cross-file reference checks for the bundled content:
+#   vendors.json domain_id          -> technology_domains.json id
+#   discovery_trails.json vendorId  -> vendors.json id
+#   quest item names                -> unique per domain, collectible from a vendor
+# Every file is indexed once and each reference is a hash lookup, so the
+# whole check stays linear in the size of the content.
+
+ERROR = 'error'
+WARNING = 'warning'
+
+
+class IntegrityReport:
+    def __init__(self):
+        self.issues = []
+        self.counts = {}
+
+    def add(self, severity, code, file, path, message, **details):
+        issue = {
+            'severity': severity,
+            'code': code,
+            'file': file,
+            'path': path,
+            'message': message
+        }
+        issue.update(details)
+        self.issues.append(issue)
+
+    @property
+    def ok(self):
+        return not any(issue['severity'] == ERROR for issue in self.issues)
+
+    def to_dict(self):
+        return {
+            'ok': self.ok,
+            'counts': dict(self.counts),
+            'errors': sum(1 for issue in self.issues if issue['severity'] == ERROR),
+            'warnings': sum(1 for issue in self.issues if issue['severity'] == WARNING),
+            'issues': list(self.issues)
+        }
+
+
+def index_by_id(entries, file, path, report, id_key='id'):
+    """Index entries by id, reporting duplicates and missing ids"""
+    index = {}
+    for position, entry in enumerate(entries):
+        entry_id = entry.get(id_key) if isinstance(entry, dict) else None
+        entry_path = f'{path}[{position}]'
+        if not isinstance(entry_id, str) or not entry_id.strip():
+            report.add(ERROR, 'missing_id', file, entry_path, f'Entry has no {id_key}.')
+            continue
+
+        if entry_id in index:
+            report.add(
+                ERROR, 'duplicate_id', file, entry_path,
+                f'Duplicate id "{entry_id}" (first defined at {path}[{index[entry_id]}]).',
+                id=entry_id
+            )
+            continue
+
+        index[entry_id] = position
+    return index
+
+
+def check_content_integrity(vendors, domains, trails, files=None):
+    """Check every cross-file reference in one pass and return an IntegrityReport"""
+    files = {
+        'vendors': 'vendors.json',
+        'domains': 'technology_domains.json',
+        'trails': 'discovery_trails.json',
+        **(files or {})
+    }
+    report = IntegrityReport()
+    report.counts = {'vendors': len(vendors), 'domains': len(domains), 'trails': len(trails)}
+
+    domain_index = index_by_id(domains, files['domains'], '', report)
+    vendor_index = index_by_id(vendors, files['vendors'], '', report)
+    index_by_id(trails, files['trails'], '', report)
+
+    vendors_per_domain = dict.fromkeys(domain_index, 0)
+    for position, vendor in enumerate(vendors):
+        if not isinstance(vendor, dict):
+            continue
+
+        domain_id = vendor.get('domain_id')
+        if domain_id in vendors_per_domain:
+            vendors_per_domain[domain_id] += 1
+        else:
+            report.add(
+                ERROR, 'missing_domain', files['vendors'], f'[{position}].domain_id',
+                f'Vendor "{vendor.get("id")}" references unknown domain "{domain_id}".',
+                id=vendor.get('id'), reference=domain_id
+            )
+
+    # Quest objectives are matched by item name, so names must be unique within
+    # a domain and the domain needs at least one vendor to collect them from.
+    item_count = 0
+    for domain_id, position in domain_index.items():
+        domain = domains[position]
+        item_names = {}
+        for item_position, item in enumerate(domain.get('items') or []):
+            item_count += 1
+            item_path = f'[{position}].items[{item_position}]'
+            name = item.get('name') if isinstance(item, dict) else None
+            if not isinstance(name, str) or not name.strip():
+                report.add(ERROR, 'missing_item_name', files['domains'], item_path,
+                           f'Domain "{domain_id}" has an item without a name.', id=domain_id)
+            elif name in item_names:
+                report.add(ERROR, 'duplicate_item_name', files['domains'], item_path,
+                           f'Domain "{domain_id}" repeats quest item "{name}".', id=domain_id, reference=name)
+            else:
+                item_names[name] = item_position
+
+        if vendors_per_domain[domain_id] == 0:
+            report.add(
+                WARNING, 'orphaned_domain', files['domains'], f'[{position}]',
+                f'Domain "{domain_id}" has no vendors, so its {len(item_names)} quest items cannot be collected.',
+                id=domain_id
+            )
+    report.counts['items'] = item_count
+
+    stop_count = 0
+    for trail_position, trail in enumerate(trails):
+        if not isinstance(trail, dict):
+            continue
+
+        trail_path = f'[{trail_position}].stops'
+        stop_index = index_by_id(trail.get('stops') or [], files['trails'], trail_path, report)
+        for stop_position in stop_index.values():
+            stop_count += 1
+            vendor_id = trail['stops'][stop_position].get('vendorId')
+            if vendor_id not in vendor_index:
+                report.add(
+                    ERROR, 'unreachable_trail_stop', files['trails'], f'{trail_path}[{stop_position}].vendorId',
+                    f'Trail "{trail.get("id")}" stop references unknown vendor "{vendor_id}".',
+                    id=trail.get('id'), reference=vendor_id
+                )
+    report.counts['trailStops'] = stop_count
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check cross-file references across content files.')
+    parser.add_argument('--vendors', default='vendors.json')
+    parser.add_argument('--domains', default='technology_domains.json')
+    parser.add_argument('--trails', default='discovery_trails.json')
+    parser.add_argument('--json', action='store_true', help='print the machine-readable report')
+    args = parser.parse_args()
+
+    report = check_content_integrity(
+        load_json(args.vendors),
+        load_json(args.domains),
+        load_json(args.trails),
+        files={'vendors': args.vendors, 'domains': args.domains, 'trails': args.trails}
+    )
+
+    if args.json:
+        json.dump(report.to_dict(), sys.stdout, indent=2)
+        print()
+    else:
+        for issue in report.issues:
+            print(f"{issue['severity'].upper()} {issue['file']}{issue['path']}: {issue['message']}")
+        summary = report.to_dict()
+        print(f"Checked {', '.join(f'{count} {name}' for name, count in summary['counts'].items())}: "
+              f"{summary['errors']} errors, {summary['warnings']} warnings.")
+
+    sys.exit(0 if report.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
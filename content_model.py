@@ -0,0 +1,368 @@
+import json
+import sys
+from types import MappingProxyType
+
+from content_cache import load_json
+
+# Compact content model shared by the pipeline scripts.
+#
+# Template items, facts, and dialog response lists are interned: every vendor
+# that carries the same template entry holds a reference to one shared object
+# instead of its own dict. Shared objects are treated as immutable; the Vendor
+# setters below replace them rather than mutating them in place.
+#
+# Strings that repeat across vendors (booths, domains, template text) are
+# interned on load. Per-vendor strings such as ids, names, and greetings are
+# left alone, since interning a unique string only grows the intern table.
+
+EMPTY_MAPPING = MappingProxyType({})
+
+
+def intern_text(value):
+    """Return the canonical copy of a string so equal strings share memory"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def intern_json(value):
+    """Recursively intern every string inside a decoded JSON value"""
+    if type(value) is str:
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [intern_json(entry) for entry in value]
+    if isinstance(value, dict):
+        return {sys.intern(key): intern_json(entry) for key, entry in value.items()}
+    return value
+
+
+def thaw_json(value):
+    """Copy a possibly shared JSON value into plain mutable lists and dicts"""
+    if isinstance(value, (list, tuple)):
+        return [thaw_json(entry) for entry in value]
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw_json(entry) for key, entry in value.items()}
+    return value
+
+
+class Item:
+    """An inventory template entry; per-owner item ids live on the owner"""
+
+    __slots__ = ('name', 'description', 'value', 'extra')
+    _shared = {}
+
+    def __init__(self, name, description, value, extra=None):
+        self.name = intern_text(name)
+        self.description = intern_text(description)
+        self.value = value
+        self.extra = extra
+
+    @classmethod
+    def shared(cls, name, description, value, id=None, **extra):
+        """Return the one shared Item for this name/description/value and any extra keys"""
+        # The id belongs to the owner; any other keys travel with the template.
+        extra_key = json.dumps(extra, sort_keys=True) if extra else None
+        key = (name, description, value, extra_key)
+        item = cls._shared.get(key)
+        if item is None:
+            item = cls._shared[key] = cls(name, description, value, intern_json(extra) if extra else None)
+        return item
+
+    def to_dict(self, item_id):
+        item = {
+            'id': item_id,
+            'name': self.name,
+            'description': self.description,
+            'value': self.value
+        }
+        if self.extra:
+            item.update(thaw_json(self.extra))
+        return item
+
+    def __repr__(self):
+        return f'Item({self.name!r}, {self.value!r})'
+
+
+class Fact:
+    """A piece of trivia text shared by every vendor or domain quoting it"""
+
+    __slots__ = ('text',)
+    _shared = {}
+
+    def __init__(self, text):
+        self.text = intern_text(text)
+
+    @classmethod
+    def shared(cls, text):
+        fact = cls._shared.get(text)
+        if fact is None:
+            fact = cls._shared[text] = cls(text)
+        return fact
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f'Fact({self.text!r})'
+
+
+def shared_items(templates):
+    """Intern a list of item template dicts into a tuple of shared Items"""
+    return tuple(Item.shared(**template) for template in templates)
+
+
+def shared_facts(texts):
+    return tuple(Fact.shared(text) for text in texts)
+
+
+def compress_item_ids(item_ids):
+    """Return (prefix, None) when ids are prefix1..prefixN, else (None, ids)"""
+    if not item_ids:
+        return '', None
+
+    prefix = item_ids[0].rpartition('_')[0] + '_'
+    if all(item_id == f'{prefix}{number}' for number, item_id in enumerate(item_ids, 1)):
+        return intern_text(prefix), None
+    return None, tuple(item_ids)
+
+
+class ItemOwner:
+    """Shared item storage for vendors and domains"""
+
+    __slots__ = ('items', 'item_id_prefix', 'item_ids')
+
+    def set_items(self, items, id_prefix):
+        """Assign shared Items whose ids are derived as id_prefix + 1..N"""
+        self.items = tuple(items)
+        self.item_id_prefix = intern_text(id_prefix)
+        self.item_ids = None
+
+    def get_item_ids(self):
+        if self.items is None:
+            return ()
+        if self.item_ids is not None:
+            return self.item_ids
+        return tuple(f'{self.item_id_prefix}{number}' for number in range(1, len(self.items) + 1))
+
+    def item_dicts(self):
+        if self.items is None:
+            return []
+        return [item.to_dict(item_id) for item, item_id in zip(self.items, self.get_item_ids())]
+
+    def _load_items(self, item_dicts):
+        if item_dicts is None:
+            self.items = None
+            self.item_id_prefix = None
+            self.item_ids = None
+            return
+
+        self.items = tuple(Item.shared(**item) for item in item_dicts)
+        self.item_id_prefix, self.item_ids = compress_item_ids([item['id'] for item in item_dicts])
+
+
+class Domain(ItemOwner):
+    """A technology domain from technology_domains.json"""
+
+    __slots__ = ('id', 'name', 'description', 'keywords', 'facts')
+
+    def __init__(self, id, name, description='', keywords=(), facts=(), items=()):
+        self.id = intern_text(id)
+        self.name = intern_text(name)
+        self.description = intern_text(description)
+        self.keywords = tuple(intern_text(keyword) for keyword in keywords)
+        self.facts = shared_facts(facts)
+        self._load_items(list(items))
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'keywords': list(self.keywords),
+            'facts': [fact.text for fact in self.facts],
+            'items': self.item_dicts()
+        }
+
+
+# Vendor JSON keys in the order the pipeline has always written them, mapped
+# to the Vendor slot holding each one.
+VENDOR_FIELDS = (
+    ('id', 'id'),
+    ('name', 'name'),
+    ('booth', 'booth'),
+    ('url', 'url'),
+    ('description', 'description'),
+    ('featuredItems', 'featured_items'),
+    ('announcements', 'announcements'),
+    ('clueText', 'clue_text'),
+    ('x', 'x'),
+    ('y', 'y'),
+    ('items', 'items'),
+    ('dialog', 'dialog'),
+    ('facts', 'facts'),
+    ('puzzle_items', 'puzzle_items'),
+    ('puzzle_dialog', 'puzzle_dialog'),
+    ('domain_id', 'domain_id')
+)
+VENDOR_KEYS = frozenset(key for key, _ in VENDOR_FIELDS)
+TEXT_FIELDS = ('booth', 'url', 'description', 'clue_text', 'domain_id')
+TEXT_LIST_FIELDS = ('featured_items', 'announcements')
+
+
+class Dialog:
+    """Vendor dialog with an interned, shareable response list"""
+
+    __slots__ = ('greeting', 'responses', 'extra')
+    _shared_responses = {}
+
+    def __init__(self, greeting, responses=(), extra=None):
+        self.greeting = greeting
+        self.responses = self.share_responses(responses)
+        self.extra = extra
+
+    @classmethod
+    def share_responses(cls, responses):
+        """Intern a response list as a shared tuple of (text, action) pairs"""
+        key = tuple((intern_text(response['text']), intern_text(response['action'])) for response in responses)
+        return cls._shared_responses.setdefault(key, key)
+
+    @classmethod
+    def from_dict(cls, data):
+        responses = data.get('responses', [])
+        if any(set(response) != {'text', 'action'} for response in responses):
+            return intern_json(data)
+
+        extra = {key: value for key, value in data.items() if key not in ('greeting', 'responses')}
+        return cls(data.get('greeting', ''), responses, intern_json(extra) if extra else None)
+
+    def with_response_text(self, action, text):
+        """Return a copy whose last response uses text, or self if that response is not for action"""
+        if not self.responses or self.responses[-1][1] != action:
+            return self
+
+        responses = [{'text': response_text, 'action': response_action} for response_text, response_action in self.responses[:-1]]
+        responses.append({'text': text, 'action': action})
+        return Dialog(self.greeting, responses, self.extra)
+
+    def to_dict(self):
+        dialog = {
+            'greeting': self.greeting,
+            'responses': [{'text': text, 'action': action} for text, action in self.responses]
+        }
+        if self.extra:
+            dialog.update(thaw_json(self.extra))
+        return dialog
+
+
+class Vendor(ItemOwner):
+    """One exhibitor record from vendors.json"""
+
+    __slots__ = (
+        'id', 'name', 'booth', 'url', 'description', 'featured_items', 'announcements',
+        'clue_text', 'x', 'y', 'dialog', 'facts', 'puzzle_items', 'puzzle_dialog',
+        'domain_id', 'extra'
+    )
+
+    def __init__(self, id, name, booth='', url='', description='', x=0, y=0, **fields):
+        self.id = id
+        self.name = name
+        self.booth = intern_text(booth)
+        self.url = intern_text(url)
+        self.description = intern_text(description)
+        self.x = x
+        self.y = y
+        self.featured_items = None
+        self.announcements = None
+        self.clue_text = None
+        self.dialog = None
+        self.facts = None
+        self.puzzle_items = None
+        self.puzzle_dialog = None
+        self.domain_id = None
+        self.extra = None
+        self._load_items(None)
+
+        for slot, value in fields.items():
+            setattr(self, slot, value)
+
+    @classmethod
+    def from_dict(cls, data):
+        vendor = cls.__new__(cls)
+        for key, slot in VENDOR_FIELDS:
+            value = data.get(key)
+            if slot == 'items':
+                vendor._load_items(value)
+            elif value is None:
+                setattr(vendor, slot, None)
+            elif slot in TEXT_FIELDS:
+                setattr(vendor, slot, intern_text(value))
+            elif slot in TEXT_LIST_FIELDS:
+                setattr(vendor, slot, tuple(intern_text(entry) for entry in value))
+            elif slot == 'facts':
+                vendor.facts = shared_facts(value)
+            elif slot == 'dialog':
+                vendor.dialog = Dialog.from_dict(value)
+            elif slot == 'puzzle_dialog':
+                vendor.puzzle_dialog = intern_json(value) if value else EMPTY_MAPPING
+            elif slot == 'puzzle_items':
+                vendor.puzzle_items = tuple(intern_json(value))
+            else:
+                setattr(vendor, slot, value)
+
+        extra = {key: value for key, value in data.items() if key not in VENDOR_KEYS}
+        vendor.extra = intern_json(extra) if extra else None
+        return vendor
+
+    def set_facts(self, facts):
+        self.facts = tuple(fact if isinstance(fact, Fact) else Fact.shared(fact) for fact in facts)
+
+    def to_dict(self):
+        vendor = {}
+        for key, slot in VENDOR_FIELDS:
+            value = getattr(self, slot)
+            if value is None:
+                continue
+
+            if slot == 'items':
+                vendor[key] = self.item_dicts()
+            elif slot == 'facts':
+                vendor[key] = [fact.text for fact in value]
+            elif isinstance(value, Dialog):
+                vendor[key] = value.to_dict()
+            else:
+                vendor[key] = thaw_json(value)
+
+        if self.extra:
+            vendor.update(thaw_json(self.extra))
+        return vendor
+
+    def __repr__(self):
+        return f'Vendor({self.id!r}, {self.name!r})'
+
+
+def load_vendors(path='vendors.json'):
+    return [Vendor.from_dict(vendor) for vendor in load_json(path)]
+
+
+def load_domains(path='technology_domains.json'):
+    return [Domain.from_dict(domain) for domain in load_json(path)]
+
+
+def iter_json_array_lines(dicts, indent=2, ensure_ascii=True):
+    """Yield the lines json.dump(list, indent=2) writes, one element at a time"""
+    first = True
+    for entry in dicts:
+        text = json.dumps(entry, indent=indent, ensure_ascii=ensure_ascii)
+        separator = '[\n' if first else ',\n'
+        first = False
+        yield separator + '\n'.join(' ' * indent + line for line in text.split('\n'))
+
+    yield '[]' if first else '\n]'
+
+
+def save_vendors(vendors, path='vendors.json', ensure_ascii=True):
+    """Write vendors without materializing every vendor dict at once"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(iter_json_array_lines((vendor.to_dict() for vendor in vendors), ensure_ascii=ensure_ascii))
@@ -1,12 +1,45 @@
+import argparse
 import csv
-import json
+
+from content_model import EMPTY_MAPPING, Dialog, Fact, Item, Vendor, save_vendors
+from xlsx_reader import XlsxWorkbook
+
+DEFAULT_RESPONSES = [
+    {"text": "Show me your inventory", "action": "show_items"},
+    {"text": "Tell me about your booth", "action": "booth_info"},
+    {"text": "Share some tech facts", "action": "tech_facts"},
+    {"text": "Thanks, I'll check other vendors", "action": "end"}
+]
+
+VENDOR_COLUMNS = ('ID', 'LOC', 'NAME', 'URL', 'TITLE', 'DESC')
+
+def is_blank_row(row):
+    # csv.DictReader files surplus cells as a list under the None key.
+    values = []
+    for value in row.values():
+        values.extend(value if isinstance(value, list) else [value])
+    return not any(str(value or '').strip() for value in values)
 
 # Read the TSV file with proper encoding
-vendors = []
-with open('vcf_vendors.txt', 'r', encoding='cp1252') as f:
-    reader = csv.DictReader(f, delimiter='\t')
-    for row in reader:
-        vendors.append(row)
+def read_tsv_rows(path):
+    with open(path, 'r', encoding='cp1252') as f:
+        for row in csv.DictReader(f, delimiter='\t'):
+            if not is_blank_row(row):
+                yield row
+
+# Stream rows straight out of the exhibitor spreadsheet, no export needed
+def read_xlsx_rows(path, sheet=None):
+    with XlsxWorkbook(path) as workbook:
+        sheet = sheet or workbook.find_sheet(VENDOR_COLUMNS)
+        for row in workbook.iter_dicts(sheet):
+            if not is_blank_row(row):
+                yield row
+
+def read_vendor_rows(path='ret.xlsx', sheet=None):
+    """Yield exhibitor rows from an .xlsx workbook or a tab-separated export"""
+    if path.lower().endswith('.xlsx'):
+        return read_xlsx_rows(path, sheet)
+    return read_tsv_rows(path)
 
 # Function to map booth to x,y (placeholder, assign sequential)
 def get_coords(booth, index):
@@ -15,59 +48,56 @@ def get_coords(booth, index):
     y = (index // 20) * 32
     return x, y
 
-# Convert to JSON format
-json_vendors = []
-for i, vendor in enumerate(vendors):
+def convert_vendor_row(vendor, i, placeholders=True):
+    """Convert one exhibitor row into a Vendor, optionally with placeholder items and facts"""
     x, y = get_coords(vendor['LOC'], i)
-    vendor_obj = {
-        "id": vendor['ID'],
-        "name": vendor['NAME'],
-        "booth": vendor['LOC'],
-        "url": vendor['URL'] if vendor['URL'] != 'None' else '',
-        "description": vendor['TITLE'],
-        "x": x,
-        "y": y,
-        "items": [
-            {
-                "id": f"item_{i}_1",
-                "name": f"Sample Item 1 from {vendor['NAME']}",
-                "description": "A sample item for demonstration",
-                "value": 50
-            },
-            {
-                "id": f"item_{i}_2",
-                "name": f"Sample Item 2 from {vendor['NAME']}",
-                "description": "Another sample item",
-                "value": 75
-            },
-            {
-                "id": f"item_{i}_3",
-                "name": f"Sample Item 3 from {vendor['NAME']}",
-                "description": "Third sample item",
-                "value": 100
-            }
-        ],
-        "dialog": {
-            "greeting": f"Welcome to {vendor['NAME']}! {vendor['TITLE']}",
-            "responses": [
-                {"text": "Show me your inventory", "action": "show_items"},
-                {"text": "Tell me about your booth", "action": "booth_info"},
-                {"text": "Share some tech facts", "action": "tech_facts"},
-                {"text": "Thanks, I'll check other vendors", "action": "end"}
-            ]
-        },
-        "facts": [
-            f"{vendor['NAME']} is a vendor at VCF Midwest.",
-            f"They are located at booth {vendor['LOC']}.",
-            f"Their focus is: {vendor['TITLE']}."
-        ],
-        "puzzle_items": [],
-        "puzzle_dialog": {}
-    }
-    json_vendors.append(vendor_obj)
-
-# Write to JSON file
-with open('vcf_vendors_converted.json', 'w', encoding='utf-8') as f:
-    json.dump(json_vendors, f, indent=2)
-
-print("Conversion complete!")
\ No newline at end of file
+    vendor_obj = Vendor(
+        vendor['ID'],
+        vendor['NAME'],
+        booth=vendor['LOC'],
+        url=vendor['URL'] if vendor['URL'] != 'None' else '',
+        description=vendor['TITLE'],
+        x=x,
+        y=y,
+        dialog=Dialog(f"Welcome to {vendor['NAME']}! {vendor['TITLE']}", DEFAULT_RESPONSES),
+        puzzle_items=(),
+        puzzle_dialog=EMPTY_MAPPING
+    )
+    if not placeholders:
+        # Later pipeline stages fill items and facts from shared templates.
+        return vendor_obj
+
+    # Sample items and facts are unique per vendor, so they are not interned.
+    vendor_obj.set_items([
+        Item(f"Sample Item 1 from {vendor['NAME']}", "A sample item for demonstration", 50),
+        Item(f"Sample Item 2 from {vendor['NAME']}", "Another sample item", 75),
+        Item(f"Sample Item 3 from {vendor['NAME']}", "Third sample item", 100)
+    ], f"item_{i}_")
+    vendor_obj.set_facts([
+        Fact(f"{vendor['NAME']} is a vendor at VCF Midwest."),
+        Fact(f"They are located at booth {vendor['LOC']}."),
+        Fact(f"Their focus is: {vendor['TITLE']}.")
+    ])
+    return vendor_obj
+
+def iter_vendor_rows(rows, placeholders=True):
+    for i, vendor in enumerate(rows):
+        yield convert_vendor_row(vendor, i, placeholders)
+
+def convert_vendor_rows(rows, placeholders=True):
+    return list(iter_vendor_rows(rows, placeholders))
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert the exhibitor list into vendor JSON.')
+    parser.add_argument('source', nargs='?', default='ret.xlsx', help='.xlsx workbook or tab-separated export')
+    parser.add_argument('--sheet', help='worksheet name (default: first sheet with the vendor columns)')
+    parser.add_argument('--output', default='vcf_vendors_converted.json')
+    args = parser.parse_args()
+
+    # Convert and write one vendor at a time
+    save_vendors(iter_vendor_rows(read_vendor_rows(args.source, args.sheet)), args.output)
+
+    print("Conversion complete!")
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+import { loadVendorSearchIndex } from './vendorSearchIndex.js';
+
+const vendorSearchInput = document.querySelector('#vendor-search');
 const vendorSelect = document.querySelector('#vendor-select');
 const descriptionInput = document.querySelector('#description-input');
 const featuredInput = document.querySelector('#featured-input');
@@ -7,9 +10,16 @@ const contentForm = document.querySelector('#content-form');
 const clearButton = document.querySelector('#clear-button');
 const statusElement = document.querySelector('#status');
 const contentList = document.querySelector('#content-list');
+const floorOverview = document.querySelector('#floor-overview');
+const floorOverviewImage = document.querySelector('#floor-overview-image');
+const floorOverviewMarker = document.querySelector('#floor-overview-marker');
+
+const MINIMAP_URL = '/assets/minimap/map';
 
 const state = {
     vendors: [],
+    searchIndex: null,
+    minimap: null,
     contentByVendorId: new Map()
 };
 
@@ -90,13 +100,35 @@ function applyContentSnapshot(snapshot) {
     state.contentByVendorId = contentByVendorId;
 }
 
+function getVisibleVendors() {
+    const query = vendorSearchInput.value.trim();
+    if (!query) {
+        return state.vendors;
+    }
+
+    if (state.searchIndex) {
+        const matchingIds = new Set(state.searchIndex.search(query).map(vendor => vendor.id));
+        return state.vendors.filter(vendor => matchingIds.has(vendor.id));
+    }
+
+    const normalizedQuery = query.toLowerCase();
+    return state.vendors.filter(vendor => getVendorLabel(vendor).toLowerCase().includes(normalizedQuery));
+}
+
 function renderVendorOptions() {
-    vendorSelect.replaceChildren(...state.vendors.map((vendor) => {
+    const selectedVendorId = getSelectedVendorId();
+    const visibleVendors = getVisibleVendors();
+
+    vendorSelect.replaceChildren(...visibleVendors.map((vendor) => {
         const option = document.createElement('option');
         option.value = vendor.id;
         option.textContent = getVendorLabel(vendor);
         return option;
     }));
+
+    if (visibleVendors.some(vendor => vendor.id === selectedVendorId)) {
+        vendorSelect.value = selectedVendorId;
+    }
 }
 
 function getSelectedContent() {
@@ -111,6 +143,18 @@ function renderSelectedContent() {
     clueInput.value = selectedContent.clueText;
 }
 
+function renderFloorOverviewMarker() {
+    const level = state.minimap?.levels?.[0];
+    const vendor = state.vendors.find(entry => entry.id === getSelectedVendorId());
+    const hasPosition = level && Number.isFinite(vendor?.x) && Number.isFinite(vendor?.y);
+
+    floorOverviewMarker.hidden = !hasPosition;
+    if (hasPosition) {
+        floorOverviewMarker.style.left = `${(vendor.x * level.scale / level.width) * 100}%`;
+        floorOverviewMarker.style.top = `${(vendor.y * level.scale / level.height) * 100}%`;
+    }
+}
+
 function hasPreviewContent(content) {
     return Boolean(
         content.descriptionOverride ||
@@ -177,6 +221,7 @@ function renderContentList() {
 
 function renderDashboard() {
     renderSelectedContent();
+    renderFloorOverviewMarker();
     renderContentList();
 }
 
@@ -195,20 +240,42 @@ async function fetchJson(url, options) {
     return response.json();
 }
 
+// The minimap is a build artifact (minimap_builder.py); the dashboard works without it.
+async function loadFloorOverview() {
+    try {
+        state.minimap = await fetchJson(`${MINIMAP_URL}/minimap.json`);
+    } catch {
+        return;
+    }
+
+    floorOverviewImage.src = `${MINIMAP_URL}/0/0_0.png`;
+    floorOverview.hidden = false;
+    renderFloorOverviewMarker();
+}
+
 async function loadDashboardData() {
-    const [vendorPayload, announcementPayload] = await Promise.all([
+    const [vendorPayload, announcementPayload, searchIndex] = await Promise.all([
         fetchJson('/api/vendors'),
-        fetchJson('/api/vendor-content')
+        fetchJson('/api/vendor-content'),
+        loadVendorSearchIndex({ url: '/vendor_search_index.json' })
     ]);
 
     state.vendors = vendorPayload.vendors ?? [];
+    state.searchIndex = searchIndex;
     applyContentSnapshot(announcementPayload);
     renderVendorOptions();
     renderDashboard();
 }
 
+vendorSearchInput.addEventListener('input', () => {
+    renderVendorOptions();
+    renderSelectedContent();
+    renderFloorOverviewMarker();
+});
+
 vendorSelect.addEventListener('change', () => {
     renderSelectedContent();
+    renderFloorOverviewMarker();
 });
 
 clearButton.addEventListener('click', () => {
@@ -247,3 +314,4 @@ contentForm.addEventListener('submit', async (event) => {
 loadDashboardData().catch((error) => {
     setStatus(error.message, true);
 });
+void loadFloorOverview();
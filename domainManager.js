@@ -3,6 +3,31 @@ import CONFIG from './config.js';
 class DomainManager {
     static domains = null;
     static loadingPromise = null;
+    static contentBundle = null;
+
+    // Domains then come from the boot content bundle instead of their own request.
+    static useContentBundle(contentBundle) {
+        DomainManager.contentBundle = contentBundle;
+    }
+
+    static async readDomains() {
+        const bundle = DomainManager.contentBundle;
+        if (bundle?.hasSection(CONFIG.CONTENT.DOMAINS)) {
+            // Yield first so the section is decoded after the scene's synchronous boot work.
+            await Promise.resolve();
+            return bundle.getSection(CONFIG.CONTENT.DOMAINS);
+        }
+
+        const response = await fetch(
+            `${CONFIG.CONTENT.DOMAINS}${CONFIG.PATHS.JSON_EXTENSION}`
+        );
+
+        if (!response.ok) {
+            throw new Error(`Failed to load domains: ${response.status}`);
+        }
+
+        return response.json();
+    }
 
     static async loadDomains() {
         if (DomainManager.domains) {
@@ -15,15 +40,7 @@ class DomainManager {
 
         DomainManager.loadingPromise = (async () => {
             try {
-                const response = await fetch(
-                    `${CONFIG.CONTENT.DOMAINS}${CONFIG.PATHS.JSON_EXTENSION}`
-                );
-
-                if (!response.ok) {
-                    throw new Error(`Failed to load domains: ${response.status}`);
-                }
-
-                DomainManager.domains = await response.json();
+                DomainManager.domains = await DomainManager.readDomains();
                 console.log(`Loaded ${DomainManager.domains.length} technology domains`);
                 return DomainManager.domains;
             } catch (error) {
@@ -0,0 +1,72 @@
+# Minimal HTTP/1.1 response reading over asyncio streams, shared by the
+# keep-alive clients in vendor_url_check.py and load_test.py. A response is
+# reusable when the server did not ask to close and its body was read to the
+# end, so the connection can carry the next request. Bodies longer than
+# max_body_bytes are left unread: response.body is None and the connection is
+# not reusable.
+
+
+class HttpResponse:
+    __slots__ = ('status', 'headers', 'body')
+
+    def __init__(self, status, headers, body=b''):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+
+async def read_headers(reader):
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            return headers
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+
+async def read_response(reader, method, max_body_bytes=None):
+    """Read a status line, headers, and body; return (response, reusable)"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError('Connection closed before a response was received')
+
+    try:
+        status = int(status_line.decode('latin-1').split(' ', 2)[1])
+    except (IndexError, ValueError):
+        raise ValueError(f'Malformed status line: {status_line!r}') from None
+    headers = await read_headers(reader)
+    response = HttpResponse(status, headers)
+    reusable = headers.get('connection', '').lower() != 'close'
+
+    if method == 'HEAD' or status in (204, 304) or status < 200:
+        return response, reusable
+
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        chunks = []
+        received = 0
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            if size == 0:
+                # Skip any trailers up to the blank line that ends the body.
+                await read_headers(reader)
+                response.body = b''.join(chunks)
+                return response, reusable
+            received += size
+            if max_body_bytes is not None and received > max_body_bytes:
+                response.body = None
+                return response, False
+            chunks.append((await reader.readexactly(size + 2))[:-2])
+
+    if 'content-length' in headers:
+        length = int(headers['content-length'])
+        if max_body_bytes is not None and length > max_body_bytes:
+            response.body = None
+            return response, False
+        response.body = await reader.readexactly(length)
+        return response, reusable
+
+    # Without framing the body runs until the server closes the connection.
+    response.body = None
+    return response, False
+
@@ -1,8 +1,6 @@
-import json
+import random
 
-# Load the vendors JSON
-with open('vendors.json', 'r', encoding='utf-8') as f:
-    vendors = json.load(f)
+from content_model import load_vendors, save_vendors, shared_items
 
 # Define specific items for vendors based on their domain
 vendor_specific_items = {
@@ -79,7 +77,7 @@ vendor_specific_items = {
     ]
 }
 
-def get_specific_items_for_vendor(name, description):
+def get_specific_items_for_vendor(name, description, rng=random):
     text = (name + ' ' + description).lower()
     items = []
 
@@ -106,25 +104,25 @@ def get_specific_items_for_vendor(name, description):
         items = vendor_specific_items['default']
 
     # Return 3-5 random items from the category
-    import random
-    num_items = random.randint(3, 5)
-    selected_items = random.sample(items, min(num_items, len(items)))
+    num_items = rng.randint(3, 5)
+    selected_items = rng.sample(items, min(num_items, len(items)))
     return selected_items
 
-# Update each vendor's items
-for i, vendor in enumerate(vendors):
-    vendor['items'] = []
-    items = get_specific_items_for_vendor(vendor['name'], vendor['description'])
-    for j, item in enumerate(items):
-        vendor['items'].append({
-            'id': f'item_{i}_{j+1}',
-            'name': item['name'],
-            'description': item['description'],
-            'value': item['value']
-        })
+def improve_vendor_items(vendors):
+    """Give each vendor 3-5 shared items specific to its category"""
+    for i, vendor in enumerate(vendors):
+        items = get_specific_items_for_vendor(vendor.name, vendor.description)
+        vendor.set_items(shared_items(items), f'item_{i}_')
+    return vendors
 
-# Save the updated JSON
-with open('vendors.json', 'w', encoding='utf-8') as f:
-    json.dump(vendors, f, indent=2)
+def main():
+    vendors = load_vendors('vendors.json')
+    improve_vendor_items(vendors)
 
-print("Vendor inventories updated with specific items!")
\ No newline at end of file
+    # Save the updated JSON
+    save_vendors(vendors, 'vendors.json')
+
+    print("Vendor inventories updated with specific items!")
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,10 @@
-import json
 import random
 
+from content_model import load_vendors, save_vendors, shared_items
+
 def improve_vendor_inventories():
     # Load the vendors data
-    with open('vendors.json', 'r') as f:
-        vendors = json.load(f)
+    vendors = load_vendors('vendors.json')
 
     # Define more comprehensive item categories with specific items
     item_categories = {
@@ -201,13 +201,13 @@ def improve_vendor_inventories():
 
     # Update vendor inventories
     for vendor in vendors:
-        if vendor.get('items') and len(vendor['items']) > 0:
+        if vendor.items:
             # Check if vendor still has generic items
-            has_generic = any(item['name'] in ['Vintage Electronics', 'Tech Gadgets', 'Computer Parts', 'Retro Accessories', 'Obsolete Technology']
-                            for item in vendor['items'])
+            has_generic = any(item.name in ['Vintage Electronics', 'Tech Gadgets', 'Computer Parts', 'Retro Accessories', 'Obsolete Technology']
+                            for item in vendor.items)
 
             if has_generic:
-                category = get_vendor_category(vendor['name'], vendor['description'])
+                category = get_vendor_category(vendor.name, vendor.description)
                 category_items = item_categories[category]
 
                 # Select 3-5 random items from the category
@@ -215,18 +215,10 @@ def improve_vendor_inventories():
                 selected_items = random.sample(category_items, num_items)
 
                 # Update the vendor's items
-                vendor['items'] = []
-                for i, item in enumerate(selected_items, 1):
-                    vendor['items'].append({
-                        "id": f"item_{vendor['id']}_{i}",
-                        "name": item["name"],
-                        "description": item["description"],
-                        "value": item["value"]
-                    })
+                vendor.set_items(shared_items(selected_items), f"item_{vendor.id}_")
 
     # Save the updated vendors data
-    with open('vendors.json', 'w') as f:
-        json.dump(vendors, f, indent=2)
+    save_vendors(vendors, 'vendors.json')
 
     print("Vendor inventories updated with specific items for all vendors!")
 
@@ -1,4 +1,5 @@
 const DEFAULT_MODERATION_STATUS = 'approved';
+const DEFAULT_CHANGE_LOG_LIMIT = 500;
 const MODERATION_STATUSES = new Set([
     DEFAULT_MODERATION_STATUS,
     'draft',
@@ -312,14 +313,103 @@ export function normalizeVendorContentSnapshot(snapshot) {
 }
 
 export class VendorContentStore {
-    constructor(initialSnapshot = null) {
+    constructor(initialSnapshot = null, { changeLogLimit = DEFAULT_CHANGE_LOG_LIMIT } = {}) {
         this.contentByVendorId = new Map();
+        // Bumped on every effective change so readers can cache serialized snapshots.
+        this.revision = 0;
+        this.listeners = new Set();
+        this.batchChangedIds = null;
+        // Recent changes, oldest first, so clients can catch up with a delta.
+        this.changeLog = [];
+        this.changeLogLimit = changeLogLimit;
 
         if (initialSnapshot) {
             this.replaceSnapshot(initialSnapshot);
         }
     }
 
+    // Listeners receive { revision, updates } where each update carries the
+    // vendor's full content after the change, so replaying it is idempotent.
+    subscribe(listener) {
+        this.listeners.add(listener);
+        return () => this.listeners.delete(listener);
+    }
+
+    markChanged(vendorId) {
+        if (this.batchChangedIds) {
+            this.batchChangedIds.add(vendorId);
+            return;
+        }
+
+        this.revision += 1;
+        this.emitChange([vendorId]);
+    }
+
+    emitChange(vendorIds) {
+        const change = {
+            revision: this.revision,
+            updates: vendorIds.map(vendorId => ({ vendorId, ...this.getContentForVendor(vendorId) }))
+        };
+
+        this.changeLog.push(change);
+        if (this.changeLog.length > this.changeLogLimit) {
+            this.changeLog.splice(0, this.changeLog.length - this.changeLogLimit);
+        }
+
+        this.listeners.forEach(listener => listener(change));
+    }
+
+    // Adopts a revision restored from storage. Older revisions can no longer
+    // be answered with a delta, so the change log starts over.
+    resetRevision(revision) {
+        this.revision = revision;
+        this.changeLog = [];
+    }
+
+    // Returns the latest content of every vendor changed after sinceRevision.
+    // When the change log no longer reaches back that far, the result is a
+    // full snapshot flagged with reset so the caller replaces its state.
+    getChangesSince(sinceRevision) {
+        const since = Number.isInteger(sinceRevision) ? sinceRevision : -1;
+        const oldestRevision = this.changeLog[0]?.revision ?? this.revision + 1;
+        if (since < 0 || since > this.revision || since < oldestRevision - 1) {
+            return { revision: this.revision, reset: true, updates: this.toJSON().vendors };
+        }
+
+        const updatesByVendorId = new Map();
+        for (const change of this.changeLog) {
+            if (change.revision > since) {
+                change.updates.forEach(update => updatesByVendorId.set(update.vendorId, update));
+            }
+        }
+
+        return {
+            revision: this.revision,
+            reset: false,
+            updates: Array.from(updatesByVendorId.values(), update => ({ ...update }))
+        };
+    }
+
+    // Runs callback with change tracking deferred so everything it touches
+    // lands in a single revision and a single change event.
+    batch(callback, revision = null) {
+        if (this.batchChangedIds) {
+            return callback();
+        }
+
+        this.batchChangedIds = new Set();
+        try {
+            return callback();
+        } finally {
+            const changedIds = [...this.batchChangedIds];
+            this.batchChangedIds = null;
+            if (changedIds.length > 0) {
+                this.revision = Math.max(revision ?? 0, this.revision + 1);
+                this.emitChange(changedIds);
+            }
+        }
+    }
+
     getContentForVendor(vendorId) {
         const normalizedVendorId = normalizeVendorId(vendorId);
         const content = this.contentByVendorId.get(normalizedVendorId) ?? createDefaultVendorContent();
@@ -346,12 +436,17 @@ export class VendorContentStore {
         }
 
         const storedContent = cloneVendorContent(normalizedContent);
+        const previousContent = this.contentByVendorId.get(normalizedVendorId);
         if (hasVendorContent(storedContent)) {
             this.contentByVendorId.set(normalizedVendorId, storedContent);
         } else {
             this.contentByVendorId.delete(normalizedVendorId);
         }
 
+        if (JSON.stringify(previousContent) !== JSON.stringify(this.contentByVendorId.get(normalizedVendorId))) {
+            this.markChanged(normalizedVendorId);
+        }
+
         return {
             vendorId: normalizedVendorId,
             ...cloneVendorContent(storedContent)
@@ -379,6 +474,36 @@ export class VendorContentStore {
         return this.setContent(normalizedUpdate.vendorId, normalizedUpdate);
     }
 
+    // Applies many vendor updates as one store revision. Invalid entries are
+    // reported by index instead of failing the whole batch.
+    applyUpdates(updates) {
+        const updated = [];
+        const rejected = [];
+
+        this.batch(() => {
+            (Array.isArray(updates) ? updates : []).forEach((update, index) => {
+                const result = this.applyUpdate(update);
+                if (result) {
+                    updated.push(result);
+                } else {
+                    rejected.push(index);
+                }
+            });
+        });
+
+        return { updated, rejected };
+    }
+
+    // Replays a change emitted by subscribe(), e.g. from a journal, and adopts its revision.
+    applyChange(change) {
+        this.batch(() => {
+            for (const update of change?.updates ?? []) {
+                this.setContent(update.vendorId, update);
+            }
+        }, change?.revision ?? null);
+        this.revision = Math.max(this.revision, change?.revision ?? 0);
+    }
+
     applyAnnouncementUpdate(update) {
         const normalizedUpdate = normalizeVendorAnnouncementEntry(update);
         if (!normalizedUpdate) {
@@ -389,11 +514,25 @@ export class VendorContentStore {
     }
 
     replaceSnapshot(snapshot) {
-        this.contentByVendorId.clear();
-
-        for (const entry of normalizeVendorContentSnapshot(snapshot)) {
-            this.setContent(entry.vendorId, entry);
-        }
+        const previousContentByVendorId = new Map(this.contentByVendorId);
+
+        this.batch(() => {
+            this.contentByVendorId.clear();
+
+            for (const entry of normalizeVendorContentSnapshot(snapshot)) {
+                this.setContent(entry.vendorId, entry);
+            }
+
+            // Only vendors whose content differs from before the replace count as changed.
+            const vendorIds = new Set([...previousContentByVendorId.keys(), ...this.contentByVendorId.keys()]);
+            for (const vendorId of vendorIds) {
+                if (JSON.stringify(previousContentByVendorId.get(vendorId)) === JSON.stringify(this.contentByVendorId.get(vendorId))) {
+                    this.batchChangedIds.delete(vendorId);
+                } else {
+                    this.batchChangedIds.add(vendorId);
+                }
+            }
+        });
 
         return this.toJSON();
     }
@@ -2,6 +2,7 @@ import { VendorContentStore } from './liveVendorAnnouncementStore.js';
 
 export const DEFAULT_VENDOR_CONTENT_ENDPOINT = '/api/vendor-content';
 export const DEFAULT_VENDOR_ANNOUNCEMENTS_ENDPOINT = DEFAULT_VENDOR_CONTENT_ENDPOINT;
+export const DEFAULT_VENDOR_CONTENT_CHANGES_ENDPOINT = '/api/vendor-content/changes';
 
 function getDefaultFetch() {
     if (typeof window !== 'undefined' && typeof window.fetch === 'function') {
@@ -23,6 +24,12 @@ function getDefaultClearInterval() {
         : null;
 }
 
+function getDefaultEventSourceFactory() {
+    return typeof window !== 'undefined' && typeof window.EventSource === 'function'
+        ? url => new window.EventSource(url)
+        : null;
+}
+
 function hasLiveBackendFlag() {
     return typeof window !== 'undefined' && window.__tileTestLiveBackend === true;
 }
@@ -33,9 +40,14 @@ export class LiveVendorContentService {
         fetchImpl = getDefaultFetch(),
         setIntervalImpl = getDefaultSetInterval(),
         clearIntervalImpl = getDefaultClearInterval(),
-        pollIntervalMs = 3000
+        pollIntervalMs = 3000,
+        changesEndpoint = DEFAULT_VENDOR_CONTENT_CHANGES_ENDPOINT,
+        eventSourceFactory = getDefaultEventSourceFactory(),
+        maxStreamErrors = 3
     } = {}) {
         this.endpoint = endpoint;
+        this.changesEndpoint = changesEndpoint;
+        this.eventSourceFactory = eventSourceFactory;
         this.fetchImpl = fetchImpl;
         this.setIntervalImpl = setIntervalImpl;
         this.clearIntervalImpl = clearIntervalImpl;
@@ -44,6 +56,11 @@ export class LiveVendorContentService {
         this.intervalId = null;
         this.started = false;
         this.isAvailable = false;
+        this.etag = null;
+        this.revision = null;
+        this.eventSource = null;
+        this.maxStreamErrors = maxStreamErrors;
+        this.streamErrorCount = 0;
     }
 
     getAnnouncementsForVendor(vendorId) {
@@ -55,9 +72,65 @@ export class LiveVendorContentService {
     }
 
     applySnapshot(snapshot) {
+        this.revision = Number.isInteger(snapshot?.revision) ? snapshot.revision : null;
         return this.store.replaceSnapshot(snapshot);
     }
 
+    // Applies a /changes delta: the latest content of each changed vendor, or
+    // a full replacement when the server could not answer from its change log.
+    applyChanges(delta) {
+        if (delta.reset) {
+            this.store.replaceSnapshot({ vendors: delta.updates });
+        } else {
+            this.store.applyChange(delta);
+        }
+
+        this.revision = delta.revision;
+    }
+
+    // Subscribes to pushed changes so idle periods cost no requests. Returns
+    // false when EventSource or a snapshot revision is unavailable.
+    startStreaming() {
+        if (this.eventSource || !this.eventSourceFactory || this.revision === null) {
+            return Boolean(this.eventSource);
+        }
+
+        this.streamErrorCount = 0;
+        this.eventSource = this.eventSourceFactory(`${this.changesEndpoint}?since=${this.revision}`);
+        this.eventSource.addEventListener('open', () => {
+            this.streamErrorCount = 0;
+        });
+        this.eventSource.addEventListener('change', (event) => {
+            this.streamErrorCount = 0;
+            try {
+                this.applyChanges(JSON.parse(event.data));
+                this.isAvailable = true;
+            } catch {
+                // Ignore malformed frames; the next change or reconnect catches up.
+            }
+        });
+        this.eventSource.addEventListener('error', () => {
+            this.handleStreamError();
+        });
+
+        return true;
+    }
+
+    // EventSource reconnects on its own after a dropped connection, but a proxy
+    // that never lets the stream through would have it retrying forever. After
+    // maxStreamErrors failures in a row without an open, fall back to polling.
+    handleStreamError() {
+        this.streamErrorCount += 1;
+        if (this.streamErrorCount < this.maxStreamErrors || !this.eventSource) {
+            return;
+        }
+
+        this.eventSource.close();
+        this.eventSource = null;
+        void this.refresh();
+        this.startPolling();
+    }
+
     async refresh() {
         if (!this.fetchImpl) {
             this.isAvailable = false;
@@ -65,17 +138,29 @@ export class LiveVendorContentService {
         }
 
         try {
+            const headers = { Accept: 'application/json' };
+            if (this.etag) {
+                headers['If-None-Match'] = this.etag;
+            }
+
             const response = await this.fetchImpl(this.endpoint, {
-                headers: { Accept: 'application/json' },
+                headers,
                 cache: 'no-store'
             });
 
+            // Unchanged content costs the server an ETag comparison and us nothing.
+            if (response.status === 304) {
+                this.isAvailable = true;
+                return true;
+            }
+
             if (!response.ok) {
                 this.isAvailable = false;
                 return false;
             }
 
             this.applySnapshot(await response.json());
+            this.etag = response.headers?.get?.('ETag') ?? null;
             this.isAvailable = true;
             return true;
         } catch {
@@ -101,7 +186,7 @@ export class LiveVendorContentService {
 
         this.started = true;
         return this.refresh().then((isAvailable) => {
-            if (isAvailable) {
+            if (isAvailable && !this.startStreaming()) {
                 this.startPolling();
             }
 
@@ -114,6 +199,8 @@ export class LiveVendorContentService {
             this.clearIntervalImpl(this.intervalId);
         }
 
+        this.eventSource?.close();
+        this.eventSource = null;
         this.intervalId = null;
         this.started = false;
     }
@@ -0,0 +1,337 @@
+import argparse
+import asyncio
+import ipaddress
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import urlsplit
+
+from http_response import read_response
+
+# Simulates a hall of attendee phones plus a few exhibitors against a local
+# server.js and reports per-endpoint throughput, latency percentiles, and
+# error rates as JSON.
+#
+# Each simulated player owns one keep-alive connection, like a browser tab:
+# it loads the static assets and /api/vendors once, then syncs live content
+# either by polling /api/vendor-content with If-None-Match (--sync poll) or
+# by long-polling /api/vendor-content/changes (--sync long-poll). Writers post
+# vendor content updates on their own connections at --write-interval.
+
+DEFAULT_URL = 'http://127.0.0.1:5000'
+DEFAULT_ASSETS = ('/', '/assets/map.json')
+LONG_POLL_WAIT_MS = 25000
+USER_AGENT = 'TileTest-LoadTest/1.0'
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[min(len(sorted_values), max(1, rank)) - 1]
+
+
+class EndpointStats:
+    __slots__ = ('latencies', 'statuses', 'errors', 'bytes')
+
+    def __init__(self):
+        self.latencies = []
+        self.statuses = {}
+        self.errors = 0
+        self.bytes = 0
+
+    def record(self, latency, status=None, body_bytes=0, error=False):
+        self.latencies.append(latency)
+        if status is not None:
+            self.statuses[str(status)] = self.statuses.get(str(status), 0) + 1
+        self.errors += int(error or status is None or status >= 400)
+        self.bytes += body_bytes
+
+    def to_json(self, duration):
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+
+        def ms(value):
+            return None if value is None else round(value * 1000, 3)
+
+        return {
+            'requests': count,
+            'throughputPerSecond': round(count / duration, 2) if duration else None,
+            'errorRate': round(self.errors / count, 4) if count else 0.0,
+            'errors': self.errors,
+            'statuses': dict(sorted(self.statuses.items())),
+            'bytes': self.bytes,
+            'latencyMs': {
+                'mean': ms(sum(latencies) / count) if count else None,
+                'p50': ms(percentile(latencies, 0.50)),
+                'p95': ms(percentile(latencies, 0.95)),
+                'p99': ms(percentile(latencies, 0.99)),
+                'max': ms(latencies[-1]) if count else None
+            }
+        }
+
+
+class LoadStats:
+    def __init__(self):
+        self.endpoints = {}
+        self.connections_opened = 0
+
+    def endpoint(self, name):
+        if name not in self.endpoints:
+            self.endpoints[name] = EndpointStats()
+        return self.endpoints[name]
+
+
+class ClientConnection:
+    """One keep-alive HTTP/1.1 connection that reconnects after errors"""
+
+    def __init__(self, host, port, stats, timeout=30.0):
+        self.host = host
+        self.port = port
+        self.stats = stats
+        self.timeout = timeout
+        self.reader = None
+        self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+        self.stats.connections_opened += 1
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def request(self, method, target, headers=None, body=None, name=None, timeout=None):
+        """Send a request, record it under name, and return (status, headers, body) or None on error"""
+        endpoint = self.stats.endpoint(name or f"{method} {target.split('?')[0]}")
+        started = time.perf_counter()
+        try:
+            if self.writer is None or self.writer.is_closing():
+                await self.connect()
+
+            lines = [
+                f'{method} {target} HTTP/1.1',
+                f'Host: {self.host}:{self.port}',
+                f'User-Agent: {USER_AGENT}',
+                'Connection: keep-alive'
+            ]
+            lines.extend(f'{header}: {value}' for header, value in (headers or {}).items())
+            if body is not None:
+                lines.append(f'Content-Length: {len(body)}')
+            self.writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + (body or b''))
+            await self.writer.drain()
+
+            response, reusable = await asyncio.wait_for(read_response(self.reader, method), timeout or self.timeout)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+            self.close()
+            endpoint.record(time.perf_counter() - started, error=True)
+            return None
+
+        body = response.body or b''
+        endpoint.record(time.perf_counter() - started, response.status, len(body))
+        if not reusable:
+            self.close()
+        return response.status, response.headers, body
+
+
+def parse_json(body, default=None):
+    try:
+        return json.loads(body)
+    except ValueError:
+        return default
+
+
+async def run_player(connection, config, deadline, vendor_ids):
+    for asset in config['assets']:
+        await connection.request('GET', asset, name=f'GET {asset} (static)')
+
+    result = await connection.request('GET', '/api/vendors', {'Accept': 'application/json'})
+    if result and result[0] == 200 and not vendor_ids:
+        vendor_ids.extend(str(vendor['id']) for vendor in parse_json(result[2], {}).get('vendors', []))
+
+    etag = None
+    revision = None
+    while time.monotonic() < deadline:
+        if config['sync'] == 'long-poll' and revision is not None:
+            wait_ms = int(min(LONG_POLL_WAIT_MS, max(0.0, deadline - time.monotonic()) * 1000))
+            result = await connection.request(
+                'GET', f'/api/vendor-content/changes?since={revision}&wait={wait_ms}',
+                {'Accept': 'application/json'}, timeout=wait_ms / 1000 + config['timeout']
+            )
+            if result and result[0] == 200:
+                revision = parse_json(result[2], {}).get('revision', revision)
+                continue
+        else:
+            headers = {'Accept': 'application/json'}
+            if etag:
+                headers['If-None-Match'] = etag
+            result = await connection.request('GET', '/api/vendor-content', headers)
+            if result and result[0] == 200:
+                etag = result[1].get('etag')
+                revision = parse_json(result[2], {}).get('revision')
+            if config['sync'] == 'long-poll' and revision is not None:
+                continue
+
+        await asyncio.sleep(config['poll_interval'] * random.uniform(0.8, 1.2))
+
+
+async def run_writer(connection, config, deadline, vendor_ids, writer_index):
+    sequence = 0
+    while time.monotonic() < deadline:
+        await asyncio.sleep(config['write_interval'] * random.uniform(0.8, 1.2))
+        sequence += 1
+        vendor_id = random.choice(vendor_ids) if vendor_ids else str(writer_index + 1)
+        body = json.dumps({
+            'vendorId': vendor_id,
+            'announcements': [f'Load test update {writer_index}-{sequence}']
+        }).encode('utf-8')
+        await connection.request('POST', '/api/vendor-content', {'Content-Type': 'application/json'}, body)
+
+
+async def run_load(base_url, clients=100, writers=2, duration=30.0, poll_interval=3.0, write_interval=1.0,
+                   sync='poll', assets=DEFAULT_ASSETS, ramp_up=2.0, timeout=30.0):
+    """Run players and writers against base_url for duration seconds and return the JSON report"""
+    parts = urlsplit(base_url)
+    host, port = parts.hostname, parts.port or 80
+    config = {
+        'sync': sync,
+        'poll_interval': poll_interval,
+        'write_interval': write_interval,
+        'assets': list(assets),
+        'timeout': timeout
+    }
+    stats = LoadStats()
+    vendor_ids = []
+    started = time.monotonic()
+    deadline = started + duration
+
+    async def start_player(index):
+        # Spread connection setup over the ramp-up window instead of one thundering herd.
+        await asyncio.sleep(ramp_up * index / max(1, clients))
+        connection = ClientConnection(host, port, stats, timeout)
+        try:
+            await run_player(connection, config, deadline, vendor_ids)
+        finally:
+            connection.close()
+
+    async def start_writer(index):
+        connection = ClientConnection(host, port, stats, timeout)
+        try:
+            await run_writer(connection, config, deadline, vendor_ids, index)
+        finally:
+            connection.close()
+
+    await asyncio.gather(
+        *(start_player(index) for index in range(clients)),
+        *(start_writer(index) for index in range(writers))
+    )
+    elapsed = time.monotonic() - started
+
+    endpoints = {name: endpoint.to_json(elapsed) for name, endpoint in sorted(stats.endpoints.items())}
+    total_requests = sum(endpoint['requests'] for endpoint in endpoints.values())
+    total_errors = sum(endpoint['errors'] for endpoint in endpoints.values())
+    return {
+        'config': {
+            'url': base_url, 'clients': clients, 'writers': writers, 'durationSeconds': duration,
+            'pollIntervalSeconds': poll_interval, 'writeIntervalSeconds': write_interval, 'sync': sync
+        },
+        'elapsedSeconds': round(elapsed, 3),
+        'connectionsOpened': stats.connections_opened,
+        'totals': {
+            'requests': total_requests,
+            'throughputPerSecond': round(total_requests / elapsed, 2) if elapsed else None,
+            'errorRate': round(total_errors / total_requests, 4) if total_requests else 0.0
+        },
+        'endpoints': endpoints
+    }
+
+
+def is_local_host(host):
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def start_local_server(port, data_dir):
+    """Start server.js on port with its content journal in data_dir; return the process"""
+    process = subprocess.Popen(
+        ['node', 'server.js'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env={**os.environ, 'HOST': '127.0.0.1', 'PORT': str(port), 'VENDOR_CONTENT_DATA_DIR': data_dir},
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True
+    )
+    for line in process.stdout:
+        if 'listening' in line:
+            # Keep draining the server's output so it never blocks on a full pipe.
+            threading.Thread(target=process.stdout.read, daemon=True).start()
+            return process
+    raise RuntimeError('server.js exited before it started listening.')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test a local server.js with simulated players.')
+    parser.add_argument('--url', default=DEFAULT_URL)
+    parser.add_argument('--start-server', action='store_true', help='start server.js on the --url port for the run')
+    parser.add_argument('--clients', type=int, default=500)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds')
+    parser.add_argument('--poll-interval', type=float, default=3.0, help='seconds between player polls')
+    parser.add_argument('--write-interval', type=float, default=1.0, help='seconds between writes per writer')
+    parser.add_argument('--sync', choices=('poll', 'long-poll'), default='poll')
+    parser.add_argument('--asset', action='append', dest='assets', help='static path each player loads (repeatable)')
+    parser.add_argument('--ramp-up', type=float, default=2.0, help='seconds over which players connect')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    args = parser.parse_args()
+
+    host = urlsplit(args.url).hostname
+    if not is_local_host(host):
+        parser.error(f'{host} is not a local address; the load test only runs against a local server.')
+
+    # The throwaway content journal is removed once the server has stopped.
+    data_dir = tempfile.TemporaryDirectory(prefix='tiletest-load-') if args.start_server else None
+    process = None
+    try:
+        if data_dir:
+            process = start_local_server(urlsplit(args.url).port or 80, data_dir.name)
+        report = asyncio.run(run_load(
+            args.url,
+            clients=args.clients,
+            writers=args.writers,
+            duration=args.duration,
+            poll_interval=args.poll_interval,
+            write_interval=args.write_interval,
+            sync=args.sync,
+            assets=args.assets or DEFAULT_ASSETS,
+            ramp_up=args.ramp_up
+        ))
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+        if data_dir:
+            data_dir.cleanup()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote load test report for {report['totals']['requests']} requests to {args.output}.")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ import MapManager from './mapManager.js';
 import PlayerManager from './playerManager.js';
 import NPCManager from './npcManager.js';
 import CollisionManager from './collisionManager.js';
+import { preloadContentBundle } from './contentBundle.js';
 import { initializeSceneBootstrap } from './sceneBootstrap.js';
 import { createTestModeApi } from './testModeApi.js';
 
@@ -41,11 +42,27 @@ function preload() {
     MapManager.preload(this);
     PlayerManager.preload?.(this);
     NPCManager.preload?.(this);
-    this.load.json(
+    if (CONFIG.CONTENT_BUNDLE.ENABLED) {
+        // Vendors, trails, and domains arrive together in one request; the
+        // separate files only load if the bundle turns out to be unusable.
+        preloadContentBundle(this, {
+            key: CONFIG.CONTENT_BUNDLE.KEY,
+            url: `${CONFIG.PATHS.ASSETS}/${CONFIG.CONTENT_BUNDLE.KEY}${CONFIG.PATHS.JSON_EXTENSION}`,
+            bootSections: [CONFIG.CONTENT.VENDORS, CONFIG.CONTENT.DISCOVERY_TRAILS],
+            loadFallback: () => preloadContentFiles(this)
+        });
+        return;
+    }
+
+    preloadContentFiles(this);
+}
+
+function preloadContentFiles(phaserScene) {
+    phaserScene.load.json(
         CONFIG.CONTENT.VENDORS,
         `${CONFIG.CONTENT.VENDORS}${CONFIG.PATHS.JSON_EXTENSION}`
     );
-    this.load.json(
+    phaserScene.load.json(
         CONFIG.CONTENT.DISCOVERY_TRAILS,
         `${CONFIG.CONTENT.DISCOVERY_TRAILS}${CONFIG.PATHS.JSON_EXTENSION}`
     );
@@ -0,0 +1,193 @@
+const TILE_FLIP_FLAGS_MASK = 0x1fffffff;
+const TILE_FLIPPED_HORIZONTALLY = 0x80000000;
+const TILE_FLIPPED_VERTICALLY = 0x40000000;
+const TILE_FLIPPED_DIAGONALLY = 0x20000000;
+
+export function getChunkKey(column, row) {
+    return `${column}_${row}`;
+}
+
+export function getChunkPixelSize(manifest) {
+    return {
+        width: manifest.chunkSize * manifest.map.tilewidth,
+        height: manifest.chunkSize * manifest.map.tileheight
+    };
+}
+
+export function getChunkKeysForView(manifest, view, radius = 1) {
+    const chunkSize = getChunkPixelSize(manifest);
+    const firstColumn = Math.max(0, Math.floor(view.x / chunkSize.width) - radius);
+    const firstRow = Math.max(0, Math.floor(view.y / chunkSize.height) - radius);
+    const lastColumn = Math.min(
+        manifest.columns - 1,
+        Math.floor((view.x + Math.max(view.width - 1, 0)) / chunkSize.width) + radius
+    );
+    const lastRow = Math.min(
+        manifest.rows - 1,
+        Math.floor((view.y + Math.max(view.height - 1, 0)) / chunkSize.height) + radius
+    );
+
+    const keys = [];
+    for (let row = firstRow; row <= lastRow; row += 1) {
+        for (let column = firstColumn; column <= lastColumn; column += 1) {
+            keys.push(getChunkKey(column, row));
+        }
+    }
+
+    return keys;
+}
+
+// Returns the tileset a Tiled global id belongs to: the one with the highest
+// firstgid that is not above it, as Phaser's Tiled parser resolves them.
+export function findTilesetForGid(tilesets, globalTileId) {
+    const tileId = globalTileId & TILE_FLIP_FLAGS_MASK;
+    let match = null;
+    for (const tileset of tilesets) {
+        if (tileset.firstgid <= tileId && (!match || tileset.firstgid > match.firstgid)) {
+            match = tileset;
+        }
+    }
+
+    return tileId > 0 ? match : null;
+}
+
+// Returns the tilesets one chunk layer draws from, in firstgid order.
+export function getChunkTilesets(tilesets, tiles) {
+    const used = new Set();
+    tiles.forEach(globalTileId => {
+        const tileset = findTilesetForGid(tilesets, globalTileId);
+        if (tileset) {
+            used.add(tileset);
+        }
+    });
+
+    return [...used].sort((left, right) => left.firstgid - right.firstgid);
+}
+
+// Converts one chunk layer's Tiled global ids into the 2D index rows Phaser's
+// data-array tilemaps expect, where -1 marks an empty cell. Indexes stay
+// global; each tileset is added to the chunk map at its own firstgid.
+export function toChunkTileRows(tiles, width) {
+    const rows = [];
+    for (let start = 0; start < tiles.length; start += width) {
+        rows.push(tiles.slice(start, start + width).map(globalTileId => {
+            const tileId = globalTileId & TILE_FLIP_FLAGS_MASK;
+            return tileId > 0 ? tileId : -1;
+        }));
+    }
+
+    return rows;
+}
+
+// Data-array tilemaps take bare tile indexes, so the Tiled flip bits are
+// turned into the rotation and flipX that Phaser's Tiled parser would set.
+export function getTileFlip(globalTileId) {
+    const horizontal = (globalTileId & TILE_FLIPPED_HORIZONTALLY) !== 0;
+    const vertical = (globalTileId & TILE_FLIPPED_VERTICALLY) !== 0;
+    const diagonal = (globalTileId & TILE_FLIPPED_DIAGONALLY) !== 0;
+
+    if (diagonal) {
+        if (horizontal && vertical) return { rotation: Math.PI / 2, flipX: true };
+        if (horizontal) return { rotation: Math.PI / 2, flipX: false };
+        if (vertical) return { rotation: 3 * Math.PI / 2, flipX: false };
+        return { rotation: 3 * Math.PI / 2, flipX: true };
+    }
+
+    if (horizontal && vertical) return { rotation: Math.PI, flipX: false };
+    if (horizontal) return { rotation: 0, flipX: true };
+    if (vertical) return { rotation: Math.PI, flipX: true };
+    return null;
+}
+
+// Returns [{ x, y, rotation, flipX }] for every flipped or rotated tile in a chunk layer.
+export function getChunkTileFlips(tiles, width) {
+    const flips = [];
+    tiles.forEach((globalTileId, index) => {
+        const flip = getTileFlip(globalTileId);
+        if (flip) {
+            flips.push({ x: index % width, y: Math.floor(index / width), ...flip });
+        }
+    });
+
+    return flips;
+}
+
+export class MapChunkStreamer {
+    constructor({
+        manifest,
+        loadChunk,
+        createChunk,
+        destroyChunk,
+        loadRadius = 1,
+        keepRadius = loadRadius + 1
+    }) {
+        this.manifest = manifest;
+        this.loadChunk = loadChunk;
+        this.createChunk = createChunk;
+        this.destroyChunk = destroyChunk;
+        this.loadRadius = loadRadius;
+        this.keepRadius = keepRadius;
+        this.entriesByKey = new Map(manifest.chunks.map(entry => [entry.key, entry]));
+        this.loading = new Map();
+        this.loaded = new Map();
+    }
+
+    update(view) {
+        const wantedKeys = getChunkKeysForView(this.manifest, view, this.loadRadius)
+            .filter(key => this.entriesByKey.has(key));
+
+        // Keep a wider ring than we load so chunks at the edge do not thrash.
+        const keptKeys = new Set(getChunkKeysForView(this.manifest, view, this.keepRadius));
+        for (const key of [...this.loaded.keys(), ...this.loading.keys()]) {
+            if (!keptKeys.has(key)) {
+                this.unload(key);
+            }
+        }
+
+        wantedKeys.forEach(key => this.load(key));
+
+        return wantedKeys;
+    }
+
+    load(key) {
+        if (this.loaded.has(key) || this.loading.has(key)) {
+            return this.loading.get(key) ?? Promise.resolve(this.loaded.get(key));
+        }
+
+        const entry = this.entriesByKey.get(key);
+        const pending = Promise.resolve(this.loadChunk(entry))
+            .then(chunk => {
+                if (this.loading.get(key) !== pending) {
+                    return null;
+                }
+
+                this.loading.delete(key);
+                const handle = this.createChunk(chunk, entry);
+                this.loaded.set(key, handle);
+                return handle;
+            })
+            .catch(error => {
+                if (this.loading.get(key) === pending) {
+                    this.loading.delete(key);
+                }
+                console.error(`Map chunk "${key}" failed to load:`, error);
+                return null;
+            });
+
+        this.loading.set(key, pending);
+        return pending;
+    }
+
+    unload(key) {
+        this.loading.delete(key);
+
+        if (this.loaded.has(key)) {
+            this.destroyChunk(this.loaded.get(key), this.entriesByKey.get(key));
+            this.loaded.delete(key);
+        }
+    }
+
+    destroy() {
+        [...this.loaded.keys(), ...this.loading.keys()].forEach(key => this.unload(key));
+    }
+}
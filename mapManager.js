@@ -1,22 +1,76 @@
 import CONFIG from './config.js';
-import { recordMapBootFailure, validateLoadedMapBootContract } from './mapBootGuard.js';
+import { bindCollisionBodies } from './collisionColliderBinding.js';
+import {
+    recordMapBootFailure,
+    validateLoadedMapBootContract,
+    validateMapBootContract
+} from './mapBootGuard.js';
+import {
+    MapChunkStreamer,
+    getChunkTileFlips,
+    getChunkTilesets,
+    toChunkTileRows
+} from './mapChunkStreamer.js';
+
+function getChunkDirectoryUrl() {
+    return `${CONFIG.PATHS.ASSETS}/${CONFIG.MAP_CHUNKS.DIRECTORY}`;
+}
 
 class MapManager {
     static preload(scene) {
-        scene.load.tilemapTiledJSON(
-            CONFIG.ASSETS.MAP,
-            `${CONFIG.PATHS.ASSETS}/${CONFIG.ASSETS.MAP}${CONFIG.PATHS.JSON_EXTENSION}`
-        );
+        if (CONFIG.MAP_CHUNKS.ENABLED) {
+            // Only the manifest loads up front; chunks stream in around the camera.
+            scene.load.json(
+                CONFIG.MAP_CHUNKS.MANIFEST,
+                `${getChunkDirectoryUrl()}/manifest${CONFIG.PATHS.JSON_EXTENSION}`
+            );
+            scene.load.once(`filecomplete-json-${CONFIG.MAP_CHUNKS.MANIFEST}`, (_key, _type, manifest) => {
+                MapManager.preloadChunkTilesets(scene, manifest);
+            });
+        } else {
+            scene.load.tilemapTiledJSON(
+                CONFIG.ASSETS.MAP,
+                `${CONFIG.PATHS.ASSETS}/${CONFIG.ASSETS.MAP}${CONFIG.PATHS.JSON_EXTENSION}`
+            );
+        }
         scene.load.image(
             CONFIG.ASSETS.TILES,
             `${CONFIG.PATHS.ASSETS}/${CONFIG.ASSETS.TILES}${CONFIG.PATHS.IMAGE_EXTENSION}`
         );
     }
 
+    // Queues the images of any tilesets besides the main one, keyed by tileset name.
+    static preloadChunkTilesets(scene, manifest) {
+        (manifest?.map?.tilesets ?? []).forEach(tileset => {
+            if (tileset.name !== CONFIG.ASSETS.TILES && tileset.image) {
+                scene.load.image(tileset.name, `${CONFIG.PATHS.ASSETS}/${tileset.image}`);
+            }
+        });
+    }
+
+    static getLayerDepth(layerData, index, layerCount, mapHeight, tileHeight) {
+        let depthValue = 0;
+        if (layerData.properties) {
+            const depthProp = layerData.properties.find(p => p.name === 'depth');
+            if (depthProp) depthValue = parseInt(depthProp.value, 10) || 0;
+        } else if (typeof layerData.depth === 'number') {
+            depthValue = layerData.depth;
+        }
+
+        // Calculate layer depth: base + offset
+        const baseDepth = Math.floor((index / layerCount) * (2 * mapHeight));
+        const offset = depthValue * tileHeight;
+        return Phaser.Math.Clamp(baseDepth + offset, 0, 2 * mapHeight);
+    }
+
     static create(scene, {
         validateLoadedMapBootContractFn = validateLoadedMapBootContract,
         recordMapBootFailureFn = recordMapBootFailure
     } = {}) {
+        if (CONFIG.MAP_CHUNKS.ENABLED) {
+            return MapManager.createChunked(scene, { recordMapBootFailureFn });
+        }
+
         scene.mapLayers = {};
 
         const mapValidation = validateLoadedMapBootContractFn(scene);
@@ -36,35 +90,165 @@ class MapManager {
 
         const mapHeight = scene.map.heightInPixels;
 
-        // Build a lookup for layer depth values from the loaded tilemap.
-        const layerDepths = {};
-        if (scene.map.layers) {
-            scene.map.layers.forEach(layerData => {
-                let depthValue = 0;
-                if (layerData.properties) {
-                    const depthProp = layerData.properties.find(p => p.name === 'depth');
-                    if (depthProp) depthValue = parseInt(depthProp.value, 10) || 0;
-                } else if (typeof layerData.depth === 'number') {
-                    depthValue = layerData.depth;
-                }
-                layerDepths[layerData.name] = depthValue;
-            });
-        }
-
         // Create each layer and set its depth once
         scene.map.layers.forEach((layerData, i) => {
             const layer = scene.map.createLayer(layerData.name, tileset, 0, 0);
-            // Calculate layer depth: base + offset
-            let baseDepth = Math.floor((i / scene.map.layers.length) * (2 * mapHeight));
-            let offset = layerDepths[layerData.name] * scene.map.tileHeight;
-            let finalDepth = Phaser.Math.Clamp(baseDepth + offset, 0, 2 * mapHeight);
-            layer.setDepth(finalDepth);
+            layer.setDepth(MapManager.getLayerDepth(
+                layerData, i, scene.map.layers.length, mapHeight, scene.map.tileHeight
+            ));
 
             scene.mapLayers[layerData.name] = layer;
         });
 
         return scene.mapLayers;
     }
+
+    static createChunked(scene, {
+        validateMapBootContractFn = validateMapBootContract,
+        recordMapBootFailureFn = recordMapBootFailure,
+        fetchImpl = globalThis.fetch?.bind(globalThis)
+    } = {}) {
+        scene.mapLayers = {};
+        scene.customCollisionBodies = [];
+
+        const manifest = scene.cache?.json?.get?.(CONFIG.MAP_CHUNKS.MANIFEST);
+        if (!manifest) {
+            recordMapBootFailureFn(
+                scene,
+                `Map boot failed: chunk manifest "${CONFIG.MAP_CHUNKS.MANIFEST}" was not found in the loaded JSON cache.`
+            );
+            return null;
+        }
+
+        const mapValidation = validateMapBootContractFn(scene, manifest.map, { mapName: CONFIG.MAP_CHUNKS.MANIFEST });
+        if (!mapValidation.success) {
+            return null;
+        }
+
+        // The runtime tilemap keeps object layers and tilesets; tile layers live in chunks.
+        scene.cache.tilemap.add(CONFIG.ASSETS.MAP, {
+            format: Phaser.Tilemaps.Formats.TILED_JSON,
+            data: { ...manifest.map, layers: manifest.map.layers.filter(layer => layer.type !== 'tilelayer') }
+        });
+        scene.map = scene.make.tilemap({ key: CONFIG.ASSETS.MAP });
+
+        const mapHeight = manifest.map.height * manifest.map.tileheight;
+        const tileLayers = manifest.map.layers.filter(layer => layer.type === 'tilelayer');
+        tileLayers.forEach((layerData, i) => {
+            scene.mapLayers[layerData.name] = {
+                name: layerData.name,
+                depth: MapManager.getLayerDepth(layerData, i, tileLayers.length, mapHeight, manifest.map.tileheight)
+            };
+        });
+
+        scene.mapChunkStreamer = new MapChunkStreamer({
+            manifest,
+            loadRadius: CONFIG.MAP_CHUNKS.LOAD_RADIUS,
+            loadChunk: entry => fetchImpl(`${getChunkDirectoryUrl()}/${entry.file}`).then(response => response.json()),
+            createChunk: (chunk, entry) => MapManager.createChunkObjects(scene, manifest, chunk, entry),
+            destroyChunk: handle => MapManager.destroyChunkObjects(scene, handle)
+        });
+        scene.mapChunkStreamer.update(MapManager.getStreamingView(scene, manifest));
+
+        return scene.mapLayers;
+    }
+
+    static getStreamingView(scene, manifest = scene.mapChunkStreamer?.manifest) {
+        const camera = scene.cameras?.main;
+        if (camera?.worldView?.width) {
+            return camera.worldView;
+        }
+
+        // Before the camera follows anyone, stream around the player start marker.
+        const playerLayer = manifest.map.layers.find(layer => layer.name === 'player');
+        const start = playerLayer?.objects?.find(object => object.name === 'start') ?? { x: 0, y: 0 };
+        const width = camera?.width || manifest.chunkSize * manifest.map.tilewidth;
+        const height = camera?.height || manifest.chunkSize * manifest.map.tileheight;
+        return { x: start.x - width / 2, y: start.y - height / 2, width, height };
+    }
+
+    static createChunkObjects(scene, manifest, chunk, entry, {
+        staticSpriteFactory = (x, y) => scene.physics.add.staticSprite(x, y, null)
+    } = {}) {
+        const handle = { key: entry.key, maps: [], layers: [], bodies: [], colliders: [] };
+
+        Object.values(scene.mapLayers).forEach(layerInfo => {
+            const tiles = chunk.layers[layerInfo.name];
+            if (!tiles || !tiles.some(tileId => tileId > 0)) {
+                return;
+            }
+
+            const chunkMap = scene.make.tilemap({
+                data: toChunkTileRows(tiles, chunk.width),
+                tileWidth: manifest.map.tilewidth,
+                tileHeight: manifest.map.tileheight
+            });
+            // Tileset textures are loaded under the tileset name (see preloadChunkTilesets).
+            const tilesets = getChunkTilesets(manifest.map.tilesets, tiles).map(tilesetData => chunkMap.addTilesetImage(
+                tilesetData.name,
+                tilesetData.name,
+                tilesetData.tilewidth,
+                tilesetData.tileheight,
+                tilesetData.margin ?? 0,
+                tilesetData.spacing ?? 0,
+                tilesetData.firstgid
+            ));
+            const layer = chunkMap.createLayer(0, tilesets, entry.pixelBounds.x, entry.pixelBounds.y);
+            layer.setDepth(layerInfo.depth);
+            getChunkTileFlips(tiles, chunk.width).forEach(({ x, y, rotation, flipX }) => {
+                const tile = layer.getTileAt(x, y);
+                if (tile) {
+                    tile.rotation = rotation;
+                    tile.flipX = flipX;
+                }
+            });
+
+            handle.maps.push(chunkMap);
+            handle.layers.push(layer);
+        });
+
+        entry.collisionRects.forEach(rect => {
+            const body = staticSpriteFactory(rect.x + rect.width / 2, rect.y + rect.height / 2);
+            body.setSize(rect.width, rect.height);
+            body.visible = false;
+            body.tileInfo = {
+                chunk: entry.key,
+                pixelX: rect.x,
+                pixelY: rect.y,
+                depth: scene.mapLayers[rect.layer]?.depth || 0
+            };
+            handle.bodies.push(body);
+        });
+
+        scene.customCollisionBodies = scene.customCollisionBodies ?? [];
+        scene.customCollisionBodies.push(...handle.bodies);
+        bindCollisionBodies(scene, handle.bodies, {
+            colliderFactory: (firstObject, secondObject) => {
+                const collider = scene.physics.add.collider(firstObject, secondObject);
+                handle.colliders.push(collider);
+                return collider;
+            }
+        });
+
+        return handle;
+    }
+
+    static destroyChunkObjects(scene, handle) {
+        handle.colliders.forEach(collider => collider.destroy());
+        if (scene.customCollisionBodies) {
+            const bodies = new Set(handle.bodies);
+            scene.customCollisionBodies = scene.customCollisionBodies.filter(body => !bodies.has(body));
+        }
+        handle.bodies.forEach(body => body.destroy());
+        handle.layers.forEach(layer => layer.destroy());
+        handle.maps.forEach(chunkMap => chunkMap.destroy());
+    }
+
+    static update(scene) {
+        if (scene.mapChunkStreamer) {
+            scene.mapChunkStreamer.update(MapManager.getStreamingView(scene));
+        }
+    }
 }
 
-export default MapManager;
\ No newline at end of file
+export default MapManager;
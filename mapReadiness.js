@@ -132,6 +132,12 @@ function toLocalTileId(globalTileId, tileset) {
     return unflippedTileId - tileset.firstgid;
 }
 
+// Chunked map manifests drop tile data and list each layer's distinct gids instead.
+function getUsedGlobalTileIds(layer) {
+    const tileIds = Array.isArray(layer.data) ? layer.data : (layer.chunkedTileIds ?? []);
+    return tileIds.filter(globalTileId => globalTileId > 0);
+}
+
 function getEmbeddedTilesetCollisionObjects(tileset, tileId) {
     const tileDefinition = tileset?.tiles?.find(tile => tile.id === tileId);
 
@@ -335,7 +341,7 @@ function validateCollisionLayers(map, contract, issues) {
             ));
         }
 
-        const usedGlobalTileIds = (layer.data ?? []).filter(globalTileId => globalTileId > 0);
+        const usedGlobalTileIds = getUsedGlobalTileIds(layer);
 
         if (usedGlobalTileIds.length === 0) {
             issues.push(createIssue(
@@ -0,0 +1,188 @@
+import argparse
+import json
+import os
+
+from content_cache import load_json
+
+# Splits a Tiled JSON map into fixed-size chunks for region-based loading.
+#
+#   manifest.json      the source map with each tile layer's data replaced by
+#                      the distinct gids it uses (chunkedTileIds), plus one
+#                      entry per chunk holding its tile bounds, pixel bounds,
+#                      file name, and the collision rects of every tile in it
+#   chunk_<c>_<r>.json that chunk's tile data for every tile layer and the
+#                      objects whose position falls inside it
+#
+# Collision rects are resolved from the embedded tileset collision shapes the
+# same way collisionBodyFactory.js does at runtime, in absolute pixels. The
+# chunkedTileIds lists let mapReadiness.js run the full boot check on the
+# manifest, collision tile metadata included.
+
+DEFAULT_CHUNK_SIZE = 32
+MANIFEST_VERSION = 1
+TILE_FLIP_FLAGS_MASK = 0x1FFFFFFF
+COLLISION_LAYERS = ('tables', 'tabletops')
+
+
+def build_collision_lookup(tilesets):
+    """Map global tile ids to their embedded collision rects"""
+    lookup = {}
+    for tileset in tilesets:
+        firstgid = tileset.get('firstgid', 1)
+        for tile in tileset.get('tiles') or []:
+            objects = (tile.get('objectgroup') or {}).get('objects') or []
+            rects = [
+                (obj.get('x', 0), obj.get('y', 0), obj['width'], obj['height'])
+                for obj in objects
+                if obj.get('width') and obj.get('height')
+            ]
+            if rects:
+                lookup[firstgid + tile['id']] = rects
+    return lookup
+
+
+def get_skeleton_layer(layer):
+    """Return layer without its tile data, listing the distinct gids the chunks hold instead"""
+    skeleton_layer = {key: value for key, value in layer.items() if key != 'data'}
+    if layer.get('type') == 'tilelayer':
+        skeleton_layer['chunkedTileIds'] = sorted({gid for gid in layer.get('data') or [] if gid > 0})
+    return skeleton_layer
+
+
+def get_chunk_file(column, row):
+    return f'chunk_{column}_{row}.json'
+
+
+def chunk_map(map_data, chunk_size=DEFAULT_CHUNK_SIZE, collision_layers=COLLISION_LAYERS):
+    """Return (manifest, {file name: chunk}) for a Tiled JSON map"""
+    width, height = map_data['width'], map_data['height']
+    tile_width, tile_height = map_data['tilewidth'], map_data['tileheight']
+    columns = -(-width // chunk_size)
+    rows = -(-height // chunk_size)
+    collision_lookup = build_collision_lookup(map_data.get('tilesets') or [])
+
+    tile_layers = [layer for layer in map_data['layers'] if layer.get('type') == 'tilelayer']
+    object_layers = [layer for layer in map_data['layers'] if layer.get('type') == 'objectgroup']
+
+    entries = []
+    chunks = {}
+    for row in range(rows):
+        for column in range(columns):
+            tile_x, tile_y = column * chunk_size, row * chunk_size
+            chunk_width = min(chunk_size, width - tile_x)
+            chunk_height = min(chunk_size, height - tile_y)
+            pixel_bounds = {
+                'x': tile_x * tile_width,
+                'y': tile_y * tile_height,
+                'width': chunk_width * tile_width,
+                'height': chunk_height * tile_height
+            }
+
+            layers = {}
+            collision_rects = []
+            for layer in tile_layers:
+                data = layer.get('data') or []
+                tiles = []
+                for y in range(tile_y, tile_y + chunk_height):
+                    start = y * width + tile_x
+                    tiles.extend(data[start:start + chunk_width])
+                layers[layer['name']] = tiles
+
+                if layer['name'] not in collision_layers:
+                    continue
+                for index, gid in enumerate(tiles):
+                    rects = collision_lookup.get(gid & TILE_FLIP_FLAGS_MASK)
+                    if not rects:
+                        continue
+                    pixel_x = (tile_x + index % chunk_width) * tile_width
+                    pixel_y = (tile_y + index // chunk_width) * tile_height
+                    collision_rects.extend(
+                        {'x': pixel_x + x, 'y': pixel_y + y, 'width': w, 'height': h, 'layer': layer['name']}
+                        for x, y, w, h in rects
+                    )
+
+            objects = {}
+            for layer in object_layers:
+                inside = [
+                    obj for obj in layer.get('objects') or []
+                    if pixel_bounds['x'] <= obj.get('x', 0) < pixel_bounds['x'] + pixel_bounds['width']
+                    and pixel_bounds['y'] <= obj.get('y', 0) < pixel_bounds['y'] + pixel_bounds['height']
+                ]
+                if inside:
+                    objects[layer['name']] = inside
+
+            if not objects and not any(any(tiles) for tiles in layers.values()):
+                continue
+
+            file_name = get_chunk_file(column, row)
+            entries.append({
+                'key': f'{column}_{row}',
+                'column': column,
+                'row': row,
+                'x': tile_x,
+                'y': tile_y,
+                'width': chunk_width,
+                'height': chunk_height,
+                'pixelBounds': pixel_bounds,
+                'file': file_name,
+                'collisionRects': collision_rects
+            })
+            chunks[file_name] = {
+                'key': f'{column}_{row}',
+                'x': tile_x,
+                'y': tile_y,
+                'width': chunk_width,
+                'height': chunk_height,
+                'layers': layers,
+                'objects': objects
+            }
+
+    skeleton = dict(map_data)
+    skeleton['layers'] = [get_skeleton_layer(layer) for layer in map_data['layers']]
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'chunkSize': chunk_size,
+        'columns': columns,
+        'rows': rows,
+        'map': skeleton,
+        'chunks': entries
+    }
+    return manifest, chunks
+
+
+def write_chunks(manifest, chunks, output_dir):
+    """Write the manifest and chunk files, removing chunks left from older runs"""
+    os.makedirs(output_dir, exist_ok=True)
+    for name in os.listdir(output_dir):
+        if name.startswith('chunk_') and name.endswith('.json') and name not in chunks:
+            os.remove(os.path.join(output_dir, name))
+
+    for file_name, chunk in chunks.items():
+        with open(os.path.join(output_dir, file_name), 'w', encoding='utf-8') as f:
+            json.dump(chunk, f, separators=(',', ':'))
+
+    with open(os.path.join(output_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Split a Tiled JSON map into fixed-size chunks.')
+    parser.add_argument('map', nargs='?', default='assets/map.json')
+    parser.add_argument('--output', help='output directory (default: assets/chunks/<map name>)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    map_data = load_json(args.map)
+
+    map_name = os.path.splitext(os.path.basename(args.map))[0]
+    output_dir = args.output or os.path.join('assets', 'chunks', map_name)
+    manifest, chunks = chunk_map(map_data, args.chunk_size)
+    write_chunks(manifest, chunks, output_dir)
+
+    rect_count = sum(len(entry['collisionRects']) for entry in manifest['chunks'])
+    print(f"Wrote {len(chunks)} of {manifest['columns'] * manifest['rows']} chunks "
+          f"({args.chunk_size}x{args.chunk_size} tiles, {rect_count} collision rects) to {output_dir}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+import argparse
+import copy
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from content_cache import load_json
+
+# Incremental updates for Tiled JSON maps. diff_maps compares two revisions
+# layer by layer and returns a patch that turns the first into the second:
+#
+#   base, target      map hashes, so a client only applies a patch to the
+#                     revision it was made from
+#   fields            changed top-level map properties (tilesets included)
+#   layers            per layer id: changed layer properties, plus either
+#                     tile runs [start index, [gid, ...]] for tile layers or
+#                     object additions/changes/removals by object id for
+#                     object groups; a layer that changed shape is replaced
+#   removedLayers     layer ids to drop; layerOrder when the order changed
+#
+# Tile layers are compared as NumPy arrays. Changed tiles separated by no
+# more than merge_gap unchanged tiles share one run, since a run's framing
+# costs more than a few repeated gids.
+
+PATCH_VERSION = 1
+DEFAULT_MERGE_GAP = 3
+MISSING = object()
+
+
+class MapPatchError(Exception):
+    pass
+
+
+def get_map_hash(map_data):
+    text = json.dumps(map_data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:32]
+
+
+def diff_fields(base, target, skip):
+    """Return ({changed or added key: value}, [removed keys]) ignoring keys in skip"""
+    changed = {key: value for key, value in target.items() if key not in skip and base.get(key, MISSING) != value}
+    removed = sorted(key for key in base if key not in skip and key not in target)
+    return changed, removed
+
+
+def find_tile_runs(base_data, target_data, merge_gap=DEFAULT_MERGE_GAP):
+    """Return [[start, [gid, ...]]] covering every tile that differs"""
+    base = np.asarray(base_data, dtype=np.int64)
+    target = np.asarray(target_data, dtype=np.int64)
+    changed = np.flatnonzero(base != target)
+    if changed.size == 0:
+        return []
+
+    breaks = np.flatnonzero(np.diff(changed) > merge_gap + 1)
+    starts = np.concatenate(([changed[0]], changed[breaks + 1]))
+    ends = np.concatenate((changed[breaks], [changed[-1]])) + 1
+    return [[int(start), target[start:end].tolist()] for start, end in zip(starts, ends)]
+
+
+def diff_objects(base_objects, target_objects):
+    """Return the object changes between two object lists keyed by object id"""
+    base_by_id = {obj['id']: obj for obj in base_objects}
+    target_ids = {obj['id'] for obj in target_objects}
+    changes = {}
+
+    removed = [obj['id'] for obj in base_objects if obj['id'] not in target_ids]
+    added = [obj for obj in target_objects if obj['id'] not in base_by_id]
+    changed = [obj for obj in target_objects if obj['id'] in base_by_id and base_by_id[obj['id']] != obj]
+    if removed:
+        changes['removed'] = removed
+    if added:
+        changes['added'] = added
+    if changed:
+        changes['changed'] = changed
+
+    if [obj['id'] for obj in apply_object_changes(base_objects, changes)] != [obj['id'] for obj in target_objects]:
+        changes['order'] = [obj['id'] for obj in target_objects]
+    return changes
+
+
+def apply_object_changes(objects, changes):
+    removed = set(changes.get('removed') or ())
+    changed = {obj['id']: obj for obj in changes.get('changed') or ()}
+    result = [copy.deepcopy(changed.get(obj['id'], obj)) for obj in objects if obj['id'] not in removed]
+    result.extend(copy.deepcopy(obj) for obj in changes.get('added') or ())
+
+    order = changes.get('order')
+    if order:
+        by_id = {obj['id']: obj for obj in result}
+        result = [by_id[object_id] for object_id in order]
+    return result
+
+
+def can_patch_tiles(base, target):
+    return (
+        isinstance(base.get('data'), list) and isinstance(target.get('data'), list)
+        and (base.get('width'), base.get('height')) == (target.get('width'), target.get('height'))
+        and len(base['data']) == len(target['data'])
+    )
+
+
+def can_patch_objects(base, target):
+    objects = (base.get('objects') or []) + (target.get('objects') or [])
+    return all('id' in obj for obj in objects)
+
+
+def diff_layer(base, target, merge_gap=DEFAULT_MERGE_GAP):
+    """Return the patch entry for one layer, or None when it is unchanged"""
+    if base == target:
+        return None
+
+    layer_type = target.get('type')
+    if base.get('type') != layer_type:
+        return {'id': target['id'], 'replace': target}
+
+    entry = {'id': target['id']}
+    if layer_type == 'tilelayer' and can_patch_tiles(base, target):
+        runs = find_tile_runs(base['data'], target['data'], merge_gap)
+        if runs:
+            entry['runs'] = runs
+        content_key = 'data'
+    elif layer_type == 'objectgroup' and can_patch_objects(base, target):
+        objects = diff_objects(base.get('objects') or [], target.get('objects') or [])
+        if objects:
+            entry['objects'] = objects
+        content_key = 'objects'
+    else:
+        return {'id': target['id'], 'replace': target}
+
+    fields, removed_fields = diff_fields(base, target, {content_key})
+    if fields:
+        entry['fields'] = fields
+    if removed_fields:
+        entry['removedFields'] = removed_fields
+    return entry
+
+
+def diff_maps(base, target, merge_gap=DEFAULT_MERGE_GAP):
+    """Return a patch turning map base into map target"""
+    patch = {'version': PATCH_VERSION, 'base': get_map_hash(base), 'target': get_map_hash(target)}
+
+    fields, removed_fields = diff_fields(base, target, {'layers'})
+    if fields:
+        patch['fields'] = fields
+    if removed_fields:
+        patch['removedFields'] = removed_fields
+
+    base_layers = {layer['id']: layer for layer in base.get('layers') or []}
+    target_layers = target.get('layers') or []
+    target_layers_by_id = {layer['id']: layer for layer in target_layers}
+    layers = []
+    for layer in target_layers:
+        if layer['id'] in base_layers:
+            entry = diff_layer(base_layers[layer['id']], layer, merge_gap)
+        else:
+            entry = {'id': layer['id'], 'replace': layer}
+        if entry:
+            layers.append(entry)
+    if layers:
+        patch['layers'] = layers
+
+    target_ids = [layer['id'] for layer in target_layers]
+    removed_layers = [layer_id for layer_id in base_layers if layer_id not in target_layers_by_id]
+    if removed_layers:
+        patch['removedLayers'] = removed_layers
+
+    default_order = [layer_id for layer_id in base_layers if layer_id in target_layers_by_id]
+    default_order.extend(layer_id for layer_id in target_ids if layer_id not in base_layers)
+    if default_order != target_ids:
+        patch['layerOrder'] = target_ids
+    return patch
+
+
+def apply_layer_patch(layer, entry):
+    if 'replace' in entry:
+        return copy.deepcopy(entry['replace'])
+
+    result = copy.deepcopy(layer)
+    for key in entry.get('removedFields') or ():
+        result.pop(key, None)
+    result.update(copy.deepcopy(entry.get('fields') or {}))
+
+    if entry.get('runs'):
+        data = np.asarray(result['data'], dtype=np.int64)
+        for start, values in entry['runs']:
+            if start < 0 or start + len(values) > data.size:
+                raise MapPatchError(f'Tile run at {start} falls outside layer {layer["id"]}.')
+            data[start:start + len(values)] = values
+        result['data'] = data.tolist()
+
+    if entry.get('objects'):
+        result['objects'] = apply_object_changes(result.get('objects') or [], entry['objects'])
+    return result
+
+
+def apply_patch(map_data, patch, verify=True):
+    """Return a new map with patch applied; the base hash is checked when verify is set"""
+    if patch.get('version') != PATCH_VERSION:
+        raise MapPatchError(f'Unsupported map patch version {patch.get("version")}.')
+    if verify and get_map_hash(map_data) != patch['base']:
+        raise MapPatchError('Map patch was made from a different map revision.')
+
+    # Layers are filled in below; the placeholder keeps the key in its original position.
+    result = {key: None if key == 'layers' else copy.deepcopy(value) for key, value in map_data.items()}
+    for key in patch.get('removedFields') or ():
+        result.pop(key, None)
+    result.update(copy.deepcopy(patch.get('fields') or {}))
+
+    removed_layers = set(patch.get('removedLayers') or ())
+    layers = {layer['id']: layer for layer in map_data.get('layers') or [] if layer['id'] not in removed_layers}
+    order = [layer_id for layer_id in layers]
+    for entry in patch.get('layers') or ():
+        if entry['id'] not in layers:
+            if 'replace' not in entry:
+                raise MapPatchError(f'Map patch changes missing layer {entry["id"]}.')
+            order.append(entry['id'])
+        layers[entry['id']] = apply_layer_patch(layers.get(entry['id']), entry)
+
+    result['layers'] = [copy.deepcopy(layers[layer_id]) for layer_id in patch.get('layerOrder') or order]
+    if verify and get_map_hash(result) != patch['target']:
+        raise MapPatchError('Patched map does not match the patch target.')
+    return result
+
+
+def write_json(value, path, indent=None):
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(value, f, indent=indent, separators=None if indent else (',', ':'), ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Diff two Tiled JSON map revisions or apply a map patch.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    diff_parser = commands.add_parser('diff', help='write the patch from one map revision to the next')
+    diff_parser.add_argument('base')
+    diff_parser.add_argument('target')
+    diff_parser.add_argument('--output', required=True)
+    diff_parser.add_argument('--merge-gap', type=int, default=DEFAULT_MERGE_GAP)
+
+    apply_parser = commands.add_parser('apply', help='apply a patch to the map revision it was made from')
+    apply_parser.add_argument('map')
+    apply_parser.add_argument('patch')
+    apply_parser.add_argument('--output', required=True)
+
+    args = parser.parse_args()
+
+    if args.command == 'diff':
+        base, target = load_json(args.base), load_json(args.target)
+        patch = diff_maps(base, target, args.merge_gap)
+        # Round-trip before writing, so a published patch always reproduces the target.
+        apply_patch(base, patch)
+        write_json(patch, args.output)
+        print(f"Wrote {args.output}: {os.path.getsize(args.output)} bytes "
+              f"(target map is {os.path.getsize(args.target)} bytes), {len(patch.get('layers') or [])} layers changed.")
+        return
+
+    try:
+        patched = apply_patch(load_json(args.map), load_json(args.patch))
+    except MapPatchError as error:
+        parser.error(str(error))
+    write_json(patched, args.output, indent=1)
+    print(f"Wrote {args.output} at revision {get_map_hash(patched)}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+import argparse
+import json
+import os
+import shutil
+
+import numpy as np
+
+from content_cache import load_json
+from png_io import read_png, slice_tiles, write_png
+
+# Renders a downscaled floor overview from a Tiled map at build time.
+#
+# Each tileset tile is area-averaged down to the level's pixels-per-tile once,
+# then every tile layer is assembled with one fancy-index lookup into that
+# atlas and alpha-composited in layer order. Booth markers from vendors.json
+# are drawn on top, and each zoom level is cut into small PNG tiles:
+#
+#   <output>/minimap.json            levels, scales, and tile grid per level
+#   <output>/<level>/<col>_<row>.png PNG tiles of at most --tile-size pixels
+#
+# Level 0 fits the whole floor into a single tile, so clients get an overview
+# with one small image fetch.
+
+DEFAULT_TILE_SIZE = 256
+DEFAULT_LEVELS = 3
+TILE_FLIP_FLAGS_MASK = 0x1FFFFFFF
+BACKGROUND = (27, 31, 36, 255)
+MARKER_COLORS = (
+    (239, 83, 80), (255, 167, 38), (255, 238, 88), (102, 187, 106), (38, 198, 218),
+    (66, 165, 245), (126, 87, 194), (236, 64, 122), (141, 110, 99), (189, 189, 189)
+)
+
+
+def resample_area(tiles, out_height, out_width):
+    """Area-average (N, H, W, 4) premultiplied tiles down to (N, out_height, out_width, 4)"""
+    _, height, width, _ = tiles.shape
+    row_starts = np.floor(np.linspace(0, height, out_height + 1)[:-1]).astype(int)
+    col_starts = np.floor(np.linspace(0, width, out_width + 1)[:-1]).astype(int)
+    row_counts = np.diff(np.append(row_starts, height))
+    col_counts = np.diff(np.append(col_starts, width))
+
+    summed = np.add.reduceat(np.add.reduceat(tiles, row_starts, axis=1), col_starts, axis=2)
+    return summed / (row_counts[None, :, None, None] * col_counts[None, None, :, None])
+
+
+def premultiply(rgba):
+    image = rgba.astype(np.float32) / 255.0
+    image[..., :3] *= image[..., 3:4]
+    return image
+
+
+def load_tileset_tiles(tileset, map_dir):
+    """Return (N, tileheight, tilewidth, 4) premultiplied tiles, or None if the image is unavailable"""
+    image_path = os.path.join(map_dir, tileset.get('image', ''))
+    if 'image' not in tileset or not os.path.exists(image_path):
+        return None
+
+    return premultiply(slice_tiles(read_png(image_path), tileset))
+
+
+def load_tilesets(map_data, map_dir):
+    return [(tileset, load_tileset_tiles(tileset, map_dir)) for tileset in map_data.get('tilesets') or []]
+
+
+def build_tile_atlas(tilesets, pixels_per_tile):
+    """Return a (max_gid + 1, p, p, 4) atlas indexed by global tile id; gid 0 is empty"""
+    max_gid = max(
+        (tileset['firstgid'] + len(tiles) - 1 for tileset, tiles in tilesets if tiles is not None),
+        default=0
+    )
+
+    atlas = np.zeros((max_gid + 1, pixels_per_tile, pixels_per_tile, 4), dtype=np.float32)
+    for tileset, tiles in tilesets:
+        if tiles is not None and len(tiles):
+            first = tileset['firstgid']
+            atlas[first:first + len(tiles)] = resample_area(tiles, pixels_per_tile, pixels_per_tile)
+    return atlas
+
+
+def render_layers(map_data, atlas, pixels_per_tile, background=BACKGROUND):
+    """Composite every tile layer into one (H * p, W * p, 4) premultiplied image"""
+    width, height, p = map_data['width'], map_data['height'], pixels_per_tile
+    canvas = np.empty((height * p, width * p, 4), dtype=np.float32)
+    canvas[:] = premultiply(np.array(background, dtype=np.uint8).reshape(1, 1, 4))
+
+    for layer in map_data['layers']:
+        if layer.get('type') != 'tilelayer' or not layer.get('data'):
+            continue
+
+        gids = np.asarray(layer['data'], dtype=np.int64).reshape(height, width) & TILE_FLIP_FLAGS_MASK
+        gids[gids >= len(atlas)] = 0
+        pixels = atlas[gids].transpose(0, 2, 1, 3, 4).reshape(height * p, width * p, 4)
+        canvas *= 1.0 - pixels[..., 3:4]
+        canvas += pixels
+
+    return canvas
+
+
+def to_rgba8(canvas):
+    image = canvas.copy()
+    alpha = image[..., 3:4]
+    np.divide(image[..., :3], alpha, out=image[..., :3], where=alpha > 0)
+    return np.clip(np.rint(image * 255.0), 0, 255).astype(np.uint8)
+
+
+def get_marker_colors(domains):
+    return {domain['id']: MARKER_COLORS[i % len(MARKER_COLORS)] for i, domain in enumerate(domains)}
+
+
+def draw_markers(image, vendors, scale, radius, colors):
+    """Draw a filled dot per vendor at its map position, scaled into image pixels"""
+    height, width, _ = image.shape
+    offsets = [
+        (dy, dx)
+        for dy in range(-radius, radius + 1)
+        for dx in range(-radius, radius + 1)
+        if dx * dx + dy * dy <= radius * radius + radius
+    ]
+
+    drawn = 0
+    for vendor in vendors:
+        x, y = vendor.get('x'), vendor.get('y')
+        if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
+            continue
+
+        center_x, center_y = int(x * scale), int(y * scale)
+        if not (0 <= center_x < width and 0 <= center_y < height):
+            continue
+
+        color = colors.get(vendor.get('domain_id'), MARKER_COLORS[-1])
+        for dy, dx in offsets:
+            py, px = center_y + dy, center_x + dx
+            if 0 <= py < height and 0 <= px < width:
+                image[py, px] = (*color, 255)
+        drawn += 1
+    return drawn
+
+
+def get_level_scales(map_data, levels=DEFAULT_LEVELS, tile_size=DEFAULT_TILE_SIZE):
+    """Pixels per map tile for each zoom level; level 0 fits in one image tile"""
+    native = min(map_data['tilewidth'], map_data['tileheight'])
+    base = max(1, min(native, tile_size // max(map_data['width'], map_data['height'])))
+    scales = []
+    for level in range(levels):
+        pixels_per_tile = min(native, base * 2 ** level)
+        if scales and pixels_per_tile == scales[-1]:
+            break
+        scales.append(pixels_per_tile)
+    return scales
+
+
+def build_minimap(map_data, map_dir, vendors=(), domains=(), levels=DEFAULT_LEVELS, tile_size=DEFAULT_TILE_SIZE):
+    """Return (manifest, {relative path: RGBA array}) for every zoom level"""
+    colors = get_marker_colors(domains)
+    manifest = {
+        'version': 1,
+        'tileSize': tile_size,
+        'mapWidth': map_data['width'] * map_data['tilewidth'],
+        'mapHeight': map_data['height'] * map_data['tileheight'],
+        'levels': []
+    }
+    images = {}
+    tilesets = load_tilesets(map_data, map_dir)
+
+    for level, pixels_per_tile in enumerate(get_level_scales(map_data, levels, tile_size)):
+        atlas = build_tile_atlas(tilesets, pixels_per_tile)
+        image = to_rgba8(render_layers(map_data, atlas, pixels_per_tile))
+        scale = pixels_per_tile / map_data['tilewidth']
+        draw_markers(image, vendors, scale, max(1, pixels_per_tile // 6), colors)
+
+        height, width, _ = image.shape
+        columns, rows = -(-width // tile_size), -(-height // tile_size)
+        for row in range(rows):
+            for column in range(columns):
+                images[f'{level}/{column}_{row}.png'] = image[
+                    row * tile_size:(row + 1) * tile_size,
+                    column * tile_size:(column + 1) * tile_size
+                ]
+
+        manifest['levels'].append({
+            'level': level,
+            'pixelsPerTile': pixels_per_tile,
+            'scale': scale,
+            'width': width,
+            'height': height,
+            'columns': columns,
+            'rows': rows
+        })
+
+    return manifest, images
+
+
+def write_minimap(manifest, images, output_dir):
+    for level in os.listdir(output_dir) if os.path.isdir(output_dir) else []:
+        if level.isdigit():
+            shutil.rmtree(os.path.join(output_dir, level))
+
+    for relative_path, image in images.items():
+        path = os.path.join(output_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_png(path, image)
+
+    with open(os.path.join(output_dir, 'minimap.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render minimap overview tiles from a Tiled map.')
+    parser.add_argument('map', nargs='?', default='assets/map.json')
+    parser.add_argument('--vendors', default='vendors.json')
+    parser.add_argument('--domains', default='technology_domains.json')
+    parser.add_argument('--output', help='output directory (default: assets/minimap/<map name>)')
+    parser.add_argument('--levels', type=int, default=DEFAULT_LEVELS)
+    parser.add_argument('--tile-size', type=int, default=DEFAULT_TILE_SIZE)
+    args = parser.parse_args()
+
+    map_data = load_json(args.map)
+    map_name = os.path.splitext(os.path.basename(args.map))[0]
+    output_dir = args.output or os.path.join('assets', 'minimap', map_name)
+
+    manifest, images = build_minimap(
+        map_data,
+        os.path.dirname(args.map),
+        vendors=load_json(args.vendors) if args.vendors else [],
+        domains=load_json(args.domains) if args.domains else [],
+        levels=args.levels,
+        tile_size=args.tile_size
+    )
+    write_minimap(manifest, images, output_dir)
+
+    sizes = ', '.join(f"{level['width']}x{level['height']}" for level in manifest['levels'])
+    print(f"Wrote {len(images)} minimap tiles ({sizes}) to {output_dir}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import struct
+import zlib
+
+import numpy as np
+
+# Minimal PNG reader/writer for the asset build scripts, backed by NumPy.
+# Reads 8-bit, non-interlaced grayscale, RGB, palette, and RGBA images (the
+# formats the art pipeline exports) and always returns an (H, W, 4) uint8
+# RGBA array. Writes RGBA or RGB arrays, and slices tileset images into tiles.
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+
+class PngError(Exception):
+    pass
+
+
+def iter_chunks(data):
+    if data[:8] != PNG_SIGNATURE:
+        raise PngError('Not a PNG file.')
+
+    pos = 8
+    while pos < len(data):
+        (length,) = struct.unpack_from('>I', data, pos)
+        chunk_type = data[pos + 4:pos + 8]
+        yield chunk_type, data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+
+
+def paeth_row(row, previous, bpp):
+    """Undo the Paeth filter for one row; each pixel depends on the one before it"""
+    out = row.astype(np.int16)
+    up = previous.astype(np.int16)
+    for start in range(0, len(out), bpp):
+        end = start + bpp
+        if start:
+            left = out[start - bpp:start]
+            upper_left = up[start - bpp:start]
+        else:
+            left = upper_left = np.zeros(bpp, dtype=np.int16)
+        above = up[start:end]
+        estimate = left + above - upper_left
+        pa, pb, pc = np.abs(estimate - left), np.abs(estimate - above), np.abs(estimate - upper_left)
+        predictor = np.where((pa <= pb) & (pa <= pc), left, np.where(pb <= pc, above, upper_left))
+        out[start:end] = (out[start:end] + predictor) & 0xFF
+    return out.astype(np.uint8)
+
+
+def unfilter(raw, height, stride, bpp):
+    rows = np.frombuffer(raw, dtype=np.uint8).reshape(height, stride + 1)
+    previous = np.zeros(stride, dtype=np.uint8)
+    image = np.empty((height, stride), dtype=np.uint8)
+
+    for y in range(height):
+        filter_type = rows[y, 0]
+        row = rows[y, 1:]
+        if filter_type == 0:
+            current = row.copy()
+        elif filter_type == 1:
+            # Sub: a running sum per channel, which cumsum handles in one pass.
+            current = (np.cumsum(row.reshape(-1, bpp).astype(np.uint32), axis=0) & 0xFF).astype(np.uint8).ravel()
+        elif filter_type == 2:
+            current = row + previous
+        elif filter_type == 3:
+            current = row.astype(np.int16)
+            for start in range(0, stride, bpp):
+                left = current[start - bpp:start] if start else 0
+                current[start:start + bpp] = (
+                    current[start:start + bpp] + (left + previous[start:start + bpp].astype(np.int16)) // 2
+                ) & 0xFF
+            current = current.astype(np.uint8)
+        elif filter_type == 4:
+            current = paeth_row(row, previous, bpp)
+        else:
+            raise PngError(f'Unknown PNG filter type {filter_type}.')
+        image[y] = current
+        previous = current
+
+    return image
+
+
+def read_png(path):
+    """Return a PNG as an (H, W, 4) uint8 RGBA array"""
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    header = None
+    palette = None
+    transparency = None
+    idat = []
+    for chunk_type, body in iter_chunks(data):
+        if chunk_type == b'IHDR':
+            header = struct.unpack('>IIBBBBB', body)
+        elif chunk_type == b'PLTE':
+            palette = np.frombuffer(body, dtype=np.uint8).reshape(-1, 3)
+        elif chunk_type == b'tRNS':
+            transparency = np.frombuffer(body, dtype=np.uint8)
+        elif chunk_type == b'IDAT':
+            idat.append(body)
+
+    if header is None:
+        raise PngError(f'{path} has no IHDR chunk.')
+
+    width, height, bit_depth, color_type, _, _, interlace = header
+    if bit_depth != 8 or interlace or color_type not in CHANNELS:
+        raise PngError(f'{path}: only 8-bit, non-interlaced PNGs are supported.')
+
+    channels = CHANNELS[color_type]
+    pixels = unfilter(zlib.decompress(b''.join(idat)), height, width * channels, channels)
+    pixels = pixels.reshape(height, width, channels)
+
+    if color_type == 6:
+        return pixels
+    if color_type == 3:
+        alpha = np.full(len(palette), 255, dtype=np.uint8)
+        if transparency is not None:
+            alpha[:len(transparency)] = transparency
+        lookup = np.concatenate([palette, alpha[:, None]], axis=1)
+        return lookup[pixels[:, :, 0]]
+
+    rgba = np.empty((height, width, 4), dtype=np.uint8)
+    if color_type == 2:
+        rgba[:, :, :3] = pixels
+        rgba[:, :, 3] = 255
+    else:
+        rgba[:, :, :3] = pixels[:, :, :1]
+        rgba[:, :, 3] = pixels[:, :, 1] if color_type == 4 else 255
+    return rgba
+
+
+def encode_png(image, compression=9):
+    """Encode an (H, W, 3|4) uint8 array as PNG bytes"""
+    image = np.ascontiguousarray(image, dtype=np.uint8)
+    height, width, channels = image.shape
+    color_type = {3: 2, 4: 6}[channels]
+
+    # Up filtering compresses flat map art well and is cheap to vectorize.
+    filtered = np.empty((height, width * channels + 1), dtype=np.uint8)
+    filtered[:, 0] = 2
+    rows = image.reshape(height, width * channels)
+    filtered[0, 1:] = rows[0]
+    filtered[1:, 1:] = rows[1:] - rows[:-1]
+
+    def chunk(chunk_type, body):
+        return struct.pack('>I', len(body)) + chunk_type + body + struct.pack('>I', zlib.crc32(chunk_type + body))
+
+    return b''.join([
+        PNG_SIGNATURE,
+        chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0)),
+        chunk(b'IDAT', zlib.compress(filtered.tobytes(), compression)),
+        chunk(b'IEND', b'')
+    ])
+
+
+def write_png(path, image, compression=9):
+    with open(path, 'wb') as f:
+        f.write(encode_png(image, compression))
+
+
+def slice_tiles(image, tileset):
+    """Return a tileset image as an (N, tileheight, tilewidth, channels) array of its tiles"""
+    tile_width, tile_height = tileset['tilewidth'], tileset['tileheight']
+    margin, spacing = tileset.get('margin', 0), tileset.get('spacing', 0)
+    # Spacing sits between tiles only, so the last column and row have none after them.
+    columns = tileset.get('columns') or (image.shape[1] - margin + spacing) // (tile_width + spacing)
+    count = tileset.get('tilecount') or columns * ((image.shape[0] - margin + spacing) // (tile_height + spacing))
+
+    tiles = np.zeros((count, tile_height, tile_width) + image.shape[2:], dtype=image.dtype)
+    for index in range(count):
+        x = margin + (index % columns) * (tile_width + spacing)
+        y = margin + (index // columns) * (tile_height + spacing)
+        tile = image[y:y + tile_height, x:x + tile_width]
+        tiles[index, :tile.shape[0], :tile.shape[1]] = tile
+    return tiles
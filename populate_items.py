@@ -1,8 +1,4 @@
-import json
-
-# Load the vendors JSON
-with open('vendors.json', 'r', encoding='utf-8') as f:
-    vendors = json.load(f)
+from content_model import load_vendors, save_vendors, shared_items
 
 # Define item templates based on keywords
 item_templates = {
@@ -94,20 +90,21 @@ def get_items_for_vendor(name, description):
     # Return 3 items
     return items[:3]
 
-# Update each vendor's items
-for i, vendor in enumerate(vendors):
-    vendor['items'] = []
-    items = get_items_for_vendor(vendor['name'], vendor['description'])
-    for j, item in enumerate(items):
-        vendor['items'].append({
-            'id': f'item_{i}_{j+1}',
-            'name': item['name'],
-            'description': item['description'],
-            'value': item['value']
-        })
+def populate_vendor_items(vendors):
+    """Give each vendor shared template items for its category"""
+    for i, vendor in enumerate(vendors):
+        items = get_items_for_vendor(vendor.name, vendor.description)
+        vendor.set_items(shared_items(items), f'item_{i}_')
+    return vendors
+
+def main():
+    vendors = load_vendors('vendors.json')
+    populate_vendor_items(vendors)
+
+    # Save the updated JSON
+    save_vendors(vendors, 'vendors.json')
 
-# Save the updated JSON
-with open('vendors.json', 'w', encoding='utf-8') as f:
-    json.dump(vendors, f, indent=2)
+    print("Vendor inventories updated!")
 
-print("Vendor inventories updated!")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import { initializeInteractionReadiness } from './bootReadiness.js';
 import CollisionManager from './collisionManager.js';
 import CONFIG from './config.js';
+import { readContentBundle } from './contentBundle.js';
 import DomainManager from './domainManager.js';
 import GameState from './gameState.js';
 import { createLiveVendorContentService } from './liveVendorContentService.js';
@@ -22,6 +23,7 @@ export function initializeSceneBootstrap(
         initializeSceneRuntimeFn = initializeSceneRuntime,
         bindSceneBooleanFlagFn = bindSceneBooleanFlag,
         createLiveVendorContentServiceFn = createLiveVendorContentService,
+        readContentBundleFn = readContentBundle,
         recreateCollision = CollisionManager.create
     } = {}
 ) {
@@ -37,9 +39,20 @@ export function initializeSceneBootstrap(
         liveVendorContentService.start?.();
     }
 
+    const contentBundle = CONFIG.CONTENT_BUNDLE.ENABLED
+        ? readContentBundleFn(scene, CONFIG.CONTENT_BUNDLE.KEY)
+        : null;
+    if (contentBundle) {
+        DomainManagerModule.useContentBundle(contentBundle);
+    }
+
     DomainManagerModule.loadDomains();
-    scene.vendors = scene.cache.json.get(CONFIG.CONTENT.VENDORS);
-    scene.discoveryTrails = scene.cache.json.get(CONFIG.CONTENT.DISCOVERY_TRAILS) ?? [];
+    scene.vendors = contentBundle
+        ? contentBundle.getSection(CONFIG.CONTENT.VENDORS)
+        : scene.cache.json.get(CONFIG.CONTENT.VENDORS);
+    scene.discoveryTrails = (contentBundle
+        ? contentBundle.getSection(CONFIG.CONTENT.DISCOVERY_TRAILS)
+        : scene.cache.json.get(CONFIG.CONTENT.DISCOVERY_TRAILS)) ?? [];
 
     if (!initializeSceneWorldFn(scene)) {
         return {
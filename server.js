@@ -4,11 +4,54 @@ import path from 'node:path';
 import { fileURLToPath } from 'node:url';
 
 import { VendorContentStore } from './liveVendorAnnouncementStore.js';
+import {
+    CachedJsonFileProjection,
+    REVALIDATE_CACHE_CONTROL,
+    RevisionedJsonCache,
+    acceptsGzip,
+    requestMatchesEtag
+} from './serverResponseCache.js';
+import { VendorContentJournal } from './vendorContentJournal.js';
 
 const repoRoot = path.dirname(fileURLToPath(import.meta.url));
 const host = process.env.HOST ?? '0.0.0.0';
 const port = Number.parseInt(process.env.PORT ?? '5000', 10);
 const vendorContentStore = new VendorContentStore();
+const vendorContentJournal = new VendorContentJournal({
+    directory: path.resolve(repoRoot, process.env.VENDOR_CONTENT_DATA_DIR ?? 'data/vendor-content')
+});
+const MAX_JSON_BODY_BYTES = 1024 * 64;
+const MAX_BATCH_BODY_BYTES = 1024 * 1024 * 4;
+const MAX_BATCH_UPDATES = 1000;
+const MAX_LONG_POLL_WAIT_MS = 30000;
+const EVENT_STREAM_HEARTBEAT_MS = 25000;
+// Waiting long-poll requests and open event streams; each is called once per store change.
+const changeWaiters = new Set();
+
+vendorContentStore.subscribe((change) => {
+    const frame = `id: ${change.revision}\nevent: change\ndata: ${JSON.stringify({ ...change, reset: false })}\n\n`;
+    [...changeWaiters].forEach(waiter => waiter(change, frame));
+});
+const vendorProjection = new CachedJsonFileProjection(
+    path.join(repoRoot, 'vendors.json'),
+    vendors => ({ vendors: vendors.map(({ id, name, booth, x, y }) => ({ id, name, booth, x, y })) })
+);
+const vendorContentCache = new RevisionedJsonCache(
+    () => vendorContentStore.revision,
+    () => ({ revision: vendorContentStore.revision, ...vendorContentStore.toJSON() })
+);
+// The manifest records the bundle's SHA-256, so its ETag changes exactly when the bundle does.
+const CONTENT_BUNDLE_PATHNAME = '/assets/content_bundle.json';
+const contentBundlePath = path.join(repoRoot, 'assets', 'content_bundle.json');
+const contentBundleManifest = new CachedJsonFileProjection(
+    path.join(repoRoot, 'assets', 'content_bundle.manifest.json'),
+    manifest => manifest
+);
+let contentBundleBodies = null;
+const vendorAnnouncementCache = new RevisionedJsonCache(
+    () => vendorContentStore.revision,
+    () => ({ announcements: vendorContentStore.toJSON().announcements })
+);
 
 const contentTypes = new Map([
     ['.css', 'text/css; charset=utf-8'],
@@ -45,16 +88,36 @@ function sendJson(response, statusCode, payload) {
     response.end(body);
 }
 
+// Polled GET endpoints answer If-None-Match with a 304 and no body.
+function sendCachedJson(request, response, { body, etag }) {
+    const headers = {
+        'Cache-Control': REVALIDATE_CACHE_CONTROL,
+        ETag: etag
+    };
+
+    if (requestMatchesEtag(request.headers['if-none-match'], etag)) {
+        response.writeHead(304, headers);
+        response.end();
+        return;
+    }
+
+    response.writeHead(200, {
+        ...headers,
+        'Content-Type': 'application/json; charset=utf-8'
+    });
+    response.end(body);
+}
+
 function sendMethodNotAllowed(response) {
     sendJson(response, 405, { error: 'Method not allowed' });
 }
 
-async function readJsonBody(request) {
+async function readJsonBody(request, maxBytes = MAX_JSON_BODY_BYTES) {
     let body = '';
 
     for await (const chunk of request) {
         body += chunk;
-        if (body.length > 1024 * 64) {
+        if (body.length > maxBytes) {
             throw new Error('Request body is too large');
         }
     }
@@ -62,17 +125,120 @@ async function readJsonBody(request) {
     return body.trim().length > 0 ? JSON.parse(body) : {};
 }
 
-async function readVendors() {
-    const vendorFile = await fs.readFile(path.join(repoRoot, 'vendors.json'), 'utf8');
-    const vendors = JSON.parse(vendorFile);
+function parseRevision(value) {
+    const revision = Number.parseInt(value ?? '', 10);
+    return Number.isInteger(revision) ? revision : null;
+}
+
+function hasChanges(delta) {
+    return delta.reset || delta.updates.length > 0;
+}
+
+function openChangeStream(request, response, since) {
+    response.writeHead(200, {
+        'Content-Type': 'text/event-stream; charset=utf-8',
+        'Cache-Control': 'no-store',
+        Connection: 'keep-alive'
+    });
+    response.write('retry: 2000\n\n');
+
+    const delta = vendorContentStore.getChangesSince(since);
+    if (hasChanges(delta)) {
+        response.write(`id: ${delta.revision}\nevent: change\ndata: ${JSON.stringify(delta)}\n\n`);
+    }
+
+    const waiter = (change, frame) => response.write(frame);
+    const heartbeat = setInterval(() => response.write(': ping\n\n'), EVENT_STREAM_HEARTBEAT_MS);
+    changeWaiters.add(waiter);
+    response.on('close', () => {
+        clearInterval(heartbeat);
+        changeWaiters.delete(waiter);
+    });
+}
+
+function waitForChanges(request, response, since, waitMs) {
+    const delta = vendorContentStore.getChangesSince(since);
+    if (hasChanges(delta) || waitMs <= 0) {
+        sendJson(response, 200, delta);
+        return;
+    }
+
+    const finish = () => {
+        clearTimeout(timeoutId);
+        changeWaiters.delete(waiter);
+    };
+    const waiter = () => {
+        finish();
+        sendJson(response, 200, vendorContentStore.getChangesSince(since));
+    };
+    const timeoutId = setTimeout(waiter, Math.min(waitMs, MAX_LONG_POLL_WAIT_MS));
+    changeWaiters.add(waiter);
+    response.on('close', finish);
+}
+
+function getBatchUpdates(payload) {
+    if (Array.isArray(payload)) {
+        return payload;
+    }
 
-    return vendors.map(({ id, name, booth }) => ({ id, name, booth }));
+    return Array.isArray(payload?.updates) ? payload.updates : null;
 }
 
 async function handleApiRequest(request, response, requestUrl) {
+    if (requestUrl.pathname === '/api/vendor-content/changes') {
+        if (request.method !== 'GET') {
+            sendMethodNotAllowed(response);
+            return true;
+        }
+
+        // EventSource reconnects send Last-Event-ID, which supersedes ?since.
+        const since = parseRevision(request.headers['last-event-id'])
+            ?? parseRevision(requestUrl.searchParams.get('since'));
+        if ((request.headers.accept ?? '').includes('text/event-stream')) {
+            openChangeStream(request, response, since);
+        } else {
+            waitForChanges(request, response, since, parseRevision(requestUrl.searchParams.get('wait')) ?? 0);
+        }
+
+        return true;
+    }
+
+    if (requestUrl.pathname === '/api/vendor-content/batch') {
+        if (request.method !== 'POST') {
+            sendMethodNotAllowed(response);
+            return true;
+        }
+
+        try {
+            const updates = getBatchUpdates(await readJsonBody(request, MAX_BATCH_BODY_BYTES));
+            if (!updates) {
+                sendJson(response, 400, { error: 'An updates array is required.' });
+                return true;
+            }
+
+            if (updates.length > MAX_BATCH_UPDATES) {
+                sendJson(response, 413, { error: `A batch may contain at most ${MAX_BATCH_UPDATES} updates.` });
+                return true;
+            }
+
+            // Only counts come back; clients re-read the store through the cached GET.
+            const { updated, rejected } = vendorContentStore.applyUpdates(updates);
+            await vendorContentJournal.flush();
+            sendJson(response, 200, {
+                revision: vendorContentStore.revision,
+                updated: updated.length,
+                rejected
+            });
+        } catch (error) {
+            sendJson(response, 400, { error: error.message });
+        }
+
+        return true;
+    }
+
     if (requestUrl.pathname === '/api/vendor-content') {
         if (request.method === 'GET') {
-            sendJson(response, 200, vendorContentStore.toJSON());
+            sendCachedJson(request, response, vendorContentCache.get());
             return true;
         }
 
@@ -84,6 +250,8 @@ async function handleApiRequest(request, response, requestUrl) {
                     return true;
                 }
 
+                await vendorContentJournal.flush();
+
                 sendJson(response, 200, {
                     ...vendorContentStore.toJSON(),
                     updated: update
@@ -101,9 +269,7 @@ async function handleApiRequest(request, response, requestUrl) {
 
     if (requestUrl.pathname === '/api/vendor-announcements') {
         if (request.method === 'GET') {
-            sendJson(response, 200, {
-                announcements: vendorContentStore.toJSON().announcements
-            });
+            sendCachedJson(request, response, vendorAnnouncementCache.get());
             return true;
         }
 
@@ -115,6 +281,8 @@ async function handleApiRequest(request, response, requestUrl) {
                     return true;
                 }
 
+                await vendorContentJournal.flush();
+
                 sendJson(response, 200, {
                     announcements: vendorContentStore.toJSON().announcements,
                     updated: update
@@ -137,7 +305,7 @@ async function handleApiRequest(request, response, requestUrl) {
         }
 
         try {
-            sendJson(response, 200, { vendors: await readVendors() });
+            sendCachedJson(request, response, await vendorProjection.get());
         } catch (error) {
             sendJson(response, 500, { error: error.message });
         }
@@ -167,12 +335,69 @@ function getStaticFilePath(pathname) {
     return filePath;
 }
 
+async function readContentBundleBody(etag, gzip) {
+    if (contentBundleBodies?.etag !== etag) {
+        contentBundleBodies = { etag };
+    }
+
+    const encoding = gzip ? 'gzip' : 'identity';
+    contentBundleBodies[encoding] ??= await fs.readFile(gzip ? `${contentBundlePath}.gz` : contentBundlePath);
+    return contentBundleBodies[encoding];
+}
+
+// Boot content is one revalidated request, sent precompressed when the client accepts gzip.
+async function serveContentBundle(request, response) {
+    let manifest;
+    try {
+        manifest = await contentBundleManifest.get();
+    } catch {
+        sendJson(response, 404, { error: 'Content bundle has not been built' });
+        return;
+    }
+
+    const gzip = acceptsGzip(request.headers['accept-encoding']);
+    // Weak, because the gzip and identity bodies share it.
+    const etag = `W/${manifest.etag}`;
+    const headers = {
+        'Content-Type': 'application/x-ndjson; charset=utf-8',
+        'Cache-Control': REVALIDATE_CACHE_CONTROL,
+        ETag: etag,
+        Vary: 'Accept-Encoding'
+    };
+
+    if (requestMatchesEtag(request.headers['if-none-match'], etag)) {
+        response.writeHead(304, headers);
+        response.end();
+        return;
+    }
+
+    let body;
+    try {
+        body = await readContentBundleBody(etag, gzip);
+    } catch {
+        sendJson(response, 404, { error: 'Not found' });
+        return;
+    }
+
+    response.writeHead(200, {
+        ...headers,
+        ...(gzip ? { 'Content-Encoding': 'gzip' } : {}),
+        'Content-Length': body.length
+    });
+    response.end(request.method === 'HEAD' ? undefined : body);
+}
+
 async function serveStaticFile(request, response, requestUrl) {
     if (request.method !== 'GET' && request.method !== 'HEAD') {
         sendMethodNotAllowed(response);
         return;
     }
 
+    if (requestUrl.pathname === CONTENT_BUNDLE_PATHNAME) {
+        await serveContentBundle(request, response);
+        return;
+    }
+
     let filePath;
     try {
         filePath = getStaticFilePath(requestUrl.pathname);
@@ -214,6 +439,9 @@ const server = http.createServer((request, response) => {
     });
 });
 
+const { revision, replayed } = await vendorContentJournal.open(vendorContentStore);
+console.log(`Restored live vendor content at revision ${revision} (${replayed} journal records replayed)`);
+
 server.listen(port, host, () => {
     console.log(`TileTest live server listening at http://${host}:${port}`);
     console.log(`Dashboard available at http://${host}:${port}/dashboard`);
@@ -0,0 +1,122 @@
+import { createHash } from 'node:crypto';
+import fs from 'node:fs/promises';
+
+export const REVALIDATE_CACHE_CONTROL = 'no-cache';
+
+export function createStrongEtag(body) {
+    return `"${createHash('sha256').update(body).digest('base64url').slice(0, 32)}"`;
+}
+
+// If-None-Match uses weak comparison, so W/"x" matches "x".
+export function requestMatchesEtag(ifNoneMatch, etag) {
+    if (!ifNoneMatch || !etag) {
+        return false;
+    }
+
+    if (ifNoneMatch.trim() === '*') {
+        return true;
+    }
+
+    const strongEtag = etag.replace(/^W\//, '');
+    return ifNoneMatch
+        .split(',')
+        .some(candidate => candidate.trim().replace(/^W\//, '') === strongEtag);
+}
+
+function createCachedBody(payload) {
+    const body = JSON.stringify(payload);
+    return { body, etag: createStrongEtag(body) };
+}
+
+// Serializes a store snapshot once per store revision instead of once per request.
+export class RevisionedJsonCache {
+    constructor(getRevision, getPayload) {
+        this.getRevision = getRevision;
+        this.getPayload = getPayload;
+        this.revision = null;
+        this.entry = null;
+    }
+
+    get() {
+        const revision = this.getRevision();
+        if (this.entry === null || revision !== this.revision) {
+            this.entry = createCachedBody(this.getPayload());
+            this.revision = revision;
+        }
+
+        return this.entry;
+    }
+}
+
+// Keeps a projection of a JSON file in memory and reloads it only when the
+// file's mtime or size changes. Stat calls are coalesced to one per interval
+// so bursts of polling clients do not each touch the disk.
+export class CachedJsonFileProjection {
+    constructor(filePath, project, {
+        statIntervalMs = 1000,
+        now = Date.now,
+        fsImpl = fs
+    } = {}) {
+        this.filePath = filePath;
+        this.project = project;
+        this.statIntervalMs = statIntervalMs;
+        this.now = now;
+        this.fsImpl = fsImpl;
+        this.entry = null;
+        this.fileSignature = null;
+        this.checkedAt = -Infinity;
+        this.pending = null;
+    }
+
+    invalidate() {
+        this.entry = null;
+        this.fileSignature = null;
+        this.checkedAt = -Infinity;
+    }
+
+    async get() {
+        if (this.entry && this.now() - this.checkedAt < this.statIntervalMs) {
+            return this.entry;
+        }
+
+        if (!this.pending) {
+            this.pending = this.refresh().finally(() => {
+                this.pending = null;
+            });
+        }
+
+        return this.pending;
+    }
+
+    async refresh() {
+        const stats = await this.fsImpl.stat(this.filePath);
+        const fileSignature = `${stats.mtimeMs}:${stats.size}`;
+        this.checkedAt = this.now();
+
+        if (this.entry && fileSignature === this.fileSignature) {
+            return this.entry;
+        }
+
+        const fileText = await this.fsImpl.readFile(this.filePath, 'utf8');
+        this.entry = createCachedBody(this.project(JSON.parse(fileText)));
+        this.fileSignature = fileSignature;
+        return this.entry;
+    }
+}
+
+// True when Accept-Encoding lists gzip (or *) without refusing it with q=0.
+export function acceptsGzip(acceptEncoding) {
+    if (!acceptEncoding) {
+        return false;
+    }
+
+    return acceptEncoding.split(',').some((entry) => {
+        const [coding, ...parameters] = entry.trim().toLowerCase().split(';');
+        if (coding.trim() !== 'gzip' && coding.trim() !== '*') {
+            return false;
+        }
+
+        const quality = parameters.map(parameter => parameter.trim()).find(parameter => parameter.startsWith('q='));
+        return !quality || Number.parseFloat(quality.slice(2)) > 0;
+    });
+}
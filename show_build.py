@@ -0,0 +1,316 @@
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import improve_facts
+import improve_items
+import update_farewells
+from content_cache import load_json
+from content_integrity import check_content_integrity
+from content_model import Dialog, Vendor, save_vendors, shared_items
+from convert_vendors import DEFAULT_RESPONSES, convert_vendor_rows, read_vendor_rows
+
+# Batch build for several shows from one definitions file:
+#
+#   [{"name": "vcf-midwest", "vendors": "ret.xlsx", "map": "assets/map.json",
+#     "trails": "discovery_trails.json", "output": "build/vcf-midwest"}, ...]
+#
+# "vendors" is an exhibitor workbook/TSV export (converted first) or an
+# existing vendors JSON file. Enrichment only fills in what a vendor lacks:
+# items, trivia facts, and a technology domain when it has none, and a farewell
+# line when its dialog still ends with the converter's stock farewell. Curated
+# values in a vendors JSON source are kept as written.
+#
+# Enrichment depends only on a vendor's normalized name and description plus
+# the category tables, so results are shared through classification_cache.json
+# keyed by that text and a hash of the tables: an exhibitor at five shows is
+# classified once, and editing a table or technology_domains.json reclassifies
+# everyone. Each result is drawn from a random generator seeded by its key, so
+# the same exhibitor gets the same content at every show.
+#
+# Sources are read and shows written in a process pool; classification runs
+# once in between over the exhibitors of all shows, against one shared
+# technology_domains.json.
+
+DEFAULT_CACHE_PATH = 'classification_cache.json'
+DEFAULT_DOMAINS_PATH = 'technology_domains.json'
+DEFAULT_DOMAIN_ID = 'hardware'
+ENRICHMENT_VERSION = 2
+TABLE_MODULES = (improve_items, improve_facts, update_farewells)
+STOCK_FAREWELL = (DEFAULT_RESPONSES[-1]['text'], DEFAULT_RESPONSES[-1]['action'])
+
+
+class ShowDefinitionError(Exception):
+    pass
+
+
+def normalize_vendor_text(text):
+    return ' '.join(str(text or '').lower().split())
+
+
+def get_vendor_text(vendor):
+    return normalize_vendor_text(vendor.get('name')), normalize_vendor_text(vendor.get('description'))
+
+
+def get_table_version(domains):
+    """Hash of every table enrichment reads, so any edit invalidates the cache"""
+    digest = hashlib.sha256(f'enrichment:{ENRICHMENT_VERSION}'.encode('utf-8'))
+    for module in TABLE_MODULES:
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    digest.update(json.dumps(domains, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+
+def get_classification_key(name, description, table_version):
+    digest = hashlib.sha256(f'{table_version}\n{name}\n{description}'.encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+
+@lru_cache(maxsize=None)
+def get_keyword_pattern(keyword):
+    """Match keyword as a whole word or phrase, so 'nes' never hits inside 'business'"""
+    return re.compile(r'(?<!\w)' + re.escape(normalize_vendor_text(keyword)) + r'(?!\w)')
+
+
+def classify_domain(name, description, domains, default_domain_id=DEFAULT_DOMAIN_ID):
+    """Return the id of the domain with the most keyword hits in the vendor text"""
+    text = f'{name} {description}'
+    best_id, best_hits = None, 0
+    for domain in domains:
+        hits = sum(1 for keyword in domain.get('keywords') or () if get_keyword_pattern(keyword).search(text))
+        if hits > best_hits:
+            best_id, best_hits = domain['id'], hits
+
+    if best_id is None:
+        domain_ids = [domain['id'] for domain in domains]
+        best_id = default_domain_id if default_domain_id in domain_ids else (domain_ids[0] if domain_ids else None)
+    return best_id
+
+
+def enrich_vendor(name, description, domains, key):
+    """Classify one normalized vendor text into its generated content"""
+    rng = random.Random(key)
+    items = improve_items.get_specific_items_for_vendor(name, description, rng)
+    facts = improve_facts.select_tech_facts(description, name, rng)
+    farewell_category = update_farewells.categorize_vendor(description, items, name)
+    return {
+        'domain_id': classify_domain(name, description, domains),
+        'items': [dict(item) for item in items],
+        'facts': list(facts),
+        'farewell': rng.choice(update_farewells.get_farewell_messages(farewell_category))
+    }
+
+
+class ClassificationCache:
+    """JSON file of enrichment results for one table version"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        self.table_version = None
+        self.entries = {}
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.table_version = data.get('tables')
+            self.entries = data.get('entries') or {}
+
+    def use_table_version(self, table_version):
+        if table_version != self.table_version:
+            self.table_version = table_version
+            self.entries = {}
+
+    def save(self):
+        if not self.path:
+            return
+
+        temp_path = f'{self.path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'tables': self.table_version, 'entries': self.entries}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+
+def classify_vendors(vendor_lists, domains, cache=None):
+    """Enrich every distinct vendor text across shows; return ({key: result}, keys per show, counts)"""
+    cache = cache if cache is not None else ClassificationCache(None)
+    table_version = get_table_version(domains)
+    cache.use_table_version(table_version)
+    counts = {'vendors': 0, 'unique': 0, 'computed': 0, 'cached': 0}
+    results = {}
+    keys_per_show = []
+
+    for vendors in vendor_lists:
+        keys = []
+        for vendor in vendors:
+            name, description = get_vendor_text(vendor)
+            key = get_classification_key(name, description, table_version)
+            keys.append(key)
+            counts['vendors'] += 1
+            if key in results:
+                continue
+
+            if key in cache.entries:
+                counts['cached'] += 1
+            else:
+                cache.entries[key] = enrich_vendor(name, description, domains, key)
+                counts['computed'] += 1
+            results[key] = cache.entries[key]
+        keys_per_show.append(keys)
+
+    counts['unique'] = len(results)
+    return results, keys_per_show, counts
+
+
+def apply_enrichment(vendor, index, enrichment):
+    """Fill in the enrichment fields the vendor does not already have"""
+    if not vendor.items:
+        vendor.set_items(shared_items(enrichment['items']), f'item_{index}_')
+    if not vendor.facts:
+        vendor.set_facts(enrichment['facts'])
+    if not vendor.domain_id:
+        vendor.domain_id = enrichment['domain_id']
+
+    # Dialogs share their response lists, so replace the dialog instead of editing it.
+    dialog = vendor.dialog
+    if isinstance(dialog, Dialog) and dialog.responses and dialog.responses[-1] == STOCK_FAREWELL:
+        vendor.dialog = dialog.with_response_text('end', enrichment['farewell'])
+    return vendor
+
+
+def resolve_path(base_dir, path):
+    return path if path is None or os.path.isabs(path) else os.path.normpath(os.path.join(base_dir, path))
+
+
+def read_show_definitions(path):
+    """Load show definitions with paths resolved against the definitions file"""
+    data = load_json(path)
+    shows = data.get('shows') if isinstance(data, dict) else data
+    if not isinstance(shows, list) or not shows:
+        raise ShowDefinitionError(f'{path} does not list any shows.')
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    definitions = []
+    names = set()
+    for position, show in enumerate(shows):
+        name = show.get('name') if isinstance(show, dict) else None
+        if not name or not show.get('vendors'):
+            raise ShowDefinitionError(f'{path}[{position}] needs a "name" and a "vendors" source.')
+        if name in names:
+            raise ShowDefinitionError(f'{path}[{position}] repeats show name "{name}".')
+        names.add(name)
+
+        definitions.append({
+            'name': name,
+            'vendors': resolve_path(base_dir, show['vendors']),
+            'sheet': show.get('sheet'),
+            'map': resolve_path(base_dir, show.get('map')),
+            'trails': resolve_path(base_dir, show.get('trails')),
+            'output': resolve_path(base_dir, show.get('output') or os.path.join('build', name))
+        })
+    return definitions
+
+
+def read_show_vendors(show):
+    """Return a show's vendors as dicts, converting exhibitor rows when needed"""
+    if show['vendors'].lower().endswith('.json'):
+        return load_json(show['vendors'])
+
+    rows = read_vendor_rows(show['vendors'], show['sheet'])
+    return [vendor.to_dict() for vendor in convert_vendor_rows(rows, placeholders=False)]
+
+
+def write_show(show, vendor_dicts, enrichments, domains, domains_path):
+    """Write one show's enriched content and return its summary"""
+    os.makedirs(show['output'], exist_ok=True)
+    vendors = [
+        apply_enrichment(Vendor.from_dict(vendor), index, enrichment)
+        for index, (vendor, enrichment) in enumerate(zip(vendor_dicts, enrichments))
+    ]
+    save_vendors(vendors, os.path.join(show['output'], 'vendors.json'), ensure_ascii=False)
+    shutil.copyfile(domains_path, os.path.join(show['output'], 'technology_domains.json'))
+
+    trails = []
+    if show['trails']:
+        trails = load_json(show['trails'])
+        shutil.copyfile(show['trails'], os.path.join(show['output'], 'discovery_trails.json'))
+    if show['map']:
+        shutil.copyfile(show['map'], os.path.join(show['output'], os.path.basename(show['map'])))
+
+    report = check_content_integrity([vendor.to_dict() for vendor in vendors], domains, trails).to_dict()
+    return {
+        'name': show['name'],
+        'output': show['output'],
+        'vendors': len(vendors),
+        'ok': report['ok'],
+        'errors': report['errors'],
+        'warnings': report['warnings']
+    }
+
+
+def write_show_task(args):
+    return write_show(*args)
+
+
+def map_tasks(function, tasks, jobs):
+    if jobs <= 1 or len(tasks) <= 1:
+        return [function(task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+        return list(executor.map(function, tasks))
+
+
+def build_shows(shows, domains_path=DEFAULT_DOMAINS_PATH, cache=None, jobs=None):
+    """Build every show, sharing classification across them; return (summaries, counts)"""
+    jobs = jobs or os.cpu_count() or 1
+    domains = load_json(domains_path)
+    vendor_lists = map_tasks(read_show_vendors, shows, jobs)
+    results, keys_per_show, counts = classify_vendors(vendor_lists, domains, cache)
+
+    tasks = [
+        (show, vendors, [results[key] for key in keys], domains, domains_path)
+        for show, vendors, keys in zip(shows, vendor_lists, keys_per_show)
+    ]
+    return map_tasks(write_show_task, tasks, jobs), counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build vendor content for several shows at once.')
+    parser.add_argument('shows', nargs='?', default='shows.json', help='JSON list of show definitions')
+    parser.add_argument('--domains', default=DEFAULT_DOMAINS_PATH)
+    parser.add_argument('--only', action='append', help='build only the named show (repeatable)')
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH, help='classification cache file ("" to disable)')
+    parser.add_argument('--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    try:
+        shows = read_show_definitions(args.shows)
+    except ShowDefinitionError as error:
+        parser.error(str(error))
+    if args.only:
+        unknown = set(args.only) - {show['name'] for show in shows}
+        if unknown:
+            parser.error(f'Unknown show: {", ".join(sorted(unknown))}')
+        shows = [show for show in shows if show['name'] in args.only]
+
+    cache = ClassificationCache(args.cache or None)
+    summaries, counts = build_shows(shows, args.domains, cache, args.jobs)
+    cache.save()
+
+    for summary in summaries:
+        status = 'ok' if summary['ok'] else f"{summary['errors']} integrity errors"
+        print(f"{summary['name']}: {summary['vendors']} vendors -> {summary['output']} ({status})")
+    print(f"Classified {counts['unique']} distinct exhibitors across {counts['vendors']} vendors: "
+          f"{counts['computed']} computed, {counts['cached']} cached.")
+
+    sys.exit(0 if all(summary['ok'] for summary in summaries) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import { describe, expect, it } from 'vitest';
+
+import CONFIG from '../../config.js';
+import { normalizeSearchText, VendorSearchIndex } from '../../vendorSearchIndex.js';
+import { loadJson } from './testUtils.js';
+
+describe('vendor search index content', () => {
+    const vendors = loadJson(`${CONFIG.CONTENT.VENDORS}${CONFIG.PATHS.JSON_EXTENSION}`);
+    const searchIndex = new VendorSearchIndex(loadJson('vendor_search_index.json'));
+
+    it('indexes every vendor in vendors.json order', () => {
+        expect(searchIndex.vendors.map(([id]) => id)).toEqual(vendors.map(vendor => vendor.id));
+    });
+
+    it('finds every vendor by name and booth', () => {
+        for (const vendor of vendors) {
+            const nameMatches = searchIndex.search(vendor.name).map(match => match.id);
+            const boothMatches = searchIndex.search(vendor.booth).map(match => match.id);
+
+            if (normalizeSearchText(vendor.name)) {
+                expect(nameMatches, `${vendor.id} name`).toContain(vendor.id);
+            }
+
+            if (normalizeSearchText(vendor.booth)) {
+                expect(boothMatches, `${vendor.id} booth`).toContain(vendor.id);
+            }
+        }
+    });
+});
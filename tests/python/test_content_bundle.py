@@ -0,0 +1,61 @@
+import gzip
+import json
+
+from conftest import REPO_ROOT
+from content_bundle import BUNDLE_FORMAT, build_bundle, decode_bundle, write_bundle
+
+SOURCES = (
+    ('discovery_trails', 'discovery_trails.json'),
+    ('vendors', 'vendors.json'),
+    ('technology_domains', 'technology_domains.json')
+)
+
+
+def load_sections():
+    sections = []
+    for name, file_name in SOURCES:
+        with open(REPO_ROOT / file_name, 'r', encoding='utf-8') as f:
+            sections.append((name, json.load(f)))
+    return sections
+
+
+def test_bundled_content_round_trips_in_first_paint_order():
+    sections = load_sections()
+    body = build_bundle(sections)
+    lines = body.decode('utf-8').splitlines()
+
+    assert json.loads(lines[0]) == {'format': BUNDLE_FORMAT, 'version': 1, 'sections': [name for name, _ in SOURCES]}
+    assert [json.loads(line)['name'] for line in lines[1:]] == [name for name, _ in SOURCES]
+    assert decode_bundle(body) == dict(sections)
+    # Repeated dialog lines, facts, and item text are stored once.
+    assert len(body) < len(json.dumps(dict(sections), separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+
+
+def test_strings_are_shared_across_sections_and_tildes_survive():
+    sections = [
+        ('first', {'a': 'shared text', 'b': '~5', 'c': '~'}),
+        ('second', ['shared text', '~shared', '~shared', 7, None, True])
+    ]
+    body = build_bundle(sections)
+    first, second = [json.loads(line) for line in body.decode('utf-8').splitlines()[1:]]
+
+    assert first['strings'] == ['shared text']
+    assert first['data'] == {'a': '~0', 'b': '~~5', 'c': '~~'}
+    assert second['strings'] == ['~shared']
+    assert second['data'][:3] == ['~0', '~1', '~1']
+    assert decode_bundle(body) == dict(sections)
+
+
+def test_writes_a_deterministic_gzip_variant_and_manifest(tmp_path):
+    sections = load_sections()
+    manifest = write_bundle(sections, tmp_path)
+    body = (tmp_path / 'content_bundle.json').read_bytes()
+    compressed = (tmp_path / 'content_bundle.json.gz').read_bytes()
+
+    assert gzip.decompress(compressed) == body
+    assert json.loads((tmp_path / 'content_bundle.manifest.json').read_text(encoding='utf-8')) == manifest
+    assert manifest['bytes'] == len(body)
+    assert manifest['gzipBytes'] == len(compressed)
+
+    assert write_bundle(sections, tmp_path) == manifest
+    assert (tmp_path / 'content_bundle.json.gz').read_bytes() == compressed
@@ -0,0 +1,70 @@
+import json
+import os
+
+import content_cache
+from content_cache import clear_cache, get_cache_path, load_json
+
+
+def write_json(path, value):
+    path.write_text(json.dumps(value), encoding='utf-8')
+
+
+def refuse_to_parse(text):
+    raise AssertionError('re-parsed JSON that should have come from the cache')
+
+
+def test_second_load_is_served_from_the_cache(tmp_path, monkeypatch):
+    source = tmp_path / 'vendors.json'
+    write_json(source, [{'id': 'v1', 'name': 'Vendor One'}])
+
+    assert load_json(source) == [{'id': 'v1', 'name': 'Vendor One'}]
+    assert os.path.exists(get_cache_path(source))
+
+    monkeypatch.setattr(content_cache.json, 'loads', refuse_to_parse)
+    assert load_json(source) == [{'id': 'v1', 'name': 'Vendor One'}]
+
+
+def test_changed_content_rebuilds_the_cache(tmp_path):
+    source = tmp_path / 'domains.json'
+    write_json(source, {'id': 'a'})
+    load_json(source)
+    stat = os.stat(source)
+
+    write_json(source, {'id': 'b'})
+    # Same size as before, so the content hash decides whether the cache is stale.
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_json(source) == {'id': 'b'}
+    assert load_json(source) == {'id': 'b'}
+
+
+def test_touched_file_reuses_the_cache_after_hashing(tmp_path, monkeypatch):
+    source = tmp_path / 'map.json'
+    write_json(source, {'layers': [1, 2, 3]})
+    load_json(source)
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    monkeypatch.setattr(content_cache.json, 'loads', refuse_to_parse)
+    assert load_json(source) == {'layers': [1, 2, 3]}
+
+    hashed = []
+    monkeypatch.setattr(content_cache, 'hash_file', lambda path: hashed.append(path))
+    assert load_json(source) == {'layers': [1, 2, 3]}
+    assert hashed == []
+
+
+def test_corrupt_or_disabled_cache_falls_back_to_json(tmp_path, monkeypatch):
+    source = tmp_path / 'trails.json'
+    write_json(source, ['x'])
+    load_json(source)
+
+    with open(get_cache_path(source), 'wb') as f:
+        f.write(b'not a cache')
+    assert load_json(source) == ['x']
+
+    monkeypatch.setenv('TILETEST_CONTENT_CACHE', '0')
+    write_json(source, ['y'])
+    assert load_json(source) == ['y']
+
+    assert clear_cache([source]) == 1
+    assert not os.path.exists(os.path.dirname(get_cache_path(source)))
@@ -0,0 +1,61 @@
+import json
+
+from conftest import REPO_ROOT
+from content_integrity import check_content_integrity
+
+
+def load(name):
+    with open(REPO_ROOT / name, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def issue_codes(report):
+    return sorted((issue['code'], issue['file'], issue['path']) for issue in report.issues)
+
+
+def test_bundled_content_has_no_integrity_errors():
+    report = check_content_integrity(
+        load('vendors.json'),
+        load('technology_domains.json'),
+        load('discovery_trails.json')
+    )
+
+    assert report.ok, report.issues
+    assert report.to_dict()['counts']['vendors'] == len(load('vendors.json'))
+
+
+def test_reports_broken_references_duplicates_and_orphans():
+    domains = [
+        {'id': 'gaming', 'name': 'Gaming', 'items': [{'name': 'Zapper'}, {'name': 'Zapper'}]},
+        {'id': 'calculators', 'name': 'Calculators', 'items': [{'name': 'HP-12C'}]},
+        {'id': 'gaming', 'name': 'Gaming again', 'items': []}
+    ]
+    vendors = [
+        {'id': '100', 'domain_id': 'gaming'},
+        {'id': '100', 'domain_id': 'gaming'},
+        {'id': '101', 'domain_id': 'amiga'}
+    ]
+    trails = [{
+        'id': 'starter',
+        'stops': [
+            {'id': 'first', 'vendorId': '100'},
+            {'id': 'second', 'vendorId': '404'},
+            {'id': 'first', 'vendorId': '101'}
+        ]
+    }]
+
+    report = check_content_integrity(vendors, domains, trails)
+    summary = report.to_dict()
+
+    assert not report.ok
+    assert issue_codes(report) == [
+        ('duplicate_id', 'discovery_trails.json', '[0].stops[2]'),
+        ('duplicate_id', 'technology_domains.json', '[2]'),
+        ('duplicate_id', 'vendors.json', '[1]'),
+        ('duplicate_item_name', 'technology_domains.json', '[0].items[1]'),
+        ('missing_domain', 'vendors.json', '[2].domain_id'),
+        ('orphaned_domain', 'technology_domains.json', '[1]'),
+        ('unreachable_trail_stop', 'discovery_trails.json', '[0].stops[1].vendorId')
+    ]
+    assert summary['warnings'] == 1
+    assert json.loads(json.dumps(summary)) == summary
@@ -0,0 +1,136 @@
+import json
+import random
+import tracemalloc
+
+from conftest import REPO_ROOT
+from content_model import Dialog, Fact, Item, Vendor, load_domains, load_vendors, save_vendors
+from convert_vendors import convert_vendor_rows
+from improve_facts import get_tech_facts_for_category
+from populate_items import get_items_for_vendor, populate_vendor_items
+
+VENDOR_COUNT = 100_000
+TITLES = [
+    'Commodore 64 repairs and software',
+    'Apple II expansion cards',
+    'Atari 8-bit homebrew',
+    'Vintage PC parts',
+    'Retro gaming consoles'
+]
+LEGACY_RESPONSES = [
+    {'text': 'Show me your inventory', 'action': 'show_items'},
+    {'text': 'Tell me about your booth', 'action': 'booth_info'},
+    {'text': 'Share some tech facts', 'action': 'tech_facts'},
+    {'text': "Thanks, I'll check other vendors", 'action': 'end'}
+]
+
+
+def make_rows(count):
+    return [
+        {'ID': str(i), 'NAME': f'Exhibitor {i}', 'LOC': f'A{i % 100:02d}', 'URL': 'None', 'TITLE': TITLES[i % len(TITLES)]}
+        for i in range(count)
+    ]
+
+
+def build_legacy_dicts(rows, facts_pool):
+    # The dict-per-vendor shape the pipeline scripts produced before the model.
+    vendors = []
+    for i, row in enumerate(rows):
+        vendor = {
+            'id': row['ID'],
+            'name': row['NAME'],
+            'booth': row['LOC'],
+            'url': '',
+            'description': row['TITLE'],
+            'x': 0,
+            'y': 0,
+            'dialog': {
+                'greeting': f"Welcome to {row['NAME']}! {row['TITLE']}",
+                'responses': [dict(response) for response in LEGACY_RESPONSES]
+            },
+            'puzzle_items': [],
+            'puzzle_dialog': {}
+        }
+        vendor['items'] = [
+            {'id': f'item_{i}_{j + 1}', 'name': item['name'], 'description': item['description'], 'value': item['value']}
+            for j, item in enumerate(get_items_for_vendor(vendor['name'], vendor['description']))
+        ]
+        vendor['facts'] = random.sample(facts_pool, 3)
+        vendors.append(vendor)
+    return vendors
+
+
+def build_model_vendors(rows, facts_pool):
+    vendors = populate_vendor_items(convert_vendor_rows(rows, placeholders=False))
+    for vendor in vendors:
+        vendor.set_facts(random.sample(facts_pool, 3))
+    return vendors
+
+
+def measure_peak(build, rows, facts_pool):
+    tracemalloc.start()
+    try:
+        result = build(rows, facts_pool)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def test_vendors_and_domains_round_trip_unchanged(tmp_path):
+    vendors = load_vendors(REPO_ROOT / 'vendors.json')
+    save_vendors(vendors, tmp_path / 'vendors.json')
+
+    assert (tmp_path / 'vendors.json').read_text(encoding='utf-8') == (REPO_ROOT / 'vendors.json').read_text(encoding='utf-8')
+
+    with open(REPO_ROOT / 'technology_domains.json', 'r', encoding='utf-8') as f:
+        domain_dicts = json.load(f)
+    assert [domain.to_dict() for domain in load_domains(REPO_ROOT / 'technology_domains.json')] == domain_dicts
+
+
+def test_template_content_is_shared_by_reference():
+    vendors = populate_vendor_items([
+        Vendor('1', 'First', description='Commodore 64 repairs', dialog=Dialog('Hi', LEGACY_RESPONSES)),
+        Vendor('2', 'Second', description='More Commodore 64 parts', dialog=Dialog('Hello', LEGACY_RESPONSES))
+    ])
+    vendors[0].set_facts(['The C64 shipped in 1982.'])
+    vendors[1].set_facts(['The C64 shipped in 1982.'])
+
+    assert all(left is right for left, right in zip(vendors[0].items, vendors[1].items))
+    assert vendors[0].facts[0] is vendors[1].facts[0] is Fact.shared('The C64 shipped in 1982.')
+    assert vendors[0].dialog.responses is vendors[1].dialog.responses
+    assert vendors[1].to_dict()['items'][0]['id'] == 'item_1_1'
+
+    vendors[0].dialog = vendors[0].dialog.with_response_text('end', 'Bye!')
+    assert vendors[0].to_dict()['dialog']['responses'][-1]['text'] == 'Bye!'
+    assert vendors[1].to_dict()['dialog']['responses'][-1]['text'] == "Thanks, I'll check other vendors"
+
+
+def test_only_the_last_end_response_is_rewritten_and_item_extras_survive():
+    dialog = Dialog('Hi', [{'text': 'Leave early', 'action': 'end'}, *LEGACY_RESPONSES])
+    responses = dialog.with_response_text('end', 'Bye!').to_dict()['responses']
+    assert [response['text'] for response in responses] == ['Leave early'] + [
+        response['text'] for response in LEGACY_RESPONSES[:-1]
+    ] + ['Bye!']
+    assert dialog.with_response_text('show_items', 'Look!') is dialog
+
+    vendor = Vendor.from_dict({'id': '1', 'name': 'First', 'items': [
+        {'id': 'item_1_1', 'name': 'Disk', 'description': 'A disk', 'value': 5, 'rarity': 'rare'},
+        {'id': 'item_1_2', 'name': 'Disk', 'description': 'A disk', 'value': 5}
+    ]})
+    assert vendor.items[0] is not vendor.items[1]
+    assert vendor.items[0] is Item.shared('Disk', 'A disk', 5, rarity='rare')
+    assert vendor.to_dict()['items'][0] == {
+        'id': 'item_1_1', 'name': 'Disk', 'description': 'A disk', 'value': 5, 'rarity': 'rare'
+    }
+
+
+def test_model_build_peak_memory_is_several_fold_smaller():
+    rows = make_rows(VENDOR_COUNT)
+    facts_pool = get_tech_facts_for_category('general')
+
+    legacy_vendors, legacy_peak = measure_peak(build_legacy_dicts, rows, facts_pool)
+    del legacy_vendors
+    model_vendors, model_peak = measure_peak(build_model_vendors, rows, facts_pool)
+
+    assert len(model_vendors) == VENDOR_COUNT
+    assert model_peak * 3 < legacy_peak
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from http_response import read_response
+
+
+def read(raw, method='GET', max_body_bytes=None):
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        response, reusable = await read_response(reader, method, max_body_bytes)
+        return response, reusable, await reader.read()
+
+    return asyncio.run(run())
+
+
+def test_reads_chunked_and_sized_bodies_up_to_the_next_response():
+    response, reusable, rest = read(
+        b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+        b'5\r\nhello\r\n6;ext=1\r\n world\r\n0\r\nX-Trailer: 1\r\n\r\n'
+        b'HTTP/1.1 204 No Content\r\n\r\n'
+    )
+    assert (response.status, response.body, reusable) == (200, b'hello world', True)
+    assert rest == b'HTTP/1.1 204 No Content\r\n\r\n'
+
+    response, reusable, _ = read(b'HTTP/1.1 404 Not Found\r\nContent-Length: 4\r\nConnection: close\r\n\r\nnope')
+    assert (response.status, response.headers['content-length'], response.body, reusable) == (404, '4', b'nope', False)
+
+
+def test_head_responses_have_no_body_and_oversized_bodies_are_not_read():
+    response, reusable, rest = read(b'HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\n', method='HEAD')
+    assert (response.body, reusable, rest) == (b'', True, b'')
+
+    response, reusable, _ = read(b'HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\n0123456789', max_body_bytes=4)
+    assert (response.body, reusable) == (None, False)
+
+    response, reusable, _ = read(b'HTTP/1.1 200 OK\r\n\r\nuntil close')
+    assert (response.body, reusable) == (None, False)
+
+
+@pytest.mark.parametrize('status_line', [b'garbage\r\n', b'HTTP/1.1\r\n', b'HTTP/1.1 abc OK\r\n'])
+def test_unparsable_status_lines_raise_value_error(status_line):
+    with pytest.raises(ValueError, match='Malformed status line'):
+        read(status_line + b'\r\n')
@@ -0,0 +1,88 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from load_test import is_local_host, percentile, run_load
+
+
+class StandInServer(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def respond(self, status, payload=None, headers=None):
+        body = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/api/vendors':
+            self.respond(200, {'vendors': [{'id': 7}]})
+        elif self.path == '/api/vendor-content':
+            if self.headers.get('If-None-Match') == '"r1"':
+                self.respond(304, headers={'ETag': '"r1"'})
+            else:
+                self.respond(200, {'revision': 1, 'vendors': []}, {'ETag': '"r1"'})
+        else:
+            self.respond(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        self.server.posts.append(json.loads(self.rfile.read(int(self.headers['Content-Length']))))
+        self.respond(200, {})
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StandInServer)
+    httpd.connections = 0
+    httpd.posts = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+
+    assert percentile(values, 0.50) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([5], 0.95) == 5
+    assert percentile([], 0.5) is None
+
+
+def test_only_loopback_hosts_are_local():
+    assert is_local_host('localhost')
+    assert is_local_host('127.0.0.1')
+    assert is_local_host('::1')
+    assert not is_local_host('example.com')
+
+
+def test_reports_per_endpoint_stats_over_reused_connections(server):
+    report = asyncio.run(run_load(
+        f'http://127.0.0.1:{server.server_address[1]}',
+        clients=4, writers=1, duration=0.6, poll_interval=0.1, write_interval=0.1,
+        assets=['/missing.js'], ramp_up=0.0
+    ))
+
+    endpoints = report['endpoints']
+    assert endpoints['GET /api/vendors']['requests'] == 4
+    assert endpoints['GET /missing.js (static)']['errorRate'] == 1.0
+    polls = endpoints['GET /api/vendor-content']
+    assert polls['statuses']['200'] == 4 and polls['statuses']['304'] >= 4
+    assert polls['latencyMs']['p50'] <= polls['latencyMs']['p99']
+    assert server.posts and server.posts[0]['vendorId'] == '7'
+    assert report['connectionsOpened'] == server.connections == 5
@@ -0,0 +1,62 @@
+import json
+
+from conftest import REPO_ROOT
+from map_chunker import chunk_map, write_chunks
+
+
+def make_map(width, height, tables):
+    return {
+        'width': width,
+        'height': height,
+        'tilewidth': 16,
+        'tileheight': 16,
+        'tilesets': [{
+            'name': 'tiles',
+            'firstgid': 1,
+            'tiles': [{'id': 3, 'objectgroup': {'objects': [{'x': 2, 'y': 8, 'width': 12, 'height': 8}]}}]
+        }],
+        'layers': [
+            {'name': 'floor', 'type': 'tilelayer', 'data': [1] * (width * height)},
+            {'name': 'tables', 'type': 'tilelayer', 'data': tables},
+            {'name': 'player', 'type': 'objectgroup', 'objects': [{'name': 'start', 'point': True, 'x': 40, 'y': 40}]}
+        ]
+    }
+
+
+def test_splits_layers_objects_and_collision_rects_into_chunks():
+    width, height = 5, 3
+    tables = [0] * (width * height)
+    tables[1 * width + 4] = 4
+    manifest, chunks = chunk_map(make_map(width, height, tables), chunk_size=2)
+
+    assert (manifest['columns'], manifest['rows']) == (3, 2)
+    assert 'data' not in manifest['map']['layers'][0]
+    assert [layer.get('chunkedTileIds') for layer in manifest['map']['layers']] == [[1], [4], None]
+    assert [entry['key'] for entry in manifest['chunks']] == ['0_0', '1_0', '2_0', '0_1', '1_1', '2_1']
+
+    edge = next(entry for entry in manifest['chunks'] if entry['key'] == '2_0')
+    assert (edge['width'], edge['height']) == (1, 2)
+    assert edge['pixelBounds'] == {'x': 64, 'y': 0, 'width': 16, 'height': 32}
+    assert edge['collisionRects'] == [{'x': 66, 'y': 24, 'width': 12, 'height': 8, 'layer': 'tables'}]
+    assert chunks[edge['file']]['layers']['tables'] == [0, 4]
+
+    assert chunks['chunk_1_1.json']['objects'] == {'player': [{'name': 'start', 'point': True, 'x': 40, 'y': 40}]}
+    assert chunks['chunk_0_1.json']['layers']['floor'] == [1, 1]
+
+
+def test_chunks_reassemble_into_the_original_festival_floor(tmp_path):
+    with open(REPO_ROOT / 'assets' / 'map.tmj', 'r', encoding='utf-8') as f:
+        map_data = json.load(f)
+
+    manifest, chunks = chunk_map(map_data, chunk_size=32)
+    write_chunks(manifest, chunks, tmp_path)
+
+    width = map_data['width']
+    for layer in (layer for layer in map_data['layers'] if layer['type'] == 'tilelayer'):
+        rebuilt = [0] * len(layer['data'])
+        for entry in manifest['chunks']:
+            with open(tmp_path / entry['file'], 'r', encoding='utf-8') as f:
+                tiles = json.load(f)['layers'][layer['name']]
+            for index, gid in enumerate(tiles):
+                rebuilt[(entry['y'] + index // entry['width']) * width + entry['x'] + index % entry['width']] = gid
+        assert rebuilt == layer['data']
@@ -0,0 +1,79 @@
+import copy
+import json
+
+import pytest
+
+from conftest import REPO_ROOT
+from map_patch import MapPatchError, apply_patch, diff_maps, find_tile_runs, get_map_hash
+
+
+def load_map():
+    with open(REPO_ROOT / 'assets' / 'map.json', 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def get_layer(map_data, name):
+    return next(layer for layer in map_data['layers'] if layer['name'] == name)
+
+
+def test_changed_tiles_become_merged_runs():
+    base = [0] * 20
+    target = list(base)
+    target[2] = 5
+    target[4] = 6
+    target[15] = 7
+    assert find_tile_runs(base, target, merge_gap=1) == [[2, [5, 0, 6]], [15, [7]]]
+    assert find_tile_runs(base, target, merge_gap=0) == [[2, [5]], [4, [6]], [15, [7]]]
+    assert find_tile_runs(base, base) == []
+
+
+def test_moving_a_table_costs_a_small_patch_that_round_trips():
+    base = load_map()
+    target = copy.deepcopy(base)
+    tables = get_layer(target, 'tables')['data']
+    first = next(index for index, gid in enumerate(tables) if gid)
+    tables[first + 3 * 30] = tables[first]
+    tables[first] = 0
+    get_layer(target, 'npc_area')['objects'][0]['x'] += 64
+
+    patch = diff_maps(base, target)
+
+    assert patch['base'] == get_map_hash(base)
+    assert [entry['id'] for entry in patch['layers']] == [
+        get_layer(base, 'tables')['id'], get_layer(base, 'npc_area')['id']
+    ]
+    assert 'changed' in patch['layers'][1]['objects']
+    assert len(json.dumps(patch)) < len(json.dumps(target)) // 20
+    assert apply_patch(base, patch) == target
+    assert diff_maps(base, base).keys() == {'version', 'base', 'target'}
+
+
+def test_structural_changes_replace_layers_and_reorder():
+    base = load_map()
+    target = copy.deepcopy(base)
+    removed = target['layers'].pop(0)
+    target['layers'].insert(0, target['layers'].pop())
+    get_layer(target, 'npc_area')['objects'].insert(0, {'id': 99, 'name': 'booth', 'x': 32, 'y': 32})
+    get_layer(target, 'tables')['width'] = 31
+    get_layer(target, 'tables')['data'].extend([0] * 20)
+    target['nextobjectid'] = 100
+
+    patch = diff_maps(base, target)
+
+    assert patch['removedLayers'] == [removed['id']]
+    assert patch['layerOrder'] == [layer['id'] for layer in target['layers']]
+    assert patch['fields'] == {'nextobjectid': 100}
+    assert any('replace' in entry for entry in patch['layers'])
+    assert apply_patch(base, patch) == target
+
+
+def test_patches_only_apply_to_their_base_revision():
+    base = load_map()
+    target = copy.deepcopy(base)
+    get_layer(target, 'floor')['data'][0] = 1
+    patch = diff_maps(base, target)
+
+    with pytest.raises(MapPatchError):
+        apply_patch(target, patch)
+    with pytest.raises(MapPatchError):
+        apply_patch(base, {**patch, 'version': 2})
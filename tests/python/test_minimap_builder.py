@@ -0,0 +1,84 @@
+import json
+
+import numpy as np
+
+from conftest import REPO_ROOT
+from minimap_builder import build_minimap, get_level_scales, write_minimap
+from png_io import read_png, slice_tiles, write_png
+
+
+def make_tileset_png(path):
+    # Two 4x4 tiles: solid red, then a green tile whose bottom half is transparent.
+    image = np.zeros((4, 8, 4), dtype=np.uint8)
+    image[:, :4] = (255, 0, 0, 255)
+    image[:2, 4:] = (0, 255, 0, 255)
+    write_png(path, image)
+
+
+def make_map():
+    return {
+        'width': 4,
+        'height': 2,
+        'tilewidth': 4,
+        'tileheight': 4,
+        'tilesets': [{'name': 'tiles', 'firstgid': 1, 'image': 'tiles.png', 'tilewidth': 4, 'tileheight': 4,
+                      'columns': 2, 'tilecount': 2}],
+        'layers': [
+            {'name': 'floor', 'type': 'tilelayer', 'data': [1, 1, 1, 0, 1, 1, 1, 0]},
+            {'name': 'tables', 'type': 'tilelayer', 'data': [0, 2, 0, 0, 0, 0, 0, 0]},
+            {'name': 'npc_area', 'type': 'objectgroup', 'objects': []}
+        ]
+    }
+
+
+def test_png_round_trip_and_bundled_tileset_decode(tmp_path):
+    image = np.random.default_rng(7).integers(0, 256, size=(9, 5, 4), dtype=np.uint8)
+    write_png(tmp_path / 'noise.png', image)
+
+    assert np.array_equal(read_png(tmp_path / 'noise.png'), image)
+    assert read_png(REPO_ROOT / 'assets' / 'tiles.png').shape == (512, 512, 4)
+
+
+def test_slices_tiles_with_margin_and_spacing_when_columns_are_not_given():
+    # 1px margin, 2x2 tiles, 1px spacing: a 3x2 grid fits in 1 + 2 + 1 + 2 + 1 + 2 wide.
+    image = np.zeros((6, 9, 4), dtype=np.uint8)
+    for index in range(6):
+        x, y = 1 + (index % 3) * 3, 1 + (index // 3) * 3
+        image[y:y + 2, x:x + 2] = index + 1
+
+    tiles = slice_tiles(image, {'tilewidth': 2, 'tileheight': 2, 'margin': 1, 'spacing': 1})
+
+    assert tiles.shape == (6, 2, 2, 4) and tiles.dtype == np.uint8
+    assert [int(tile[0, 0, 0]) for tile in tiles] == [1, 2, 3, 4, 5, 6]
+    assert all((tile == tile[0, 0, 0]).all() for tile in tiles)
+
+
+def test_level_scales_start_with_a_single_tile_overview():
+    assert get_level_scales({'width': 30, 'height': 20, 'tilewidth': 32, 'tileheight': 32}) == [8, 16, 32]
+    assert get_level_scales({'width': 4, 'height': 2, 'tilewidth': 4, 'tileheight': 4}, tile_size=8) == [2, 4]
+
+
+def test_renders_layers_markers_and_level_tiles(tmp_path):
+    make_tileset_png(tmp_path / 'tiles.png')
+    vendors = [{'id': '1', 'x': 14, 'y': 6, 'domain_id': 'gaming'}, {'id': '2', 'x': 999, 'y': 0}]
+    domains = [{'id': 'gaming'}]
+
+    manifest, images = build_minimap(make_map(), str(tmp_path), vendors, domains, levels=2, tile_size=8)
+
+    assert [level['pixelsPerTile'] for level in manifest['levels']] == [2, 4]
+    assert sorted(images) == ['0/0_0.png', '1/0_0.png', '1/1_0.png']
+
+    overview = images['0/0_0.png']
+    assert overview.shape == (4, 8, 4)
+    assert tuple(overview[2, 0]) == (255, 0, 0, 255)
+    # The green tile's transparent bottom half lets the red floor show through.
+    assert tuple(overview[0, 2]) == (0, 255, 0, 255)
+    assert tuple(overview[1, 2]) == (255, 0, 0, 255)
+    # Empty cells show the background; the in-bounds vendor is drawn in its domain colour.
+    assert tuple(overview[0, 6]) != (255, 0, 0, 255)
+    assert tuple(images['1/1_0.png'][6, 6]) == (239, 83, 80, 255)
+
+    write_minimap(manifest, images, str(tmp_path / 'minimap'))
+    with open(tmp_path / 'minimap' / 'minimap.json', 'r', encoding='utf-8') as f:
+        assert json.load(f)['levels'][1]['columns'] == 2
+    assert np.array_equal(read_png(tmp_path / 'minimap' / '1' / '1_0.png'), images['1/1_0.png'])
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+from conftest import REPO_ROOT
+from show_build import (
+    ClassificationCache,
+    ShowDefinitionError,
+    build_shows,
+    classify_domain,
+    classify_vendors,
+    read_show_definitions
+)
+
+STOCK_FAREWELL = "Thanks, I'll check other vendors"
+DOMAINS = [
+    {'id': 'commodore', 'keywords': ['commodore', 'c64']},
+    {'id': 'apple', 'keywords': ['apple', 'macintosh']},
+    {'id': 'hardware', 'keywords': ['soldering']}
+]
+
+
+def make_vendor(vendor_id, name, description, **fields):
+    return {
+        'id': vendor_id,
+        'name': name,
+        'description': description,
+        'dialog': {'greeting': f'Welcome to {name}!', 'responses': [{'text': STOCK_FAREWELL, 'action': 'end'}]},
+        **fields
+    }
+
+
+def write_json(path, value):
+    path.write_text(json.dumps(value), encoding='utf-8')
+    return path
+
+
+def test_domains_come_from_keyword_hits_with_a_fallback():
+    assert classify_domain('c64 corner', 'commodore and apple parts', DOMAINS) == 'commodore'
+    assert classify_domain('mac shack', 'apple macintosh repairs', DOMAINS) == 'apple'
+    assert classify_domain('odds and ends', 'assorted cables', DOMAINS) == 'hardware'
+
+
+def test_keywords_only_match_whole_words():
+    with open(REPO_ROOT / 'technology_domains.json', 'r', encoding='utf-8') as f:
+        domains = json.load(f)
+
+    assert classify_domain('book nook', 'used business books', domains) == 'hardware'
+    assert classify_domain('omega audio', 'speakers inside and out', domains) == 'hardware'
+    assert classify_domain('nes depot', 'cartridges', domains) == 'gaming'
+    assert classify_domain('vic corner', 'vic-20 carts', domains) == 'commodore'
+
+
+def test_an_exhibitor_at_several_shows_is_classified_once(tmp_path):
+    cache = ClassificationCache(str(tmp_path / 'cache.json'))
+    east = [make_vendor('1', 'Retro Rick', 'Commodore  C64 parts'), make_vendor('2', 'Mac Shack', 'Apple repairs')]
+    west = [make_vendor('9', 'retro rick', 'commodore c64 parts')]
+
+    results, keys_per_show, counts = classify_vendors([east, west], DOMAINS, cache)
+    assert counts == {'vendors': 3, 'unique': 2, 'computed': 2, 'cached': 0}
+    assert keys_per_show[0][0] == keys_per_show[1][0]
+    assert results[keys_per_show[0][0]]['domain_id'] == 'commodore'
+    cache.save()
+
+    reloaded = ClassificationCache(str(tmp_path / 'cache.json'))
+    _, _, counts = classify_vendors([west], DOMAINS, reloaded)
+    assert counts == {'vendors': 1, 'unique': 1, 'computed': 0, 'cached': 1}
+
+    # Any table change, including technology_domains.json, reclassifies everyone.
+    _, _, counts = classify_vendors([west], DOMAINS[:2], reloaded)
+    assert counts['computed'] == 1
+    assert counts['cached'] == 0
+
+
+def test_build_writes_each_show_with_shared_enrichment(tmp_path):
+    shared = make_vendor('7', 'Retro Rick', 'Commodore C64 parts')
+    curated = make_vendor(
+        '8', 'Mac Shack', 'Apple repairs', domain_id='hardware', facts=['Curated fact.'],
+        items=[{'id': 'mac_1', 'name': 'Curated item', 'description': 'Hand-picked', 'value': 9}],
+        dialog={'greeting': 'Hi!', 'responses': [{'text': 'See you at the Mac Shack', 'action': 'end'}]}
+    )
+    write_json(tmp_path / 'east.json', [shared, curated])
+    write_json(tmp_path / 'west.json', [make_vendor('7', 'Retro Rick', 'Commodore C64 parts')])
+    write_json(tmp_path / 'trails.json', [{'id': 'loop', 'stops': [{'id': 's', 'vendorId': '7'}]}])
+    domains_path = write_json(tmp_path / 'domains.json', [{**domain, 'name': domain['id']} for domain in DOMAINS])
+    shows_path = write_json(tmp_path / 'shows.json', {'shows': [
+        {'name': 'east', 'vendors': 'east.json', 'trails': 'trails.json', 'map': str(REPO_ROOT / 'assets' / 'map.json')},
+        {'name': 'west', 'vendors': 'west.json', 'output': 'out/west'}
+    ]})
+
+    shows = read_show_definitions(str(shows_path))
+    summaries, counts = build_shows(shows, str(domains_path), ClassificationCache(None), jobs=2)
+
+    assert [summary['name'] for summary in summaries] == ['east', 'west']
+    assert all(summary['ok'] for summary in summaries)
+    assert counts['unique'] == 2
+    east_dir = tmp_path / 'build' / 'east'
+    assert sorted(path.name for path in east_dir.iterdir()) == [
+        'discovery_trails.json', 'map.json', 'technology_domains.json', 'vendors.json'
+    ]
+
+    east = json.loads((east_dir / 'vendors.json').read_text(encoding='utf-8'))
+    west = json.loads((tmp_path / 'out' / 'west' / 'vendors.json').read_text(encoding='utf-8'))
+    assert {key: east[1][key] for key in curated} == curated
+    assert east[0]['domain_id'] == west[0]['domain_id'] == 'commodore'
+    assert east[0]['facts'] == west[0]['facts']
+    assert [item['name'] for item in east[0]['items']] == [item['name'] for item in west[0]['items']]
+    assert east[0]['dialog']['responses'][-1] == west[0]['dialog']['responses'][-1]
+    assert east[0]['dialog']['responses'][-1]['text'] != STOCK_FAREWELL
+
+
+def test_show_definitions_need_unique_names_and_a_source(tmp_path):
+    with pytest.raises(ShowDefinitionError):
+        read_show_definitions(str(write_json(tmp_path / 'shows.json', [{'name': 'a'}])))
+    with pytest.raises(ShowDefinitionError):
+        read_show_definitions(str(write_json(tmp_path / 'shows.json', [
+            {'name': 'a', 'vendors': 'a.json'}, {'name': 'a', 'vendors': 'b.json'}
+        ])))
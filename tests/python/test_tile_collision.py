@@ -0,0 +1,91 @@
+import json
+
+import numpy as np
+
+from conftest import REPO_ROOT
+from png_io import read_png, slice_tiles
+from tile_collision import (
+    CollisionCache,
+    apply_collision_rects,
+    collect_layer_tile_ids,
+    derive_collision_rects,
+    extract_tile_rects,
+    mask_to_rects,
+    read_tmx,
+    write_tmx,
+    write_tmx_collision
+)
+
+
+def load_map_tiles():
+    with open(REPO_ROOT / 'assets' / 'map.json', 'r', encoding='utf-8') as f:
+        map_data = json.load(f)
+    tileset = map_data['tilesets'][0]
+    return map_data, tileset, slice_tiles(read_png(REPO_ROOT / 'assets' / 'tiles.png'), tileset)
+
+
+def test_masks_become_exact_rects_or_a_bounding_box():
+    mask = np.zeros((8, 8), dtype=bool)
+    mask[2:6, 1:7] = True
+    assert mask_to_rects(mask) == [(1, 2, 6, 4)]
+
+    mask[6:8, 1:3] = True
+    assert mask_to_rects(mask) == [(1, 2, 6, 4), (1, 6, 2, 2)]
+
+    checkerboard = np.indices((8, 8)).sum(axis=0) % 2 == 0
+    assert mask_to_rects(checkerboard, max_rects=4) == [(0, 0, 8, 8)]
+    assert mask_to_rects(np.zeros((4, 4), dtype=bool)) == []
+
+
+def test_alpha_masks_reproduce_hand_authored_rects():
+    map_data, tileset, tiles = load_map_tiles()
+    authored = {
+        tile['id']: [(o['x'], o['y'], o['width'], o['height']) for o in tile['objectgroup']['objects']]
+        for tile in tileset['tiles']
+    }
+
+    # Tiles with transparent edges, e.g. top_left_collision at x=2, y=18, 30x14.
+    for tile_id in (3, 5, 6, 7, 17, 49):
+        assert extract_tile_rects(tiles[tile_id]) == authored[tile_id]
+
+    assert extract_tile_rects(tiles[18], band=(0, 0.8125)) == [(0, 0, 32, 26)]
+    assert collect_layer_tile_ids(map_data, tileset) >= {18, 19, 40, 49, 50}
+
+
+def test_cache_only_recomputes_new_or_repainted_tiles(tmp_path):
+    _, _, tiles = load_map_tiles()
+    cache = CollisionCache(str(tmp_path / 'cache.json'))
+
+    first, counts = derive_collision_rects(tiles, [3, 5, 6], cache)
+    assert counts == {'computed': 3, 'cached': 0}
+    cache.save()
+
+    repainted = tiles.copy()
+    repainted[6, :, :, 3] = 0
+    repainted[6, 4:8, 4:8, 3] = 255
+    second, counts = derive_collision_rects(repainted, [3, 5, 6], CollisionCache(str(tmp_path / 'cache.json')))
+    assert counts == {'computed': 1, 'cached': 2}
+    assert second[5] == first[5]
+    assert second[6] == [(4, 4, 4, 4)]
+
+
+def test_writes_rects_without_replacing_authored_shapes(tmp_path):
+    _, tileset, _ = load_map_tiles()
+    rects = {3: [(0, 16, 32, 10)], 200: [(1, 2, 3, 4)]}
+
+    assert apply_collision_rects(tileset, rects) == [200]
+    assert apply_collision_rects(tileset, rects, overwrite=True) == [3, 200]
+    assert [tile['id'] for tile in tileset['tiles']] == sorted(tile['id'] for tile in tileset['tiles'])
+    assert tileset['tiles'][-1]['objectgroup']['objects'][0]['name'] == 'auto_collision'
+
+    tree, tmx_map = read_tmx(REPO_ROOT / 'tile_test.tmx')
+    assert tmx_map['tilesets'][0]['tiles'][1]['objectgroup']['objects'] == [
+        {'x': 2.0, 'y': 18.0, 'width': 30.0, 'height': 14.0}
+    ]
+    write_tmx_collision(tree, 'tiles', rects, [200])
+    write_tmx(tree, tmp_path / 'out.tmx')
+
+    original = (REPO_ROOT / 'tile_test.tmx').read_text(encoding='utf-8')
+    written = (tmp_path / 'out.tmx').read_text(encoding='utf-8')
+    assert '<object id="1" name="auto_collision" x="1" y="2" width="3" height="4"/>' in written
+    assert len(written.splitlines()) == len(original.splitlines()) + 5
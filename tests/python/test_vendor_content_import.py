@@ -0,0 +1,104 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from vendor_content_import import BatchImportError, iter_batches, import_updates, read_updates
+
+
+class BatchHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        updates = json.loads(self.rfile.read(int(self.headers['Content-Length'])))['updates']
+        if updates[0]['vendorId'] == 'proxy-error':
+            body = b'<html><body>502 Bad Gateway</body></html>'
+            self.send_response(502)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        self.server.batches.append(updates)
+        rejected = [index for index, update in enumerate(updates) if update['vendorId'] == 'bad']
+        body = json.dumps({
+            'revision': len(self.server.batches),
+            'updated': len(updates) - len(rejected),
+            'rejected': rejected
+        }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), BatchHandler)
+    httpd.connections = 0
+    httpd.batches = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_reads_csv_and_json_updates(tmp_path):
+    csv_path = tmp_path / 'updates.csv'
+    csv_path.write_text(
+        'vendorId,announcements,featuredItems,clueText,descriptionOverride\n'
+        '100,Demo at 2 PM | Raffle at 4,Portable demo,,\n'
+        '101,,Joystick|Paddles,Find the red | blue booth,Amiga | Atari repairs\n'
+        ',orphan row,,,\n',
+        encoding='utf-8'
+    )
+    json_path = tmp_path / 'updates.json'
+    json_path.write_text(json.dumps({'vendors': [{'id': 7, 'descriptionOverride': 'Moved to hall B'}]}), encoding='utf-8')
+
+    assert read_updates(str(csv_path)) == ([{
+        'vendorId': '100',
+        'announcements': 'Demo at 2 PM\nRaffle at 4',
+        'featuredItems': 'Portable demo'
+    }, {
+        'vendorId': '101',
+        'featuredItems': 'Joystick\nPaddles',
+        'clueText': 'Find the red | blue booth',
+        'descriptionOverride': 'Amiga | Atari repairs'
+    }], 1)
+    assert read_updates(str(json_path)) == ([{'vendorId': '7', 'descriptionOverride': 'Moved to hall B'}], 0)
+
+
+def test_batches_respect_count_and_encoded_size():
+    updates = [{'vendorId': str(index), 'announcements': 'x' * 50} for index in range(10)]
+
+    assert [len(batch) for batch in iter_batches(updates, batch_size=4)] == [4, 4, 2]
+    small = list(iter_batches(updates, batch_size=100, max_bytes=200))
+    assert all(len(json.dumps({'updates': batch}, separators=(',', ':'))) <= 200 for batch in small)
+    assert sum(len(batch) for batch in small) == 10
+
+
+def test_streams_batches_over_one_connection(server):
+    updates = [{'vendorId': str(index), 'announcements': 'Doors at 9'} for index in range(25)]
+    updates[12] = {'vendorId': 'bad'}
+
+    summary = import_updates(updates, f'http://127.0.0.1:{server.server_address[1]}', batch_size=10)
+
+    assert [len(batch) for batch in server.batches] == [10, 10, 5]
+    assert server.connections == 1
+    assert summary == {'batches': 3, 'updated': 24, 'rejected': [12], 'revision': 3, 'connections': 1}
+
+
+def test_non_json_error_bodies_raise_batch_import_error(server):
+    with pytest.raises(BatchImportError, match='HTTP 502: <html>'):
+        import_updates([{'vendorId': 'proxy-error'}], f'http://127.0.0.1:{server.server_address[1]}')
@@ -0,0 +1,51 @@
+import json
+
+from conftest import REPO_ROOT
+from vendor_search_index import (
+    build_search_index,
+    decode_postings,
+    encode_postings,
+    search_vendors,
+)
+
+VENDORS = [
+    {'id': '100', 'name': 'Ben Armstrong', 'booth': 'K05/K06', 'description': 'Assorted PCs', 'domain_id': 'ibm_pc'},
+    {'id': '101', 'name': '2TailedFox', 'booth': 'M08', 'description': 'Homebrew games',
+     'featuredItems': ['Playable demos'], 'domain_id': 'gaming'},
+    {'id': '102', 'name': 'Commodore Corner', 'booth': 'R23', 'description': 'C64 repairs', 'domain_id': 'commodore'},
+]
+DOMAINS = [
+    {'id': 'ibm_pc', 'name': 'IBM PC'},
+    {'id': 'gaming', 'name': 'Video Gaming'},
+    {'id': 'commodore', 'name': 'Commodore Computing'},
+]
+
+
+def test_postings_round_trip_through_delta_encoding():
+    assert encode_postings([2, 5, 6, 40]) == [2, 3, 1, 34]
+    assert decode_postings(encode_postings([2, 5, 6, 40])) == [2, 5, 6, 40]
+
+
+def test_search_covers_every_indexed_field():
+    index = build_search_index(VENDORS, DOMAINS)
+
+    assert search_vendors(index, 'armstr') == [['100', 'Ben Armstrong', 'K05/K06']]
+    assert search_vendors(index, 'k06') == [['100', 'Ben Armstrong', 'K05/K06']]
+    assert [row[0] for row in search_vendors(index, 'playable demo')] == ['101']
+    assert [row[0] for row in search_vendors(index, 'video gaming')] == ['101']
+    assert [row[0] for row in search_vendors(index, 'c64')] == ['102']
+    assert search_vendors(index, 'amiga') == []
+    assert [row[0] for row in search_vendors(index, '', limit=2)] == ['100', '101']
+
+
+def test_committed_index_matches_vendor_content():
+    with open(REPO_ROOT / 'vendors.json', 'r', encoding='utf-8') as f:
+        vendors = json.load(f)
+
+    with open(REPO_ROOT / 'technology_domains.json', 'r', encoding='utf-8') as f:
+        domains = json.load(f)
+
+    with open(REPO_ROOT / 'vendor_search_index.json', 'r', encoding='utf-8') as f:
+        committed_index = json.load(f)
+
+    assert committed_index == build_search_index(vendors, domains)
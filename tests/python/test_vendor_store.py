@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from conftest import REPO_ROOT
+from vendor_store import VendorStore, VendorStoreError, write_vendor_store
+
+
+def load_vendors():
+    with open(REPO_ROOT / 'vendors.json', 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_store_round_trips_every_vendor(tmp_path):
+    vendors = load_vendors()
+    store_path = tmp_path / 'vendors.bin'
+    write_vendor_store(vendors, store_path)
+
+    with VendorStore(store_path) as store:
+        assert len(store) == len(vendors)
+        assert [record['id'] for record in store] == [vendor['id'] for vendor in vendors]
+        for vendor in vendors:
+            assert store.get(vendor['id']).to_dict() == vendor
+
+
+def test_store_reads_single_fields_lazily(tmp_path):
+    vendors = [
+        {'id': '7', 'name': 'Shared Booth', 'booth': 'A01', 'facts': ['One fact.'], 'x': 64, 'y': -32},
+        {'id': '12', 'name': 'Shared Booth', 'booth': 'A02', 'dialog': {'greeting': 'Hi'}},
+    ]
+    store_path = tmp_path / 'vendors.bin'
+    write_vendor_store(vendors, store_path)
+
+    with VendorStore(store_path) as store:
+        record = store.get('12')
+        assert bytes(record.raw('name')) == b'Shared Booth'
+        assert record['dialog'] == {'greeting': 'Hi'}
+        assert record.get('facts') is None
+        assert store.get('7')['facts'] == ['One fact.']
+        assert (store.get('7')['x'], store.get('7')['y']) == (64, -32)
+        assert store.get('99') is None
+        assert '7' in store
+
+
+def test_store_rejects_duplicate_ids_and_foreign_files(tmp_path):
+    with pytest.raises(VendorStoreError):
+        write_vendor_store([{'id': '1'}, {'id': '1'}], tmp_path / 'duplicate.bin')
+
+    foreign_path = tmp_path / 'foreign.bin'
+    foreign_path.write_bytes(b'not a vendor store' * 4)
+    with pytest.raises(VendorStoreError):
+        VendorStore(foreign_path)
+
+
+@pytest.mark.parametrize('vendor', [
+    {'id': '1', 'x': 12.5},
+    {'id': '1', 'y': 2 ** 31},
+    {'id': '1', 'x': True},
+    {'id': '1', 'facts': ['One fact.', {'text': 'Nested'}]},
+    {'id': '1', 'announcements': 'Doors at 9'},
+    {'id': '1', 'booth': 12},
+    {'id': 1},
+    {'name': 'No id'}
+])
+def test_store_rejects_values_it_cannot_store_exactly(tmp_path, vendor):
+    with pytest.raises(VendorStoreError, match='cannot be stored exactly'):
+        write_vendor_store([vendor], tmp_path / 'vendors.bin')
+    assert not (tmp_path / 'vendors.bin').exists()
+
+
+def test_store_rejects_empty_and_truncated_files(tmp_path):
+    store_path = tmp_path / 'vendors.bin'
+    write_vendor_store(load_vendors(), store_path)
+    data = store_path.read_bytes()
+
+    for length in (0, 10, len(data) - 1):
+        truncated_path = tmp_path / f'truncated_{length}.bin'
+        truncated_path.write_bytes(data[:length])
+        with pytest.raises(VendorStoreError):
+            VendorStore(truncated_path)
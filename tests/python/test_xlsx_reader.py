@@ -0,0 +1,110 @@
+import tracemalloc
+import zipfile
+
+from conftest import REPO_ROOT
+from convert_vendors import is_blank_row, read_vendor_rows
+from xlsx_reader import XlsxWorkbook, column_index
+
+MAIN = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+RELS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PACKAGE_RELS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+
+def write_workbook(path, sheets, shared_strings):
+    """Write a minimal workbook; sheets maps names to iterables of row XML"""
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as workbook:
+        sheet_entries = ''.join(
+            f'<sheet name="{name}" sheetId="{number}" r:id="rId{number}"/>'
+            for number, name in enumerate(sheets, 1)
+        )
+        workbook.writestr(
+            'xl/workbook.xml',
+            f'<workbook xmlns="{MAIN}" xmlns:r="{RELS}"><sheets>{sheet_entries}</sheets></workbook>'
+        )
+        rels = ''.join(
+            f'<Relationship Id="rId{number}" Type="{RELS}/worksheet" Target="worksheets/sheet{number}.xml"/>'
+            for number in range(1, len(sheets) + 1)
+        )
+        rels += f'<Relationship Id="rIdStrings" Type="{RELS}/sharedStrings" Target="sharedStrings.xml"/>'
+        workbook.writestr('xl/_rels/workbook.xml.rels', f'<Relationships xmlns="{PACKAGE_RELS}">{rels}</Relationships>')
+        workbook.writestr(
+            'xl/sharedStrings.xml',
+            f'<sst xmlns="{MAIN}">' + ''.join(f'<si><t>{text}</t></si>' for text in shared_strings) + '</sst>'
+        )
+        for number, rows in enumerate(sheets.values(), 1):
+            with workbook.open(f'xl/worksheets/sheet{number}.xml', 'w') as f:
+                f.write(f'<worksheet xmlns="{MAIN}"><sheetData>'.encode())
+                for row in rows:
+                    f.write(row.encode())
+                f.write(b'</sheetData></worksheet>')
+
+
+def inline_row(number, values):
+    cells = ''.join(
+        f'<c r="{chr(65 + column)}{number}" t="inlineStr"><is><t>{value}</t></is></c>'
+        for column, value in enumerate(values)
+    )
+    return f'<row r="{number}">{cells}</row>'
+
+
+def test_column_index_handles_multi_letter_refs():
+    assert column_index('A1') == 0
+    assert column_index('Z9') == 25
+    assert column_index('AB12') == 27
+
+
+def test_reads_shared_inline_numeric_sparse_and_blank_cells(tmp_path):
+    path = tmp_path / 'vendors.xlsx'
+    header = ''.join(f'<c r="{column}1" t="s"><v>{index}</v></c>' for index, column in enumerate('ABCDEF'))
+    write_workbook(path, {
+        'Notes': ['<row r="1"><c r="A1" t="inlineStr"><is><t>Not vendors</t></is></c></row>'],
+        'Vendors': [
+            f'<row r="1">{header}</row>',
+            '<row r="2"><c r="A2" s="1"/><c r="B2"><v></v></c></row>',
+            '<row r="3"><c r="A3"><v>161</v></c><c r="C3" t="s"><v>6</v></c>'
+            '<c r="E3" t="inlineStr"><is><r><t>Rich </t></r><r><t>text</t></r></is></c></row>'
+        ]
+    }, ['ID', 'LOC', 'NAME', 'URL', 'TITLE', 'DESC', '8-Bit Classics'])
+
+    rows = list(read_vendor_rows(str(path)))
+
+    assert rows == [{'ID': '161', 'LOC': '', 'NAME': '8-Bit Classics', 'URL': '', 'TITLE': 'Rich text', 'DESC': ''}]
+
+
+def test_bundled_workbook_matches_its_tab_separated_export():
+    xlsx_rows = list(read_vendor_rows(str(REPO_ROOT / 'ret.xlsx')))
+    tsv_rows = list(read_vendor_rows(str(REPO_ROOT / 'ret.txt')))
+
+    assert xlsx_rows == tsv_rows
+    assert xlsx_rows[0]['NAME'] == '2TailedFox'
+
+
+def test_streaming_memory_does_not_grow_with_row_count(tmp_path):
+    def peak_for(row_count):
+        path = tmp_path / f'rows_{row_count}.xlsx'
+        rows = (inline_row(number, [number, f'Booth {number}', f'Vendor {number}']) for number in range(1, row_count + 1))
+        write_workbook(path, {'Big': rows, 'Other': [inline_row(1, ['x'])]}, [])
+
+        tracemalloc.start()
+        with XlsxWorkbook(path) as workbook:
+            count = sum(1 for _ in workbook.iter_rows('Big'))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert count == row_count
+        return peak
+
+    small = peak_for(2_000)
+    large = peak_for(50_000)
+
+    assert large < small * 2
+
+
+def test_blank_rows_account_for_short_and_overlong_tsv_lines(tmp_path):
+    path = tmp_path / 'vendors.txt'
+    path.write_text('ID\tNAME\n\t\t \t\n7\n\t\textra\n', encoding='cp1252')
+
+    assert [dict(row) for row in read_vendor_rows(str(path))] == [
+        {'ID': '7', 'NAME': None},
+        {'ID': '', 'NAME': '', None: ['extra']}
+    ]
+    assert is_blank_row({'ID': ' ', 'NAME': None, None: ['', ' ']})
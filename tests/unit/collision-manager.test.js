@@ -64,4 +64,30 @@ describe('CollisionManager setup', () => {
         expect(collider).toHaveBeenNthCalledWith(5, npc2, body1);
         expect(collider).toHaveBeenNthCalledWith(6, npc2, body2);
     });
-});
\ No newline at end of file
+
+    it('keeps streamed chunk bodies across a collision rebuild without binding them twice', () => {
+        const collider = vi.fn();
+        const chunkBody = { id: 'chunk-body', tileInfo: { chunk: '0_0' } };
+        const staleTileBody = { id: 'stale-tile-body', tileInfo: { layer: 'tables' } };
+        const tileBody = { id: 'tile-body' };
+        const scene = {
+            map: { getLayer: vi.fn(() => ({ tilemapLayer: { id: 'tables-layer' } })) },
+            player: { id: 'player-1' },
+            customCollisionBodies: [chunkBody, staleTileBody],
+            physics: { add: { collider } }
+        };
+        const createTileCollisionBodies = vi.spyOn(CollisionManager, 'createTileCollisionBodies')
+            .mockImplementationOnce(() => scene.customCollisionBodies.push(tileBody))
+            .mockImplementation(() => {});
+        const drawTileCollisionDebug = vi.spyOn(CollisionManager, 'drawTileCollisionDebug').mockImplementation(() => {});
+
+        CollisionManager.setupCollisions(scene);
+
+        expect(scene.customCollisionBodies).toEqual([chunkBody, tileBody]);
+        expect(collider).toHaveBeenCalledTimes(1);
+        expect(collider).toHaveBeenCalledWith(scene.player, tileBody);
+
+        createTileCollisionBodies.mockRestore();
+        drawTileCollisionDebug.mockRestore();
+    });
+});
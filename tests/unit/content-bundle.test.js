@@ -0,0 +1,112 @@
+import { describe, expect, it, vi } from 'vitest';
+
+import { ContentBundle, preloadContentBundle, readContentBundle } from '../../contentBundle.js';
+
+// Same layout content_bundle.py writes: a header, then one line per section.
+function createLoader() {
+    const handlers = new Map();
+    const listen = (event, handler) => {
+        handlers.set(event, [...(handlers.get(event) ?? []), handler]);
+    };
+    return {
+        text: vi.fn(),
+        on: vi.fn(listen),
+        once: vi.fn(listen),
+        off: vi.fn((event, handler) => handlers.set(event, (handlers.get(event) ?? []).filter(entry => entry !== handler))),
+        emit: (event, ...args) => (handlers.get(event) ?? []).forEach(handler => handler(...args))
+    };
+}
+
+function createBundleText(version = 1) {
+    return [
+        { format: 'tiletest-content-bundle', version, sections: ['discovery_trails', 'vendors', 'technology_domains'] },
+        { name: 'discovery_trails', strings: ['Retro Rick'], data: [{ id: 'loop', title: '~0' }] },
+        {
+            name: 'vendors',
+            strings: ['Show me your inventory'],
+            data: [{ id: '1', name: '~0', x: 64, tags: ['~1', '~~tilde', '~1'] }]
+        },
+        { name: 'technology_domains', strings: [], data: [{ id: 'commodore', name: '~1' }] }
+    ].map(line => `${JSON.stringify(line)}\n`).join('');
+}
+
+describe('content bundle', () => {
+    it('decodes shared strings and escaped tildes across sections', () => {
+        const bundle = new ContentBundle(createBundleText());
+
+        expect(bundle.getSection('discovery_trails')).toEqual([{ id: 'loop', title: 'Retro Rick' }]);
+        expect(bundle.getSection('vendors')).toEqual([{
+            id: '1',
+            name: 'Retro Rick',
+            x: 64,
+            tags: ['Show me your inventory', '~tilde', 'Show me your inventory']
+        }]);
+        expect(bundle.getSection('technology_domains')).toEqual([{ id: 'commodore', name: 'Show me your inventory' }]);
+        expect(bundle.getSection('help')).toBeUndefined();
+    });
+
+    it('decodes only the lines up to the requested section', () => {
+        const bundle = new ContentBundle(createBundleText());
+        const parse = vi.spyOn(JSON, 'parse');
+
+        bundle.getSection('discovery_trails');
+        expect(parse).toHaveBeenCalledTimes(1);
+        expect(bundle.sections.has('vendors')).toBe(false);
+
+        bundle.getSection('technology_domains');
+        expect(parse).toHaveBeenCalledTimes(3);
+        expect(bundle.getSection('vendors')[0].name).toBe('Retro Rick');
+        expect(parse).toHaveBeenCalledTimes(3);
+        parse.mockRestore();
+    });
+
+    it('reads the bundle Phaser loaded as text and rejects other versions', () => {
+        const scene = text => ({ cache: { text: { get: vi.fn(() => text) } } });
+        const error = vi.spyOn(console, 'error').mockImplementation(() => {});
+
+        expect(readContentBundle(scene(createBundleText()), 'content_bundle')).toBeInstanceOf(ContentBundle);
+        expect(readContentBundle(scene(undefined), 'content_bundle')).toBeNull();
+        expect(readContentBundle(scene(createBundleText(2)), 'content_bundle')).toBeNull();
+        expect(error).toHaveBeenCalledTimes(1);
+        error.mockRestore();
+    });
+
+    it('opens the bundle during preload and only queues the separate files when it is unusable', () => {
+        const error = vi.spyOn(console, 'error').mockImplementation(() => {});
+        const preload = () => {
+            const scene = { load: createLoader() };
+            const loadFallback = vi.fn();
+            preloadContentBundle(scene, {
+                key: 'content_bundle',
+                url: 'assets/content_bundle.json',
+                bootSections: ['vendors', 'discovery_trails'],
+                loadFallback
+            });
+            return { scene, loadFallback };
+        };
+
+        const loaded = preload();
+        expect(loaded.scene.load.text).toHaveBeenCalledWith('content_bundle', 'assets/content_bundle.json');
+        loaded.scene.load.emit('filecomplete-text-content_bundle', 'content_bundle', 'text', createBundleText());
+        expect(loaded.loadFallback).not.toHaveBeenCalled();
+        expect(readContentBundle(loaded.scene, 'content_bundle').sections.has('vendors')).toBe(true);
+
+        const missing = preload();
+        missing.scene.load.emit('loaderror', { key: 'other' });
+        expect(missing.loadFallback).not.toHaveBeenCalled();
+        missing.scene.load.emit('loaderror', { key: 'content_bundle' });
+        expect(missing.loadFallback).toHaveBeenCalledTimes(1);
+        expect(readContentBundle(missing.scene, 'content_bundle')).toBeNull();
+
+        const unsupported = preload();
+        unsupported.scene.load.emit('filecomplete-text-content_bundle', 'content_bundle', 'text', createBundleText(2));
+        expect(unsupported.loadFallback).toHaveBeenCalledTimes(1);
+
+        const corrupt = preload();
+        const truncated = createBundleText().split('\n').slice(0, 2).join('\n');
+        corrupt.scene.load.emit('filecomplete-text-content_bundle', 'content_bundle', 'text', truncated);
+        expect(corrupt.loadFallback).toHaveBeenCalledTimes(1);
+        expect(corrupt.scene.contentBundle).toBeNull();
+        error.mockRestore();
+    });
+});
@@ -16,6 +16,7 @@ describe('domain and vendor readiness', () => {
         globalThis.fetch = originalFetch;
         DomainManager.domains = null;
         DomainManager.loadingPromise = null;
+        DomainManager.contentBundle = null;
     });
 
     it('reuses one in-flight domain load', async () => {
@@ -36,6 +37,23 @@ describe('domain and vendor readiness', () => {
         expect(DomainManager.isLoaded()).toBe(true);
     });
 
+    it('reads domains from the content bundle without a request', async () => {
+        const domainPayload = [{ id: 'gaming', name: 'Gaming', items: [], facts: [] }];
+        const contentBundle = {
+            hasSection: vi.fn(name => name === 'technology_domains'),
+            getSection: vi.fn(() => domainPayload)
+        };
+        globalThis.fetch = vi.fn();
+
+        DomainManager.useContentBundle(contentBundle);
+        const loading = DomainManager.loadDomains();
+        expect(contentBundle.getSection).not.toHaveBeenCalled();
+
+        expect(await loading).toBe(domainPayload);
+        expect(contentBundle.getSection).toHaveBeenCalledWith('technology_domains');
+        expect(globalThis.fetch).not.toHaveBeenCalled();
+    });
+
     it('only allows vendor interaction once domains are loaded and no dialog is open', () => {
         const context = {
             state: {
@@ -134,4 +134,56 @@ describe('live vendor announcement store', () => {
         });
         expect(store.toJSON()).toEqual({ vendors: [], announcements: [] });
     });
+
+    it('bumps the revision only when stored content changes', () => {
+        const store = new VendorContentStore();
+
+        store.setAnnouncements('100', ['Demo at 2 PM']);
+        const revision = store.revision;
+        store.setAnnouncements('100', ['Demo at 2 PM']);
+        expect(store.revision).toBe(revision);
+
+        store.setAnnouncements('100', []);
+        expect(store.revision).toBe(revision + 1);
+        store.setAnnouncements('100', []);
+        expect(store.revision).toBe(revision + 1);
+    });
+
+    it('applies a batch of updates as a single revision and reports rejected entries', () => {
+        const store = new VendorContentStore();
+
+        const result = store.applyUpdates([
+            { vendorId: '100', announcements: 'Demo at 2 PM' },
+            { announcements: 'No vendor' },
+            { vendorId: '101', featuredItems: ['Portable demo'] }
+        ]);
+
+        expect(result.updated.map(update => update.vendorId)).toEqual(['100', '101']);
+        expect(result.rejected).toEqual([1]);
+        expect(store.revision).toBe(1);
+        expect(store.getAnnouncementsForVendor('100')).toEqual(['Demo at 2 PM']);
+
+        store.applyUpdates([{ vendorId: '100', announcements: 'Demo at 2 PM' }]);
+        expect(store.revision).toBe(1);
+    });
+
+    it('answers changes since a revision from a bounded change log', () => {
+        const store = new VendorContentStore(null, { changeLogLimit: 2 });
+
+        store.setAnnouncements('100', ['Demo at 2 PM']);
+        store.setAnnouncements('101', ['Raffle at 4']);
+        store.setAnnouncements('100', ['Demo moved to 3 PM']);
+
+        expect(store.getChangesSince(3)).toEqual({ revision: 3, reset: false, updates: [] });
+        expect(store.getChangesSince(1)).toMatchObject({
+            revision: 3,
+            reset: false,
+            updates: [
+                { vendorId: '101', announcements: ['Raffle at 4'] },
+                { vendorId: '100', announcements: ['Demo moved to 3 PM'] }
+            ]
+        });
+        expect(store.getChangesSince(0)).toMatchObject({ revision: 3, reset: true });
+        expect(store.getChangesSince(0).updates.map(update => update.vendorId)).toEqual(['100', '101']);
+    });
 });
@@ -45,6 +45,110 @@ describe('live vendor content service', () => {
         expect(service.getAnnouncementsForVendor('100')).toEqual(['Demo at 2 PM']);
     });
 
+    it('revalidates with the last ETag and keeps content on 304', async () => {
+        const fetchImpl = vi.fn()
+            .mockReturnValueOnce(Promise.resolve({
+                ok: true,
+                status: 200,
+                headers: { get: name => (name === 'ETag' ? '"rev-1"' : null) },
+                json: async () => ({ announcements: [{ vendorId: '100', announcements: ['Demo at 2 PM'] }] })
+            }))
+            .mockReturnValueOnce(Promise.resolve({ ok: false, status: 304 }));
+        const service = new LiveVendorContentService({ fetchImpl, pollIntervalMs: 0 });
+
+        await service.refresh();
+        await expect(service.refresh()).resolves.toBe(true);
+
+        expect(fetchImpl).toHaveBeenNthCalledWith(2, '/api/vendor-content', {
+            headers: { Accept: 'application/json', 'If-None-Match': '"rev-1"' },
+            cache: 'no-store'
+        });
+        expect(service.isAvailable).toBe(true);
+        expect(service.getAnnouncementsForVendor('100')).toEqual(['Demo at 2 PM']);
+    });
+
+    it('streams deltas after the first snapshot instead of polling', async () => {
+        const setIntervalImpl = vi.fn();
+        const listeners = {};
+        const eventSource = {
+            addEventListener: vi.fn((type, listener) => {
+                listeners[type] = listener;
+            }),
+            close: vi.fn()
+        };
+        const eventSourceFactory = vi.fn(() => eventSource);
+        const service = new LiveVendorContentService({
+            fetchImpl: vi.fn(async () => ({
+                ok: true,
+                json: async () => ({ revision: 4, vendors: [{ vendorId: '100', announcements: ['Demo at 2 PM'] }] })
+            })),
+            setIntervalImpl,
+            eventSourceFactory,
+            pollIntervalMs: 5000
+        });
+
+        await service.start();
+
+        expect(eventSourceFactory).toHaveBeenCalledWith('/api/vendor-content/changes?since=4');
+        expect(setIntervalImpl).not.toHaveBeenCalled();
+
+        listeners.change({
+            data: JSON.stringify({
+                revision: 5,
+                reset: false,
+                updates: [{ vendorId: '101', announcements: ['Raffle at 4'] }]
+            })
+        });
+        expect(service.revision).toBe(5);
+        expect(service.getAnnouncementsForVendor('100')).toEqual(['Demo at 2 PM']);
+        expect(service.getAnnouncementsForVendor('101')).toEqual(['Raffle at 4']);
+
+        listeners.change({ data: JSON.stringify({ revision: 9, reset: true, updates: [] }) });
+        expect(service.getAnnouncementsForVendor('100')).toEqual([]);
+
+        service.stop();
+        expect(eventSource.close).toHaveBeenCalled();
+    });
+
+    it('falls back to polling after repeated stream errors without an open', async () => {
+        const setIntervalImpl = vi.fn(() => 7);
+        const listeners = {};
+        const eventSource = {
+            addEventListener: vi.fn((type, listener) => {
+                listeners[type] = listener;
+            }),
+            close: vi.fn()
+        };
+        const fetchImpl = vi.fn(async () => ({
+            ok: true,
+            json: async () => ({ revision: 4, vendors: [] })
+        }));
+        const service = new LiveVendorContentService({
+            fetchImpl,
+            setIntervalImpl,
+            eventSourceFactory: vi.fn(() => eventSource),
+            pollIntervalMs: 5000,
+            maxStreamErrors: 3
+        });
+
+        await service.start();
+
+        listeners.error();
+        listeners.error();
+        listeners.open();
+        listeners.error();
+        listeners.error();
+        expect(eventSource.close).not.toHaveBeenCalled();
+        expect(setIntervalImpl).not.toHaveBeenCalled();
+
+        listeners.error();
+        expect(eventSource.close).toHaveBeenCalledTimes(1);
+        expect(service.eventSource).toBe(null);
+        expect(fetchImpl).toHaveBeenCalledTimes(2);
+        expect(setIntervalImpl).toHaveBeenCalledTimes(1);
+        expect(setIntervalImpl.mock.calls[0][1]).toBe(5000);
+    });
+
     it('fails quietly when the live endpoint is unavailable', async () => {
         const setIntervalImpl = vi.fn();
         const service = new LiveVendorContentService({
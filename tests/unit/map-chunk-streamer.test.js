@@ -0,0 +1,159 @@
+import { describe, expect, it, vi } from 'vitest';
+
+import {
+    MapChunkStreamer,
+    findTilesetForGid,
+    getChunkKeysForView,
+    getChunkTileFlips,
+    getChunkTilesets,
+    getTileFlip,
+    toChunkTileRows
+} from '../../mapChunkStreamer.js';
+
+function createManifest() {
+    const chunks = [];
+    for (let row = 0; row < 3; row += 1) {
+        for (let column = 0; column < 4; column += 1) {
+            chunks.push({ key: `${column}_${row}`, file: `chunk_${column}_${row}.json`, collisionRects: [] });
+        }
+    }
+
+    return {
+        chunkSize: 32,
+        columns: 4,
+        rows: 3,
+        map: { tilewidth: 16, tileheight: 16 },
+        chunks
+    };
+}
+
+function flushPromises() {
+    return new Promise(resolve => setTimeout(resolve, 0));
+}
+
+describe('map chunk streaming', () => {
+    it('selects the chunks under the view plus a clamped radius', () => {
+        const manifest = createManifest();
+
+        expect(getChunkKeysForView(manifest, { x: 0, y: 0, width: 512, height: 512 }, 0)).toEqual(['0_0']);
+        expect(getChunkKeysForView(manifest, { x: 600, y: 10, width: 100, height: 100 }, 1)).toEqual([
+            '0_0', '1_0', '2_0',
+            '0_1', '1_1', '2_1'
+        ]);
+    });
+
+    it('converts global tile ids into Phaser index rows with -1 for empty cells', () => {
+        expect(toChunkTileRows([0, 1, 2, 3, 0x80000002, 0], 3)).toEqual([
+            [-1, 1, 2],
+            [3, 2, -1]
+        ]);
+    });
+
+    it('resolves each gid against the tileset with the highest firstgid not above it', () => {
+        const floor = { name: 'floor', firstgid: 1 };
+        const props = { name: 'props', firstgid: 101 };
+        const tilesets = [props, floor];
+
+        expect(findTilesetForGid(tilesets, 100)).toBe(floor);
+        expect(findTilesetForGid(tilesets, 101)).toBe(props);
+        expect(findTilesetForGid(tilesets, 0x80000000 | 150)).toBe(props);
+        expect(findTilesetForGid(tilesets, 0)).toBeNull();
+        expect(getChunkTilesets(tilesets, [0, 150, 3, 0])).toEqual([floor, props]);
+        expect(getChunkTilesets(tilesets, [0, 7])).toEqual([floor]);
+    });
+
+    it('maps no flip flags to no transform', () => {
+        expect(getTileFlip(2)).toBeNull();
+    });
+
+    it('maps a horizontal flip to flipX', () => {
+        expect(getTileFlip(0x80000002)).toEqual({ rotation: 0, flipX: true });
+    });
+
+    it('maps a vertical flip to a half turn plus flipX', () => {
+        expect(getTileFlip(0x40000002)).toEqual({ rotation: Math.PI, flipX: true });
+    });
+
+    it('maps horizontal plus vertical flips to a half turn', () => {
+        expect(getTileFlip(0xc0000002)).toEqual({ rotation: Math.PI, flipX: false });
+    });
+
+    it('maps a diagonal flip to a three-quarter turn plus flipX', () => {
+        expect(getTileFlip(0x20000002)).toEqual({ rotation: 3 * Math.PI / 2, flipX: true });
+    });
+
+    it('maps diagonal plus horizontal flips to a quarter turn', () => {
+        expect(getTileFlip(0xa0000002)).toEqual({ rotation: Math.PI / 2, flipX: false });
+    });
+
+    it('maps diagonal plus vertical flips to a three-quarter turn', () => {
+        expect(getTileFlip(0x60000002)).toEqual({ rotation: 3 * Math.PI / 2, flipX: false });
+    });
+
+    it('maps all three flips to a quarter turn plus flipX', () => {
+        expect(getTileFlip(0xe0000002)).toEqual({ rotation: Math.PI / 2, flipX: true });
+    });
+
+    it('lists the transform of every flipped tile by chunk position', () => {
+        expect(getChunkTileFlips([1, 0x80000002, 0, 0x20000002], 2)).toEqual([
+            { x: 1, y: 0, rotation: 0, flipX: true },
+            { x: 1, y: 1, rotation: 3 * Math.PI / 2, flipX: true }
+        ]);
+    });
+
+    it('loads nearby chunks once and unloads chunks that leave the keep radius', async () => {
+        const manifest = createManifest();
+        const loadChunk = vi.fn(entry => Promise.resolve({ key: entry.key }));
+        const createChunk = vi.fn(chunk => ({ handle: chunk.key }));
+        const destroyChunk = vi.fn();
+        const streamer = new MapChunkStreamer({
+            manifest,
+            loadChunk,
+            createChunk,
+            destroyChunk,
+            loadRadius: 0,
+            keepRadius: 1
+        });
+
+        streamer.update({ x: 0, y: 0, width: 100, height: 100 });
+        streamer.update({ x: 0, y: 0, width: 100, height: 100 });
+        await flushPromises();
+
+        expect(loadChunk).toHaveBeenCalledTimes(1);
+        expect([...streamer.loaded.keys()]).toEqual(['0_0']);
+
+        streamer.update({ x: 520, y: 0, width: 100, height: 100 });
+        await flushPromises();
+        expect([...streamer.loaded.keys()]).toEqual(['0_0', '1_0']);
+        expect(destroyChunk).not.toHaveBeenCalled();
+
+        streamer.update({ x: 1600, y: 600, width: 100, height: 100 });
+        await flushPromises();
+        expect([...streamer.loaded.keys()]).toEqual(['3_1']);
+        expect(destroyChunk).toHaveBeenCalledWith({ handle: '0_0' }, manifest.chunks[0]);
+        expect(destroyChunk).toHaveBeenCalledWith({ handle: '1_0' }, manifest.chunks[1]);
+    });
+
+    it('drops chunks that finish loading after they were unloaded', async () => {
+        const manifest = createManifest();
+        let resolveChunk;
+        const createChunk = vi.fn();
+        const streamer = new MapChunkStreamer({
+            manifest,
+            loadChunk: () => new Promise(resolve => { resolveChunk = resolve; }),
+            createChunk,
+            destroyChunk: vi.fn(),
+            loadRadius: 0,
+            keepRadius: 0
+        });
+
+        streamer.update({ x: 0, y: 0, width: 10, height: 10 });
+        streamer.update({ x: 1600, y: 1000, width: 10, height: 10 });
+        resolveChunk({ key: '0_0' });
+        await flushPromises();
+
+        expect(createChunk).toHaveBeenCalledTimes(1);
+        expect(createChunk.mock.calls[0][1].key).toBe('3_1');
+        expect(streamer.loaded.has('0_0')).toBe(false);
+    });
+});
@@ -122,4 +122,195 @@ describe('MapManager', () => {
 
         errorSpy.mockRestore();
     });
+
+    it('builds chunk layers and collision bodies and tears them down again', () => {
+        const chunkLayer = { setDepth: vi.fn(function () { return this; }), destroy: vi.fn() };
+        const chunkMap = {
+            addTilesetImage: vi.fn(() => 'chunk-tileset'),
+            createLayer: vi.fn(() => chunkLayer),
+            destroy: vi.fn()
+        };
+        const body = { setSize: vi.fn(), destroy: vi.fn() };
+        const collider = { destroy: vi.fn() };
+        const existingBody = {};
+        const scene = {
+            player: {},
+            customCollisionBodies: [existingBody],
+            mapLayers: {
+                floor: { name: 'floor', depth: 0 },
+                tables: { name: 'tables', depth: 426 }
+            },
+            make: { tilemap: vi.fn(() => chunkMap) },
+            physics: { add: { collider: vi.fn(() => collider) } }
+        };
+        const manifest = {
+            map: {
+                tilewidth: 32,
+                tileheight: 32,
+                tilesets: [{ name: 'tiles', firstgid: 1, tilewidth: 32, tileheight: 32, margin: 0, spacing: 0 }]
+            }
+        };
+        const chunk = { width: 2, layers: { floor: [0, 0, 0, 0], tables: [0, 4, 0, 0] } };
+        const entry = {
+            key: '1_0',
+            pixelBounds: { x: 1024, y: 0 },
+            collisionRects: [{ x: 1056, y: 16, width: 32, height: 16, layer: 'tables' }]
+        };
+
+        const handle = MapManager.createChunkObjects(scene, manifest, chunk, entry, {
+            staticSpriteFactory: vi.fn(() => body)
+        });
+
+        expect(scene.make.tilemap).toHaveBeenCalledTimes(1);
+        expect(scene.make.tilemap).toHaveBeenCalledWith({ data: [[-1, 4], [-1, -1]], tileWidth: 32, tileHeight: 32 });
+        expect(chunkMap.addTilesetImage).toHaveBeenCalledWith('tiles', 'tiles', 32, 32, 0, 0, 1);
+        expect(chunkMap.createLayer).toHaveBeenCalledWith(0, ['chunk-tileset'], 1024, 0);
+        expect(chunkLayer.setDepth).toHaveBeenCalledWith(426);
+        expect(body.setSize).toHaveBeenCalledWith(32, 16);
+        expect(body.tileInfo).toEqual({ chunk: '1_0', pixelX: 1056, pixelY: 16, depth: 426 });
+        expect(scene.customCollisionBodies).toEqual([existingBody, body]);
+        expect(scene.physics.add.collider).toHaveBeenCalledWith(scene.player, body);
+
+        MapManager.destroyChunkObjects(scene, handle);
+
+        expect(collider.destroy).toHaveBeenCalled();
+        expect(body.destroy).toHaveBeenCalled();
+        expect(chunkLayer.destroy).toHaveBeenCalled();
+        expect(chunkMap.destroy).toHaveBeenCalled();
+        expect(scene.customCollisionBodies).toEqual([existingBody]);
+    });
+
+    it('boots from a chunk manifest and streams in the chunk around the player start', async () => {
+        globalThis.Phaser = {
+            Math: {
+                Clamp: vi.fn((value, min, max) => Math.min(Math.max(value, min), max))
+            },
+            Tilemaps: { Formats: { TILED_JSON: 'tiled-json' } }
+        };
+
+        // The chunker swaps each tile layer's data for the gids its chunks hold.
+        const sourceMap = createRuntimeReadyMapData();
+        const manifest = {
+            version: 1,
+            chunkSize: 32,
+            columns: 1,
+            rows: 1,
+            map: {
+                width: 2,
+                height: 1,
+                tilewidth: 32,
+                tileheight: 32,
+                tilesets: [{ ...sourceMap.tilesets[0], tilewidth: 32, tileheight: 32 }],
+                layers: sourceMap.layers.map(({ data, ...layer }) => {
+                    if (layer.name === 'player') {
+                        return { ...layer, objects: [{ name: 'start', point: true, x: 16, y: 16 }] };
+                    }
+                    return data ? { ...layer, chunkedTileIds: [1] } : layer;
+                })
+            },
+            chunks: [{
+                key: '0_0',
+                file: 'chunk_0_0.json',
+                pixelBounds: { x: 0, y: 0, width: 64, height: 32 },
+                collisionRects: [{ x: 32, y: 0, width: 32, height: 32, layer: 'tables' }]
+            }]
+        };
+        const flippedTile = {};
+        const chunkLayer = {
+            setDepth: vi.fn(function () { return this; }),
+            getTileAt: vi.fn((x, y) => (x === 1 && y === 0 ? flippedTile : null))
+        };
+        const runtimeMap = { id: 'runtime-map' };
+        const chunkMap = { addTilesetImage: vi.fn(() => 'chunk-tileset'), createLayer: vi.fn(() => chunkLayer) };
+        const body = { setSize: vi.fn() };
+        const scene = {
+            player: {},
+            customCollisionBodies: [{ id: 'stale' }],
+            cache: {
+                json: { get: vi.fn(() => manifest) },
+                tilemap: { add: vi.fn() }
+            },
+            make: { tilemap: vi.fn(config => (config.key ? runtimeMap : chunkMap)) },
+            physics: {
+                add: {
+                    staticSprite: vi.fn(() => body),
+                    collider: vi.fn(() => ({ destroy: vi.fn() }))
+                }
+            }
+        };
+        const chunk = { key: '0_0', width: 2, layers: { floor: [1, 1], tables: [0, 0x80000001], tabletops: [0, 0] } };
+        const fetchImpl = vi.fn(() => Promise.resolve({ json: () => chunk }));
+        const recordMapBootFailureFn = vi.fn();
+
+        const result = MapManager.createChunked(scene, { recordMapBootFailureFn, fetchImpl });
+
+        expect(recordMapBootFailureFn).not.toHaveBeenCalled();
+        expect(result).toBe(scene.mapLayers);
+        expect(Object.keys(scene.mapLayers)).toEqual(['floor', 'tables', 'tabletops']);
+        expect(scene.map).toBe(runtimeMap);
+        expect(scene.cache.tilemap.add.mock.calls[0][1].data.layers.map(layer => layer.name)).toEqual(['player', 'npc_area']);
+        expect(scene.customCollisionBodies).toEqual([]);
+        expect(fetchImpl.mock.calls[0][0]).toBe(`${CONFIG.PATHS.ASSETS}/${CONFIG.MAP_CHUNKS.DIRECTORY}/chunk_0_0.json`);
+
+        await new Promise(resolve => setTimeout(resolve, 0));
+
+        expect(chunkMap.createLayer).toHaveBeenCalledTimes(2);
+        expect(flippedTile).toEqual({ rotation: 0, flipX: true });
+        expect(scene.customCollisionBodies).toEqual([body]);
+        expect(body.tileInfo.chunk).toBe('0_0');
+    });
+
+    it('adds every tileset a chunk layer uses at its own firstgid', () => {
+        const chunkLayer = { setDepth: vi.fn(), getTileAt: vi.fn() };
+        const chunkMap = {
+            addTilesetImage: vi.fn(name => `${name}-tileset`),
+            createLayer: vi.fn(() => chunkLayer)
+        };
+        const scene = {
+            mapLayers: { tables: { name: 'tables', depth: 426 } },
+            make: { tilemap: vi.fn(() => chunkMap) },
+            physics: { add: { collider: vi.fn() } }
+        };
+        const manifest = {
+            map: {
+                tilewidth: 32,
+                tileheight: 32,
+                tilesets: [
+                    { name: 'tiles', firstgid: 1, tilewidth: 32, tileheight: 32 },
+                    { name: 'props', firstgid: 257, tilewidth: 32, tileheight: 64, margin: 1, spacing: 2 }
+                ]
+            }
+        };
+        const chunk = { width: 2, layers: { tables: [3, 0, 0, 0x80000000 | 260] } };
+        const entry = { key: '0_0', pixelBounds: { x: 0, y: 0 }, collisionRects: [] };
+
+        MapManager.createChunkObjects(scene, manifest, chunk, entry);
+
+        expect(scene.make.tilemap).toHaveBeenCalledWith({ data: [[3, -1], [-1, 260]], tileWidth: 32, tileHeight: 32 });
+        expect(chunkMap.addTilesetImage).toHaveBeenNthCalledWith(1, 'tiles', 'tiles', 32, 32, 0, 0, 1);
+        expect(chunkMap.addTilesetImage).toHaveBeenNthCalledWith(2, 'props', 'props', 32, 64, 1, 2, 257);
+        expect(chunkMap.createLayer).toHaveBeenCalledWith(0, ['tiles-tileset', 'props-tileset'], 0, 0);
+    });
+
+    it('queues the images of extra tilesets once the chunk manifest has loaded', () => {
+        const scene = { load: { image: vi.fn() } };
+
+        MapManager.preloadChunkTilesets(scene, {
+            map: { tilesets: [{ name: 'tiles', image: 'tiles.png' }, { name: 'props', image: 'props.png' }] }
+        });
+
+        expect(scene.load.image).toHaveBeenCalledTimes(1);
+        expect(scene.load.image).toHaveBeenCalledWith('props', `${CONFIG.PATHS.ASSETS}/props.png`);
+    });
+
+    it('records a boot failure when the chunk manifest was not loaded', () => {
+        const recordMapBootFailureFn = vi.fn();
+        const scene = { cache: { json: { get: vi.fn(() => undefined) } } };
+
+        const result = MapManager.createChunked(scene, { recordMapBootFailureFn });
+
+        expect(result).toBeNull();
+        expect(scene.cache.json.get).toHaveBeenCalledWith(CONFIG.MAP_CHUNKS.MANIFEST);
+        expect(recordMapBootFailureFn.mock.calls[0][1]).toContain('chunk manifest');
+    });
 });
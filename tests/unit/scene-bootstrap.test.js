@@ -1,5 +1,6 @@
 import { describe, expect, it, vi } from 'vitest';
 
+import CONFIG from '../../config.js';
 import { initializeSceneBootstrap } from '../../sceneBootstrap.js';
 
 describe('scene bootstrap', () => {
@@ -143,6 +144,65 @@ describe('scene bootstrap', () => {
         });
     });
 
+    it('takes vendors, trails, and domains from the content bundle when it is enabled', () => {
+        const vendors = [{ id: 'vendor-1' }];
+        const discoveryTrails = [{ id: 'trail-1' }];
+        const contentBundle = {
+            getSection: vi.fn(name => (name === 'vendors' ? vendors : discoveryTrails))
+        };
+        const scene = { cache: { json: { get: vi.fn() } } };
+        const DomainManagerModule = {
+            useContentBundle: vi.fn(),
+            loadDomains: vi.fn()
+        };
+        const readContentBundleFn = vi.fn(() => contentBundle);
+        CONFIG.CONTENT_BUNDLE.ENABLED = true;
+
+        try {
+            initializeSceneBootstrap(scene, {
+                DomainManagerModule,
+                readContentBundleFn,
+                initializeSceneWorldFn: vi.fn(() => false)
+            });
+        } finally {
+            CONFIG.CONTENT_BUNDLE.ENABLED = false;
+        }
+
+        expect(readContentBundleFn).toHaveBeenCalledWith(scene, 'content_bundle');
+        expect(DomainManagerModule.useContentBundle).toHaveBeenCalledWith(contentBundle);
+        expect(DomainManagerModule.loadDomains).toHaveBeenCalledTimes(1);
+        expect(scene.vendors).toBe(vendors);
+        expect(scene.discoveryTrails).toBe(discoveryTrails);
+        expect(scene.cache.json.get).not.toHaveBeenCalled();
+    });
+
+    it('falls back to the separately loaded content files when the bundle is unusable', () => {
+        const vendors = [{ id: 'vendor-1' }];
+        const discoveryTrails = [{ id: 'trail-1' }];
+        const scene = {
+            cache: { json: { get: vi.fn(key => (key === 'discovery_trails' ? discoveryTrails : vendors)) } }
+        };
+        const DomainManagerModule = {
+            useContentBundle: vi.fn(),
+            loadDomains: vi.fn()
+        };
+        CONFIG.CONTENT_BUNDLE.ENABLED = true;
+
+        try {
+            initializeSceneBootstrap(scene, {
+                DomainManagerModule,
+                readContentBundleFn: vi.fn(() => null),
+                initializeSceneWorldFn: vi.fn(() => false)
+            });
+        } finally {
+            CONFIG.CONTENT_BUNDLE.ENABLED = false;
+        }
+
+        expect(DomainManagerModule.useContentBundle).not.toHaveBeenCalled();
+        expect(scene.vendors).toBe(vendors);
+        expect(scene.discoveryTrails).toBe(discoveryTrails);
+    });
+
     it('starts live vendor content service and passes it into manager composition when available', () => {
         const vendors = [{ id: 'vendor-1' }];
         const discoveryTrails = [{ id: 'trail-1' }];
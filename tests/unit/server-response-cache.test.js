@@ -0,0 +1,88 @@
+import { describe, expect, it, vi } from 'vitest';
+
+import {
+    acceptsGzip,
+    CachedJsonFileProjection,
+    createStrongEtag,
+    requestMatchesEtag,
+    RevisionedJsonCache
+} from '../../serverResponseCache.js';
+
+function createFakeFs(files) {
+    return {
+        stat: vi.fn(async filePath => files[filePath].stats),
+        readFile: vi.fn(async filePath => files[filePath].text)
+    };
+}
+
+describe('server response cache', () => {
+    it('creates stable strong ETags and matches If-None-Match lists', () => {
+        const etag = createStrongEtag('{"vendors":[]}');
+
+        expect(etag).toMatch(/^"[\w-]+"$/);
+        expect(createStrongEtag('{"vendors":[]}')).toBe(etag);
+        expect(createStrongEtag('{"vendors":[1]}')).not.toBe(etag);
+        expect(requestMatchesEtag(`"other", W/${etag}`, etag)).toBe(true);
+        expect(requestMatchesEtag('*', etag)).toBe(true);
+        expect(requestMatchesEtag('"other"', etag)).toBe(false);
+        expect(requestMatchesEtag(undefined, etag)).toBe(false);
+    });
+
+    it('serializes once per revision', () => {
+        let revision = 1;
+        const getPayload = vi.fn(() => ({ revision }));
+        const cache = new RevisionedJsonCache(() => revision, getPayload);
+
+        const first = cache.get();
+        expect(cache.get()).toBe(first);
+        expect(getPayload).toHaveBeenCalledTimes(1);
+
+        revision = 2;
+        expect(cache.get().etag).not.toBe(first.etag);
+        expect(getPayload).toHaveBeenCalledTimes(2);
+    });
+
+    it('reparses the file only when its mtime or size changes', async () => {
+        let now = 0;
+        const files = {
+            'vendors.json': { stats: { mtimeMs: 1, size: 10 }, text: '[{"id":"1","extra":true}]' }
+        };
+        const fsImpl = createFakeFs(files);
+        const project = vi.fn(vendors => vendors.map(({ id }) => ({ id })));
+        const projection = new CachedJsonFileProjection('vendors.json', project, {
+            statIntervalMs: 1000,
+            now: () => now,
+            fsImpl
+        });
+
+        const [first, concurrent] = await Promise.all([projection.get(), projection.get()]);
+        expect(concurrent).toBe(first);
+        expect(first.body).toBe('[{"id":"1"}]');
+        expect(fsImpl.stat).toHaveBeenCalledTimes(1);
+
+        now = 500;
+        await projection.get();
+        expect(fsImpl.stat).toHaveBeenCalledTimes(1);
+
+        now = 1500;
+        expect(await projection.get()).toBe(first);
+        expect(fsImpl.stat).toHaveBeenCalledTimes(2);
+        expect(fsImpl.readFile).toHaveBeenCalledTimes(1);
+
+        files['vendors.json'] = { stats: { mtimeMs: 2, size: 10 }, text: '[{"id":"2"}]' };
+        now = 3000;
+        const changed = await projection.get();
+        expect(changed.body).toBe('[{"id":"2"}]');
+        expect(changed.etag).not.toBe(first.etag);
+        expect(project).toHaveBeenCalledTimes(2);
+    });
+
+    it('accepts gzip unless the client refuses it', () => {
+        expect(acceptsGzip('gzip, deflate, br')).toBe(true);
+        expect(acceptsGzip('br;q=1.0, GZIP;q=0.5')).toBe(true);
+        expect(acceptsGzip('*')).toBe(true);
+        expect(acceptsGzip('gzip;q=0, br')).toBe(false);
+        expect(acceptsGzip('identity')).toBe(false);
+        expect(acceptsGzip(undefined)).toBe(false);
+    });
+});
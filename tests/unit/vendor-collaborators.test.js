@@ -48,7 +48,7 @@ describe('VendorManager collaborators', () => {
             y: 0,
             setVisible: vi.fn(function () { return this; })
         };
-        const context = {
+        const context = Object.assign(Object.create(VendorManager.prototype), {
             assignVendorsToNPCs: vi.fn(),
             getNPCSprites: () => [farVendor, nearVendor],
             interactionRange: 80,
@@ -58,16 +58,59 @@ describe('VendorManager collaborators', () => {
             player: { x: 100, y: 100 },
             camera: { scrollX: 10, scrollY: 15 },
             isInteractionAvailable: () => true
-        };
+        });
 
-        VendorManager.prototype.update.call(context);
+        context.update();
 
         expect(context.assignVendorsToNPCs).toHaveBeenCalledTimes(1);
         expect(context.nearbyVendor).toBe(nearVendor);
-        expect(farGlow.setVisible).toHaveBeenCalledWith(false);
+        expect(farGlow.setVisible).not.toHaveBeenCalled();
         expect(nearGlow.setVisible).toHaveBeenCalledWith(true);
         expect(interactionPrompt.x).toBe(110);
         expect(interactionPrompt.y).toBe(75);
         expect(interactionPrompt.setVisible).toHaveBeenLastCalledWith(true);
     });
+
+    it('only touches glow visibility when the nearest vendor changes', () => {
+        DomainManager.domains = [];
+
+        const createGlow = () => ({
+            setVisible: vi.fn(),
+            clear: vi.fn(),
+            fillStyle: vi.fn(),
+            fillCircle: vi.fn()
+        });
+        const left = { x: 100, y: 100, vendorData: { id: 'left' }, glowGraphic: createGlow(), displayWidth: 32 };
+        const right = { x: 400, y: 100, vendorData: { id: 'right' }, glowGraphic: createGlow(), displayWidth: 32 };
+        const idle = { x: 250, y: 100, glowGraphic: createGlow(), displayWidth: 32 };
+        const context = Object.assign(Object.create(VendorManager.prototype), {
+            vendorAssignmentDone: true,
+            interactionRange: 60,
+            nearbyVendor: null,
+            vendorSpatialIndex: null,
+            interactionPrompt: { setVisible: vi.fn() },
+            npcGroup: { getChildren: () => [left, right, idle] },
+            player: { x: 110, y: 100 },
+            camera: { scrollX: 0, scrollY: 0 },
+            isInteractionAvailable: () => true
+        });
+
+        context.update();
+        context.update();
+        expect(context.nearbyVendor).toBe(left);
+        expect(left.glowGraphic.setVisible).toHaveBeenCalledTimes(1);
+        expect(left.glowGraphic.fillCircle).toHaveBeenCalledTimes(2);
+
+        context.player.x = 250;
+        context.update();
+        expect(context.nearbyVendor).toBeNull();
+        expect(left.glowGraphic.setVisible).toHaveBeenCalledWith(false);
+        expect(idle.glowGraphic.setVisible).not.toHaveBeenCalled();
+
+        context.player.x = 380;
+        context.update();
+        expect(context.nearbyVendor).toBe(right);
+        expect(right.glowGraphic.setVisible).toHaveBeenCalledWith(true);
+        expect(left.glowGraphic.setVisible).toHaveBeenCalledTimes(2);
+    });
 });
\ No newline at end of file
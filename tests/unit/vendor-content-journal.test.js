@@ -0,0 +1,94 @@
+import fs from 'node:fs/promises';
+import os from 'node:os';
+import path from 'node:path';
+import { afterEach, beforeEach, describe, expect, it } from 'vitest';
+
+import { VendorContentStore } from '../../liveVendorAnnouncementStore.js';
+import { JOURNAL_FILE_NAME, SNAPSHOT_FILE_NAME, VendorContentJournal } from '../../vendorContentJournal.js';
+
+function createCountingFs() {
+    const counts = { appends: 0, syncs: 0 };
+    const fsImpl = {
+        ...fs,
+        open: async (...args) => {
+            const handle = await fs.open(...args);
+            return {
+                appendFile: (...appendArgs) => {
+                    counts.appends += 1;
+                    return handle.appendFile(...appendArgs);
+                },
+                sync: () => {
+                    counts.syncs += 1;
+                    return handle.sync();
+                },
+                writeFile: (...writeArgs) => handle.writeFile(...writeArgs),
+                truncate: length => handle.truncate(length),
+                close: () => handle.close()
+            };
+        }
+    };
+
+    return { fsImpl, counts };
+}
+
+describe('vendor content journal', () => {
+    let directory;
+
+    beforeEach(async () => {
+        directory = await fs.mkdtemp(path.join(os.tmpdir(), 'vendor-journal-'));
+    });
+
+    afterEach(async () => {
+        await fs.rm(directory, { recursive: true, force: true });
+    });
+
+    it('writes a burst of edits with one append and fsync, then replays them on restart', async () => {
+        const { fsImpl, counts } = createCountingFs();
+        const store = new VendorContentStore();
+        const journal = new VendorContentJournal({ directory, fsImpl });
+        await journal.open(store);
+
+        store.setAnnouncements('100', ['Demo at 2 PM']);
+        store.setAnnouncements('101', ['Raffle at 4']);
+        store.applyUpdates([{ vendorId: '102', clueText: 'Look for the blue banner' }, { vendorId: '100' }]);
+        await journal.flush();
+        await journal.close();
+
+        expect(counts.appends).toBe(1);
+        expect(counts.syncs).toBe(1);
+
+        const restored = new VendorContentStore();
+        const restoredJournal = new VendorContentJournal({ directory });
+        await expect(restoredJournal.open(restored)).resolves.toEqual({ revision: 3, replayed: 3 });
+        await restoredJournal.close();
+
+        expect(restored.toJSON()).toEqual(store.toJSON());
+    });
+
+    it('compacts into a snapshot and ignores a torn final journal line', async () => {
+        const store = new VendorContentStore();
+        const journal = new VendorContentJournal({ directory, compactAfter: 2 });
+        await journal.open(store);
+
+        store.setAnnouncements('100', ['Demo at 2 PM']);
+        store.setAnnouncements('101', ['Raffle at 4']);
+        await journal.flush();
+        store.setAnnouncements('102', ['Badge pickup']);
+        await journal.flush();
+        await journal.close();
+
+        const snapshot = JSON.parse(await fs.readFile(path.join(directory, SNAPSHOT_FILE_NAME), 'utf8'));
+        expect(snapshot.revision).toBe(2);
+        await fs.appendFile(path.join(directory, JOURNAL_FILE_NAME), '{"revision":4,"upd');
+
+        const restored = new VendorContentStore();
+        const restoredJournal = new VendorContentJournal({ directory });
+        await expect(restoredJournal.open(restored)).resolves.toEqual({ revision: 3, replayed: 1 });
+        restored.setAnnouncements('103', ['After restart']);
+        await restoredJournal.close();
+
+        const journalLines = (await fs.readFile(path.join(directory, JOURNAL_FILE_NAME), 'utf8')).trim().split('\n');
+        expect(journalLines.map(line => JSON.parse(line).revision)).toEqual([3, 4]);
+        expect(restored.getAnnouncementsForVendor('102')).toEqual(['Badge pickup']);
+    });
+});
@@ -0,0 +1,59 @@
+import { describe, expect, it, vi } from 'vitest';
+
+import {
+    decodePostings,
+    loadVendorSearchIndex,
+    normalizeSearchText,
+    VendorSearchIndex
+} from '../../vendorSearchIndex.js';
+
+describe('vendor search index', () => {
+    const indexPayload = {
+        version: 1,
+        vendors: [
+            ['100', 'Ben Armstrong', 'K05/K06'],
+            ['101', '2TailedFox', 'M08/M09/M10'],
+            ['102', 'Commodore Corner', 'R23']
+        ],
+        trigrams: {
+            ' be': [0],
+            ' co': [2],
+            ' k0': [0],
+            'ben': [0],
+            'com': [2],
+            'k05': [0],
+            'mod': [2],
+            'omm': [2],
+            'ore': [2],
+            'fox': [1],
+            'dor': [2],
+            'odo': [2],
+            'r23': [2],
+            're ': [0, 2]
+        }
+    };
+
+    it('normalizes search text and decodes delta postings', () => {
+        expect(normalizeSearchText('  K05/K06 Booth! ')).toBe('k05 k06 booth');
+        expect(decodePostings([2, 3, 1])).toEqual([2, 5, 6]);
+    });
+
+    it('answers substring queries from intersected trigram postings', () => {
+        const index = new VendorSearchIndex(indexPayload);
+
+        expect(index.search('modor')).toEqual([{ id: '102', name: 'Commodore Corner', booth: 'R23' }]);
+        expect(index.search('K05')).toEqual([{ id: '100', name: 'Ben Armstrong', booth: 'K05/K06' }]);
+        expect(index.search('zzz')).toEqual([]);
+        expect(index.search('re').map(vendor => vendor.id)).toEqual(['100', '102']);
+        expect(index.search('', { limit: 2 }).map(vendor => vendor.id)).toEqual(['100', '101']);
+    });
+
+    it('returns null when the index cannot be fetched', async () => {
+        const fetchImpl = vi.fn(async () => ({ ok: false }));
+
+        await expect(loadVendorSearchIndex({ fetchImpl })).resolves.toBeNull();
+        expect(fetchImpl).toHaveBeenCalledWith('vendor_search_index.json', {
+            headers: { Accept: 'application/json' }
+        });
+    });
+});
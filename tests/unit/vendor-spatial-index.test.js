@@ -0,0 +1,54 @@
+import { describe, expect, it } from 'vitest';
+
+import { VendorSpatialIndex } from '../../vendorSpatialIndex.js';
+
+function distanceTo(item, x, y) {
+    return item ? (item.x - x) ** 2 + (item.y - y) ** 2 : null;
+}
+
+function findNearestByScan(items, x, y, range) {
+    let nearest = null;
+    let nearestDistance = range;
+    items.forEach(item => {
+        const distance = Math.hypot(item.x - x, item.y - y);
+        if (distance < nearestDistance) {
+            nearestDistance = distance;
+            nearest = item;
+        }
+    });
+    return nearest;
+}
+
+describe('VendorSpatialIndex', () => {
+    it('finds the nearest item in range, including across cell borders', () => {
+        const near = { id: 'near', x: 59, y: 10 };
+        const far = { id: 'far', x: 130, y: 10 };
+        const index = new VendorSpatialIndex(60).rebuild([near, far]);
+
+        expect(index.size).toBe(2);
+        expect(index.findNearest(61, 10, 60)).toBe(near);
+        expect(index.findNearest(100, 10, 60)).toBe(far);
+        expect(index.findNearest(10, 200, 60)).toBeNull();
+        expect(index.findNearest(-30, 10, 60)).toBeNull();
+    });
+
+    it('matches a full scan for a hall of vendors', () => {
+        const items = [];
+        for (let index = 0; index < 200; index += 1) {
+            items.push({ id: index, x: (index * 37) % 900, y: (index * 53) % 700 });
+        }
+        const grid = new VendorSpatialIndex(60).rebuild(items);
+
+        for (let y = -40; y < 740; y += 23) {
+            for (let x = -40; x < 940; x += 29) {
+                // Compared by distance, since equidistant items may come back in either order.
+                expect(distanceTo(grid.findNearest(x, y, 60), x, y)).toBe(distanceTo(findNearestByScan(items, x, y, 60), x, y));
+                expect(distanceTo(grid.findNearest(x, y, 150), x, y)).toBe(distanceTo(findNearestByScan(items, x, y, 150), x, y));
+            }
+        }
+    });
+
+    it('rejects cell sizes that cannot bucket positions', () => {
+        expect(() => new VendorSpatialIndex(0)).toThrow();
+    });
+});
@@ -0,0 +1,318 @@
+import argparse
+import hashlib
+import json
+import os
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from content_cache import load_json
+from png_io import read_png, slice_tiles
+
+# Derives tile collision rectangles from the tileset image's alpha channel and
+# writes them into the embedded tileset metadata of a Tiled map (.json/.tmj or
+# .tmx), so tiles placed on the collision layers no longer need hand-authored
+# shapes before mapReadiness.js accepts the map.
+#
+# Each tile's opaque pixels (alpha >= --alpha-threshold) are optionally
+# clipped to a footprint band, e.g. --band 0.5 1 keeps the bottom half, and
+# decomposed into at most --max-rects tight rectangles (falling back to the
+# bounding box). Results are cached by a hash of the tile's pixels and the
+# extraction settings, so reruns only compute new or repainted tiles.
+#
+# Tiles that already have collision objects keep them unless --overwrite.
+
+DEFAULT_CACHE_PATH = 'tile_collision_cache.json'
+DEFAULT_ALPHA_THRESHOLD = 1
+DEFAULT_MAX_RECTS = 4
+AUTO_COLLISION_NAME = 'auto_collision'
+TILE_FLIP_FLAGS_MASK = 0x1FFFFFFF
+COLLISION_LAYERS = ('tables', 'tabletops')
+
+
+def mask_to_rects(mask, max_rects=DEFAULT_MAX_RECTS):
+    """Cover a boolean mask exactly with row-run rectangles, or return its bounding box"""
+    ys, xs = np.nonzero(mask)
+    if len(ys) == 0:
+        return []
+
+    bounds = (int(xs.min()), int(ys.min()), int(xs.max() - xs.min() + 1), int(ys.max() - ys.min() + 1))
+    if mask[bounds[1]:bounds[1] + bounds[3], bounds[0]:bounds[0] + bounds[2]].all():
+        return [bounds]
+
+    # Runs of opaque pixels per row; identical runs on consecutive rows grow one rect downward.
+    rects = []
+    open_rects = {}
+    for y in range(mask.shape[0]):
+        padded = np.concatenate(([False], mask[y], [False]))
+        edges = np.flatnonzero(padded[1:] != padded[:-1])
+        runs = set(zip(edges[::2].tolist(), edges[1::2].tolist()))
+
+        for run in list(open_rects):
+            if run not in runs:
+                rects.append(open_rects.pop(run))
+        for start, end in runs:
+            if (start, end) in open_rects:
+                open_rects[(start, end)][3] += 1
+            else:
+                open_rects[(start, end)] = [start, y, end - start, 1]
+    rects.extend(open_rects.values())
+
+    if len(rects) > max_rects:
+        return [bounds]
+    return sorted(tuple(rect) for rect in rects)
+
+
+def extract_tile_rects(tile, alpha_threshold=DEFAULT_ALPHA_THRESHOLD, band=None, max_rects=DEFAULT_MAX_RECTS):
+    """Return [(x, y, width, height)] covering the tile's opaque pixels inside the band"""
+    mask = tile[:, :, 3] >= alpha_threshold
+    if band:
+        height = mask.shape[0]
+        top, bottom = int(round(band[0] * height)), int(round(band[1] * height))
+        mask[:top] = False
+        mask[bottom:] = False
+    return mask_to_rects(mask, max_rects)
+
+
+def get_tile_key(tile, settings):
+    digest = hashlib.sha256(tile.tobytes())
+    digest.update(json.dumps([tile.shape, settings], sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+
+class CollisionCache:
+    """JSON file of extracted rects keyed by tile pixel and settings hash"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        self.entries = {}
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def save(self):
+        if not self.path:
+            return
+
+        temp_path = f'{self.path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+
+def derive_collision_rects(tiles, tile_ids, cache=None, alpha_threshold=DEFAULT_ALPHA_THRESHOLD, band=None,
+                           max_rects=DEFAULT_MAX_RECTS):
+    """Return ({tile id: rects}, {'computed': n, 'cached': n})"""
+    cache = cache if cache is not None else CollisionCache(None)
+    settings = {'alphaThreshold': alpha_threshold, 'band': list(band) if band else None, 'maxRects': max_rects}
+    rects_by_id = {}
+    counts = {'computed': 0, 'cached': 0}
+
+    for tile_id in sorted(tile_ids):
+        if not 0 <= tile_id < len(tiles):
+            continue
+        key = get_tile_key(tiles[tile_id], settings)
+        if key in cache.entries:
+            counts['cached'] += 1
+        else:
+            rects = extract_tile_rects(tiles[tile_id], alpha_threshold, band, max_rects)
+            cache.entries[key] = [list(rect) for rect in rects]
+            counts['computed'] += 1
+        if cache.entries[key]:
+            rects_by_id[tile_id] = [tuple(rect) for rect in cache.entries[key]]
+
+    return rects_by_id, counts
+
+
+def collect_layer_tile_ids(map_data, tileset, layer_names=COLLISION_LAYERS):
+    """Local tile ids of tileset used by the named tile layers"""
+    firstgid = tileset.get('firstgid', 1)
+    tilecount = tileset.get('tilecount') or 0
+    tile_ids = set()
+    for layer in map_data.get('layers') or []:
+        if layer.get('type') == 'tilelayer' and layer.get('name') in layer_names:
+            for gid in layer.get('data') or []:
+                tile_id = (gid & TILE_FLIP_FLAGS_MASK) - firstgid
+                if 0 <= tile_id < tilecount:
+                    tile_ids.add(tile_id)
+    return tile_ids
+
+
+def has_collision_objects(tile_entry):
+    objects = ((tile_entry or {}).get('objectgroup') or {}).get('objects') or []
+    return any(obj.get('width') and obj.get('height') for obj in objects)
+
+
+def apply_collision_rects(tileset, rects_by_id, overwrite=False):
+    """Write rects into tileset['tiles'] as objectgroups; return the tile ids that changed"""
+    tiles_by_id = {tile['id']: tile for tile in tileset.get('tiles') or []}
+    changed = []
+
+    for tile_id, rects in sorted(rects_by_id.items()):
+        entry = tiles_by_id.setdefault(tile_id, {'id': tile_id})
+        if has_collision_objects(entry) and not overwrite:
+            continue
+
+        entry['objectgroup'] = {
+            'draworder': 'index',
+            'name': '',
+            'objects': [
+                {
+                    'height': height, 'id': index + 1, 'name': AUTO_COLLISION_NAME, 'rotation': 0,
+                    'type': '', 'visible': True, 'width': width, 'x': x, 'y': y
+                }
+                for index, (x, y, width, height) in enumerate(rects)
+            ],
+            'opacity': 1,
+            'type': 'objectgroup',
+            'visible': True,
+            'x': 0,
+            'y': 0
+        }
+        changed.append(tile_id)
+
+    tileset['tiles'] = [tiles_by_id[tile_id] for tile_id in sorted(tiles_by_id)]
+    return changed
+
+
+def format_number(value):
+    return str(int(value)) if float(value).is_integer() else str(value)
+
+
+def read_tmx(path):
+    """Return (ElementTree, map dict) with the tile layers and tilesets a Tiled JSON map would have"""
+    tree = ET.parse(path)
+    root = tree.getroot()
+    map_data = {'layers': [], 'tilesets': []}
+
+    for layer in root.iter('layer'):
+        data = layer.find('data')
+        if data is None or data.get('encoding') != 'csv':
+            continue
+        gids = [int(value) for value in data.text.replace('\n', '').split(',') if value.strip()]
+        map_data['layers'].append({'type': 'tilelayer', 'name': layer.get('name'), 'data': gids})
+
+    for element in root.findall('tileset'):
+        image = element.find('image')
+        tileset = {
+            'firstgid': int(element.get('firstgid', 1)),
+            'name': element.get('name'),
+            'tilewidth': int(element.get('tilewidth')),
+            'tileheight': int(element.get('tileheight')),
+            'tilecount': int(element.get('tilecount', 0)),
+            'columns': int(element.get('columns', 0)),
+            'margin': int(element.get('margin', 0)),
+            'spacing': int(element.get('spacing', 0)),
+            'tiles': []
+        }
+        if image is not None:
+            tileset['image'] = image.get('source')
+        for tile in element.findall('tile'):
+            objects = [
+                {name: float(obj.get(name, 0)) for name in ('x', 'y', 'width', 'height')}
+                for obj in tile.iterfind('objectgroup/object')
+            ]
+            tileset['tiles'].append({'id': int(tile.get('id')), 'objectgroup': {'objects': objects}})
+        map_data['tilesets'].append(tileset)
+
+    return tree, map_data
+
+
+def write_tmx_collision(tree, tileset_name, rects_by_id, changed_ids):
+    """Replace the objectgroups of changed tiles in the named TMX tileset"""
+    element = next(ts for ts in tree.getroot().findall('tileset') if ts.get('name') == tileset_name)
+    tiles = {int(tile.get('id')): tile for tile in element.findall('tile')}
+
+    for tile_id in changed_ids:
+        tile = tiles.get(tile_id)
+        if tile is None:
+            tile = ET.Element('tile', {'id': str(tile_id)})
+            tiles[tile_id] = tile
+        for group in tile.findall('objectgroup'):
+            tile.remove(group)
+        group = ET.SubElement(tile, 'objectgroup', {'draworder': 'index', 'id': '2'})
+        for index, (x, y, width, height) in enumerate(rects_by_id[tile_id]):
+            ET.SubElement(group, 'object', {
+                'id': str(index + 1), 'name': AUTO_COLLISION_NAME, 'x': format_number(x), 'y': format_number(y),
+                'width': format_number(width), 'height': format_number(height)
+            })
+
+    # Tiled expects <tile> entries after <image>, in id order.
+    for tile in element.findall('tile'):
+        element.remove(tile)
+    element.extend(tiles[tile_id] for tile_id in sorted(tiles))
+
+
+def write_tmx(tree, path):
+    # Match Tiled's own serialization: one-space indent, double-quoted declaration, no space before '/>'.
+    ET.indent(tree, space=' ')
+    body = ET.tostring(tree.getroot(), encoding='unicode').replace(' />', '/>')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'<?xml version="1.0" encoding="UTF-8"?>\n{body}\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Derive tile collision rects from tileset alpha masks.')
+    parser.add_argument('map', nargs='?', default='assets/map.json', help='Tiled map (.json, .tmj, or .tmx)')
+    parser.add_argument('--tileset', default='tiles')
+    parser.add_argument('--image', help='tileset image path (default: resolved from the map)')
+    parser.add_argument('--layers', nargs='+', default=list(COLLISION_LAYERS),
+                        help='derive rects for tiles used on these layers')
+    parser.add_argument('--all-tiles', action='store_true', help='derive rects for every tile in the tileset')
+    parser.add_argument('--alpha-threshold', type=int, default=DEFAULT_ALPHA_THRESHOLD)
+    parser.add_argument('--band', nargs=2, type=float, metavar=('TOP', 'BOTTOM'),
+                        help='only use rows in this fraction of the tile height, e.g. 0.5 1 for the bottom half')
+    parser.add_argument('--max-rects', type=int, default=DEFAULT_MAX_RECTS)
+    parser.add_argument('--overwrite', action='store_true', help='replace existing collision objects')
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH)
+    parser.add_argument('--output', help='write the updated map here instead of in place')
+    parser.add_argument('--dry-run', action='store_true', help='report the rects without writing the map')
+    args = parser.parse_args()
+
+    is_tmx = os.path.splitext(args.map)[1].lower() == '.tmx'
+    if is_tmx:
+        tree, map_data = read_tmx(args.map)
+    else:
+        map_data = load_json(args.map)
+
+    tileset = next((ts for ts in map_data.get('tilesets') or [] if ts.get('name') == args.tileset), None)
+    if tileset is None:
+        parser.error(f'{args.map} has no embedded tileset named "{args.tileset}".')
+
+    image_path = args.image or os.path.join(os.path.dirname(args.map), tileset.get('image', ''))
+    if not os.path.exists(image_path) and not args.image:
+        # TMX files in the repo root reference images that live in assets/.
+        image_path = os.path.join('assets', os.path.basename(tileset.get('image', '')))
+    tiles = slice_tiles(read_png(image_path), tileset)
+
+    tile_ids = range(len(tiles)) if args.all_tiles else collect_layer_tile_ids(map_data, tileset, args.layers)
+    cache = CollisionCache(args.cache)
+    rects_by_id, counts = derive_collision_rects(
+        tiles, tile_ids, cache,
+        alpha_threshold=args.alpha_threshold,
+        band=args.band,
+        max_rects=args.max_rects
+    )
+    cache.save()
+
+    changed = apply_collision_rects(tileset, rects_by_id, overwrite=args.overwrite)
+    for tile_id in changed:
+        print(f"tile {tile_id}: {rects_by_id[tile_id]}")
+
+    if not args.dry_run and changed:
+        output = args.output or args.map
+        if is_tmx:
+            write_tmx_collision(tree, args.tileset, rects_by_id, changed)
+            write_tmx(tree, output)
+        else:
+            with open(output, 'w', encoding='utf-8') as f:
+                json.dump(map_data, f, indent=1)
+
+    print(
+        f"Derived collision for {len(rects_by_id)} tiles ({counts['computed']} computed, {counts['cached']} cached); "
+        f"{len(changed)} tiles {'would change' if args.dry_run else 'updated'}."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
-import json
 import random
 
+from content_model import Dialog, load_vendors, save_vendors
+
 def categorize_vendor(description, items, name):
     """Categorize vendor based on description and items"""
     desc_lower = description.lower()
@@ -216,28 +217,27 @@ def update_vendor_farewells():
     """Update all vendors with personalized farewell messages"""
 
     # Load vendors data
-    with open('vendors.json', 'r', encoding='utf-8') as f:
-        vendors = json.load(f)
+    vendors = load_vendors('vendors.json')
 
     print(f"Updating farewell messages for {len(vendors)} vendors...")
 
     for vendor in vendors:
-        category = categorize_vendor(vendor['description'], vendor['items'], vendor['name'])
+        category = categorize_vendor(vendor.description, vendor.item_dicts(), vendor.name)
         farewell_messages = get_farewell_messages(category)
 
         # Pick a random farewell message for this vendor
         farewell_text = random.choice(farewell_messages)
 
-        # Update the last response (should be the "end" action)
-        responses = vendor['dialog']['responses']
-        if responses and responses[-1]['action'] == 'end':
-            responses[-1]['text'] = farewell_text
+        # Update the last response (should be the "end" action); dialogs share
+        # their response lists, so replace the dialog instead of editing it.
+        dialog = vendor.dialog
+        if isinstance(dialog, Dialog) and dialog.responses and dialog.responses[-1][1] == 'end':
+            vendor.dialog = dialog.with_response_text('end', farewell_text)
 
-        print(f"Updated {vendor['name']} ({category}): {farewell_text}")
+        print(f"Updated {vendor.name} ({category}): {farewell_text}")
 
     # Save updated data
-    with open('vendors.json', 'w', encoding='utf-8') as f:
-        json.dump(vendors, f, indent=2, ensure_ascii=False)
+    save_vendors(vendors, 'vendors.json', ensure_ascii=False)
 
     print("All vendor farewell messages updated!")
 
@@ -0,0 +1,194 @@
+import fs from 'node:fs/promises';
+import path from 'node:path';
+
+// Durable storage for the live VendorContentStore on the hosted server.
+//
+//   <directory>/snapshot.json   compacted store state plus the revision it covers
+//   <directory>/journal.ndjson  one store change per line, appended after the snapshot
+//
+// Changes are buffered and written with one append plus one fsync per flush
+// window, so bursts of dashboard edits share a disk sync. Once the journal
+// holds compactAfter records it is folded into a fresh snapshot, which keeps
+// startup replay bounded no matter how long the server has been running.
+
+export const SNAPSHOT_FILE_NAME = 'snapshot.json';
+export const JOURNAL_FILE_NAME = 'journal.ndjson';
+
+async function readFileIfExists(fsImpl, filePath, encoding) {
+    try {
+        return await fsImpl.readFile(filePath, encoding);
+    } catch (error) {
+        if (error.code === 'ENOENT') {
+            return null;
+        }
+
+        throw error;
+    }
+}
+
+// Returns the complete records and the byte length they occupy. A final line
+// without a newline or that fails to parse is a torn write from a crash.
+export function parseJournal(buffer) {
+    const records = [];
+    let validBytes = 0;
+
+    while (validBytes < buffer.length) {
+        const lineEnd = buffer.indexOf(0x0a, validBytes);
+        if (lineEnd === -1) {
+            break;
+        }
+
+        const line = buffer.toString('utf8', validBytes, lineEnd).trim();
+        if (line) {
+            try {
+                records.push(JSON.parse(line));
+            } catch {
+                break;
+            }
+        }
+
+        validBytes = lineEnd + 1;
+    }
+
+    return { records, validBytes };
+}
+
+export class VendorContentJournal {
+    constructor({
+        directory,
+        flushDelayMs = 20,
+        compactAfter = 500,
+        fsImpl = fs,
+        setTimeoutImpl = setTimeout
+    }) {
+        this.directory = directory;
+        this.snapshotPath = path.join(directory, SNAPSHOT_FILE_NAME);
+        this.journalPath = path.join(directory, JOURNAL_FILE_NAME);
+        this.flushDelayMs = flushDelayMs;
+        this.compactAfter = compactAfter;
+        this.fsImpl = fsImpl;
+        this.setTimeoutImpl = setTimeoutImpl;
+        this.store = null;
+        this.journalHandle = null;
+        this.unsubscribe = null;
+        this.pendingLines = [];
+        this.recordsSinceSnapshot = 0;
+        this.flushPromise = null;
+        this.writeChain = Promise.resolve();
+    }
+
+    // Loads the snapshot, replays the journal tail into store, and starts
+    // recording the store's changes.
+    async open(store) {
+        this.store = store;
+        await this.fsImpl.mkdir(this.directory, { recursive: true });
+
+        const snapshotText = await readFileIfExists(this.fsImpl, this.snapshotPath, 'utf8');
+        if (snapshotText) {
+            const snapshot = JSON.parse(snapshotText);
+            store.replaceSnapshot({ vendors: snapshot.vendors ?? [] });
+            store.resetRevision(snapshot.revision ?? 0);
+        }
+
+        let replayed = 0;
+        const journalBuffer = await readFileIfExists(this.fsImpl, this.journalPath);
+        if (journalBuffer) {
+            const { records, validBytes } = parseJournal(journalBuffer);
+            for (const record of records) {
+                if (record.revision > store.revision) {
+                    store.applyChange(record);
+                    replayed += 1;
+                }
+            }
+
+            if (validBytes < journalBuffer.length) {
+                await this.fsImpl.truncate(this.journalPath, validBytes);
+            }
+        }
+
+        this.journalHandle = await this.fsImpl.open(this.journalPath, 'a');
+        this.recordsSinceSnapshot = replayed;
+        this.unsubscribe = store.subscribe(change => this.record(change));
+
+        return { revision: store.revision, replayed };
+    }
+
+    record(change) {
+        this.pendingLines.push(`${JSON.stringify(change)}\n`);
+        this.recordsSinceSnapshot += 1;
+        this.flush().catch(error => {
+            console.error('Vendor content journal write failed:', error);
+        });
+    }
+
+    // Resolves once every change recorded so far is on disk. Callers that
+    // arrive within the same flush window share one write and one fsync.
+    flush() {
+        if (!this.flushPromise) {
+            this.flushPromise = new Promise(resolve => {
+                this.setTimeoutImpl(resolve, this.flushDelayMs);
+            }).then(() => {
+                this.flushPromise = null;
+                return this.enqueue(() => this.writePending());
+            });
+        }
+
+        return this.flushPromise;
+    }
+
+    enqueue(task) {
+        const result = this.writeChain.then(task);
+        this.writeChain = result.catch(() => {});
+        return result;
+    }
+
+    async writePending() {
+        const lines = this.pendingLines.splice(0);
+        if (lines.length > 0) {
+            await this.journalHandle.appendFile(lines.join(''), 'utf8');
+            await this.journalHandle.sync();
+        }
+
+        if (this.recordsSinceSnapshot >= this.compactAfter) {
+            await this.writeSnapshot();
+        }
+    }
+
+    async writeSnapshot() {
+        // Serialized synchronously, so changes made while the file is written
+        // stay in pendingLines and land in the journal after it is truncated.
+        const revision = this.store.revision;
+        const body = JSON.stringify({ version: 1, revision, vendors: this.store.toJSON().vendors });
+        const temporaryPath = `${this.snapshotPath}.tmp`;
+
+        const snapshotHandle = await this.fsImpl.open(temporaryPath, 'w');
+        try {
+            await snapshotHandle.writeFile(body, 'utf8');
+            await snapshotHandle.sync();
+        } finally {
+            await snapshotHandle.close();
+        }
+        await this.fsImpl.rename(temporaryPath, this.snapshotPath);
+
+        await this.journalHandle.truncate(0);
+        await this.journalHandle.sync();
+        this.recordsSinceSnapshot = this.pendingLines.length;
+
+        return revision;
+    }
+
+    compact() {
+        return this.enqueue(async () => {
+            await this.writePending();
+            return this.writeSnapshot();
+        });
+    }
+
+    async close() {
+        this.unsubscribe?.();
+        this.unsubscribe = null;
+        await this.enqueue(() => this.writePending());
+        await this.journalHandle?.close();
+        this.journalHandle = null;
+    }
+}
@@ -14,6 +14,7 @@ import {
     createVendorReturnButton,
     createVendorRootDialogData
 } from './vendorDialogModels.js';
+import { VendorSpatialIndex } from './vendorSpatialIndex.js';
 
 class VendorManager {
     constructor(scene, {
@@ -48,6 +49,8 @@ class VendorManager {
         this.interactionRange = 60;
         this.nearbyVendor = null;
         this.vendorAssignmentDone = false;
+        this.vendorSpatialIndex = null;
+        this.indexedNPCCount = 0;
 
         this.assignVendorsToNPCs();
         this.createInteractionPrompt();
@@ -89,6 +92,53 @@ class VendorManager {
             npcSprite.glowPulse = 0;
         });
         this.vendorAssignmentDone = true;
+        this.vendorSpatialIndex = null;
+    }
+
+    // NPCs stand still once spawned, so the grid is built once after vendors
+    // are assigned and only rebuilt if the group gains or loses sprites.
+    getVendorSpatialIndex() {
+        const npcSprites = this.getNPCSprites();
+        if (!this.vendorSpatialIndex || this.indexedNPCCount !== npcSprites.length) {
+            this.vendorSpatialIndex = new VendorSpatialIndex(this.interactionRange)
+                .rebuild(npcSprites.filter(npcSprite => npcSprite.vendorData));
+            this.indexedNPCCount = npcSprites.length;
+        }
+
+        return this.vendorSpatialIndex;
+    }
+
+    findNearestVendor() {
+        return this.getVendorSpatialIndex().findNearest(this.player.x, this.player.y, this.interactionRange);
+    }
+
+    // Glow visibility only changes when a different vendor becomes the nearest.
+    setNearbyVendor(npcSprite) {
+        if (npcSprite === this.nearbyVendor) {
+            return;
+        }
+
+        this.nearbyVendor?.glowGraphic?.setVisible(false);
+        this.nearbyVendor = npcSprite;
+        this.nearbyVendor?.glowGraphic?.setVisible(true);
+    }
+
+    drawVendorGlow(npcSprite) {
+        const glow = npcSprite.glowGraphic;
+        if (!glow) {
+            return;
+        }
+
+        // Pulsing circular glow effect
+        npcSprite.glowPulse = (npcSprite.glowPulse || 0) + 0.08;
+        const pulse = 0.7 + 0.3 * Math.sin(npcSprite.glowPulse);
+        glow.clear();
+        glow.fillStyle(0x00FFFF, 0.25 + 0.25 * pulse);
+        glow.fillCircle(
+            npcSprite.x,
+            npcSprite.y,
+            (npcSprite.displayWidth * 0.7) + (npcSprite.displayWidth * 0.3 * pulse)
+        );
     }
 
     getAssignedVendor(index) {
@@ -400,64 +450,25 @@ class VendorManager {
     }
 
     update() {
-        this.assignVendorsToNPCs();
+        if (!this.vendorAssignmentDone) {
+            this.assignVendorsToNPCs();
+        }
 
         if (!this.player || !this.npcGroup || !this.camera) return;
 
         if (!DomainManager.isLoaded()) {
-            this.nearbyVendor = null;
+            this.setNearbyVendor(null);
             this.interactionPrompt.setVisible(false);
             return;
         }
 
-        this.nearbyVendor = null;
-
-        // Clear all effects
-        this.getNPCSprites().forEach(npcSprite => {
-            if (npcSprite.glowGraphic) npcSprite.glowGraphic.setVisible(false);
-        });
-
-        // Find the closest vendor in range
-        let closestVendor = null;
-        let closestDistance = this.interactionRange;
-
-        this.getNPCSprites().forEach(npcSprite => {
-            if (!npcSprite.vendorData) return;
+        const closestVendor = this.findNearestVendor();
+        this.setNearbyVendor(closestVendor);
 
-            const distance = Phaser.Math.Distance.Between(
-                this.player.x,
-                this.player.y,
-                npcSprite.x,
-                npcSprite.y
-            );
-
-            if (distance < closestDistance) {
-                closestDistance = distance;
-                closestVendor = npcSprite;
-            }
-        });
-
-        // Apply effect to the closest one
         if (closestVendor) {
-            this.nearbyVendor = closestVendor;
             this.interactionPrompt.x = closestVendor.x - this.camera.scrollX;
             this.interactionPrompt.y = closestVendor.y - this.camera.scrollY - 40;
-
-            // Pulsing circular glow effect
-            if (closestVendor.glowGraphic) {
-                closestVendor.glowPulse = (closestVendor.glowPulse || 0) + 0.08;
-                const pulse = 0.7 + 0.3 * Math.sin(closestVendor.glowPulse);
-                closestVendor.glowGraphic.clear();
-                closestVendor.glowGraphic.fillStyle(0x00FFFF, 0.25 + 0.25 * pulse);
-                closestVendor.glowGraphic.fillCircle(
-                    closestVendor.x,
-                    closestVendor.y,
-                    (closestVendor.displayWidth * 0.7) + (closestVendor.displayWidth * 0.3 * pulse)
-                );
-                closestVendor.glowGraphic.setVisible(true);
-            }
-        } else {
-            this.nearbyVendor = null;
+            this.drawVendorGlow(closestVendor);
         }
 
         if (this.nearbyVendor && this.isInteractionAvailable()) {
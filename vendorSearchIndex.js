@@ -0,0 +1,127 @@
+export const DEFAULT_VENDOR_SEARCH_INDEX_URL = 'vendor_search_index.json';
+
+export function normalizeSearchText(value) {
+    return String(value ?? '')
+        .toLowerCase()
+        .replace(/[^0-9a-z]+/g, ' ')
+        .trim();
+}
+
+export function decodePostings(deltas) {
+    const ordinals = new Array(deltas.length);
+    let current = 0;
+
+    for (let index = 0; index < deltas.length; index += 1) {
+        current += deltas[index];
+        ordinals[index] = current;
+    }
+
+    return ordinals;
+}
+
+function intersectSorted(left, right) {
+    const result = [];
+    let leftIndex = 0;
+    let rightIndex = 0;
+
+    while (leftIndex < left.length && rightIndex < right.length) {
+        if (left[leftIndex] === right[rightIndex]) {
+            result.push(left[leftIndex]);
+            leftIndex += 1;
+            rightIndex += 1;
+        } else if (left[leftIndex] < right[rightIndex]) {
+            leftIndex += 1;
+        } else {
+            rightIndex += 1;
+        }
+    }
+
+    return result;
+}
+
+function toVendorRow([id, name, booth]) {
+    return { id, name, booth };
+}
+
+export class VendorSearchIndex {
+    constructor(index) {
+        this.vendors = Array.isArray(index?.vendors) ? index.vendors : [];
+        this.trigrams = index?.trigrams && typeof index.trigrams === 'object' ? index.trigrams : {};
+        this.decodedPostings = new Map();
+    }
+
+    get size() {
+        return this.vendors.length;
+    }
+
+    getPostings(trigram) {
+        if (!this.decodedPostings.has(trigram)) {
+            const deltas = this.trigrams[trigram];
+            this.decodedPostings.set(trigram, Array.isArray(deltas) ? decodePostings(deltas) : null);
+        }
+
+        return this.decodedPostings.get(trigram);
+    }
+
+    searchOrdinals(query) {
+        const normalizedQuery = normalizeSearchText(query);
+        if (!normalizedQuery) {
+            return this.vendors.map((vendor, ordinal) => ordinal);
+        }
+
+        // Queries shorter than a trigram match any trigram containing them.
+        if (normalizedQuery.length < 3) {
+            const matches = new Set();
+            for (const trigram of Object.keys(this.trigrams)) {
+                if (trigram.includes(normalizedQuery)) {
+                    this.getPostings(trigram).forEach(ordinal => matches.add(ordinal));
+                }
+            }
+
+            return Array.from(matches).sort((left, right) => left - right);
+        }
+
+        const queryTrigrams = new Set();
+        for (let index = 0; index <= normalizedQuery.length - 3; index += 1) {
+            queryTrigrams.add(normalizedQuery.slice(index, index + 3));
+        }
+
+        const candidateLists = [];
+        for (const trigram of queryTrigrams) {
+            const postings = this.getPostings(trigram);
+            if (!postings) {
+                return [];
+            }
+
+            candidateLists.push(postings);
+        }
+
+        candidateLists.sort((left, right) => left.length - right.length);
+        return candidateLists.slice(1).reduce(
+            (result, postings) => (result.length > 0 ? intersectSorted(result, postings) : result),
+            candidateLists[0]
+        );
+    }
+
+    search(query, { limit = Infinity } = {}) {
+        return this.searchOrdinals(query)
+            .slice(0, limit)
+            .map(ordinal => toVendorRow(this.vendors[ordinal]));
+    }
+}
+
+export async function loadVendorSearchIndex({
+    url = DEFAULT_VENDOR_SEARCH_INDEX_URL,
+    fetchImpl = globalThis.fetch
+} = {}) {
+    if (typeof fetchImpl !== 'function') {
+        return null;
+    }
+
+    try {
+        const response = await fetchImpl(url, { headers: { Accept: 'application/json' } });
+        return response.ok ? new VendorSearchIndex(await response.json()) : null;
+    } catch {
+        return null;
+    }
+}
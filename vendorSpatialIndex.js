@@ -0,0 +1,72 @@
+// Uniform grid over vendor NPC positions. With the cell size at least the
+// interaction range, anything in range of a point lies in that point's cell or
+// one of its eight neighbours, so a lookup costs the same however many vendors
+// the hall holds.
+
+function getCellKey(column, row) {
+    return `${column},${row}`;
+}
+
+export class VendorSpatialIndex {
+    constructor(cellSize) {
+        if (!(cellSize > 0)) {
+            throw new Error(`Vendor spatial index needs a positive cell size, got ${cellSize}`);
+        }
+
+        this.cellSize = cellSize;
+        this.cells = new Map();
+        this.size = 0;
+    }
+
+    getCell(value) {
+        return Math.floor(value / this.cellSize);
+    }
+
+    insert(item) {
+        const key = getCellKey(this.getCell(item.x), this.getCell(item.y));
+        const cell = this.cells.get(key);
+        if (cell) {
+            cell.push(item);
+        } else {
+            this.cells.set(key, [item]);
+        }
+        this.size += 1;
+    }
+
+    rebuild(items) {
+        this.cells.clear();
+        this.size = 0;
+        items.forEach(item => this.insert(item));
+        return this;
+    }
+
+    // Returns the item closest to (x, y) strictly within range, or null.
+    findNearest(x, y, range) {
+        const reach = Math.max(1, Math.ceil(range / this.cellSize));
+        const column = this.getCell(x);
+        const row = this.getCell(y);
+        let nearest = null;
+        let nearestDistanceSquared = range * range;
+
+        for (let cellRow = row - reach; cellRow <= row + reach; cellRow += 1) {
+            for (let cellColumn = column - reach; cellColumn <= column + reach; cellColumn += 1) {
+                const cell = this.cells.get(getCellKey(cellColumn, cellRow));
+                if (!cell) {
+                    continue;
+                }
+
+                for (const item of cell) {
+                    const dx = item.x - x;
+                    const dy = item.y - y;
+                    const distanceSquared = dx * dx + dy * dy;
+                    if (distanceSquared < nearestDistanceSquared) {
+                        nearestDistanceSquared = distanceSquared;
+                        nearest = item;
+                    }
+                }
+            }
+        }
+
+        return nearest;
+    }
+}
@@ -0,0 +1,182 @@
+import argparse
+import csv
+import http.client
+import json
+import os
+import sys
+from urllib.parse import urlsplit
+
+# Bulk-loads live vendor content (announcements, booth notes, featured items)
+# into a running server.js before doors open. Updates are read from a CSV or
+# JSON file, packed into batches bounded by count and encoded size, and posted
+# to /api/vendor-content/batch over one kept-alive connection. Each batch is
+# applied by the server as a single store revision.
+
+DEFAULT_URL = 'http://localhost:5000'
+BATCH_PATH = '/api/vendor-content/batch'
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_MAX_BATCH_BYTES = 1024 * 1024
+CONTENT_FIELDS = ('descriptionOverride', 'featuredItems', 'announcements', 'clueText', 'moderationStatus')
+LIST_FIELDS = ('featuredItems', 'announcements')
+VENDOR_ID_FIELDS = ('vendorId', 'vendor_id', 'id')
+
+
+class BatchImportError(Exception):
+    pass
+
+
+def normalize_update(row):
+    """Map one CSV/JSON row to a batch update, or None when it has no vendor id"""
+    vendor_id = next((str(row[field]).strip() for field in VENDOR_ID_FIELDS if row.get(field) not in (None, '')), '')
+    if not vendor_id:
+        return None
+
+    update = {'vendorId': vendor_id}
+    for field in CONTENT_FIELDS:
+        value = row.get(field)
+        if isinstance(value, str):
+            value = value.strip()
+            if field in LIST_FIELDS:
+                # CSV cells use '|' between list items; the server splits on newlines.
+                value = value.replace(' | ', '\n').replace('|', '\n')
+        if value not in (None, '', []):
+            update[field] = value
+    return update
+
+
+def read_updates(path):
+    """Read updates from a .csv file or a JSON list / {"updates"|"vendors": [...]} file"""
+    if os.path.splitext(path)[1].lower() == '.csv':
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            rows = list(csv.DictReader(f))
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        rows = data if isinstance(data, list) else data.get('updates') or data.get('vendors') or []
+
+    updates = []
+    skipped = 0
+    for row in rows:
+        update = normalize_update(row) if isinstance(row, dict) else None
+        if update:
+            updates.append(update)
+        else:
+            skipped += 1
+    return updates, skipped
+
+
+def iter_batches(updates, batch_size=DEFAULT_BATCH_SIZE, max_bytes=DEFAULT_MAX_BATCH_BYTES):
+    """Yield lists of updates whose encoded {"updates": [...]} body stays under max_bytes"""
+    batch = []
+    batch_bytes = len(b'{"updates":[]}')
+    for update in updates:
+        size = len(json.dumps(update, separators=(',', ':')).encode('utf-8')) + 1
+        if batch and (len(batch) >= batch_size or batch_bytes + size > max_bytes):
+            yield batch
+            batch = []
+            batch_bytes = len(b'{"updates":[]}')
+        batch.append(update)
+        batch_bytes += size
+    if batch:
+        yield batch
+
+
+class BatchClient:
+    """Posts batches over one HTTP/1.1 connection, reconnecting once if the server closed it"""
+
+    def __init__(self, base_url, timeout=30.0):
+        parts = urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.connection = connection_class(parts.hostname, parts.port, timeout=timeout)
+        self.path = parts.path.rstrip('/') + BATCH_PATH
+        self.connections = 0
+
+    def post(self, updates):
+        body = json.dumps({'updates': updates}, separators=(',', ':')).encode('utf-8')
+        headers = {'Content-Type': 'application/json', 'Connection': 'keep-alive'}
+
+        for attempt in range(2):
+            if self.connection.sock is None:
+                self.connections += 1
+            try:
+                self.connection.request('POST', self.path, body=body, headers=headers)
+                response = self.connection.getresponse()
+                payload = response.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self.connection.close()
+                if attempt:
+                    raise
+
+        # Proxies in front of the server answer errors with HTML, so only trust the body as JSON on success.
+        try:
+            result = json.loads(payload or b'{}')
+        except ValueError:
+            result = None
+
+        if response.status != 200:
+            detail = result.get('error', '') if isinstance(result, dict) else payload[:200].decode('utf-8', 'replace')
+            raise BatchImportError(f'Batch rejected with HTTP {response.status}: {detail}')
+        if not isinstance(result, dict):
+            raise BatchImportError('Batch response was not a JSON object.')
+        return result
+
+    def close(self):
+        self.connection.close()
+
+
+def import_updates(updates, base_url=DEFAULT_URL, batch_size=DEFAULT_BATCH_SIZE, max_bytes=DEFAULT_MAX_BATCH_BYTES):
+    """Post every update in batches and return a summary with the final store revision"""
+    client = BatchClient(base_url)
+    summary = {'batches': 0, 'updated': 0, 'rejected': [], 'revision': None}
+    offset = 0
+    try:
+        for batch in iter_batches(updates, batch_size, max_bytes):
+            result = client.post(batch)
+            summary['batches'] += 1
+            summary['updated'] += result.get('updated', 0)
+            summary['rejected'].extend(update_index + offset for update_index in result.get('rejected', []))
+            summary['revision'] = result.get('revision')
+            offset += len(batch)
+    finally:
+        client.close()
+
+    summary['connections'] = client.connections
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk-import live vendor content into a running server.')
+    parser.add_argument('source', help='CSV or JSON file of vendor content updates')
+    parser.add_argument('--url', default=DEFAULT_URL, help=f'server base URL (default: {DEFAULT_URL})')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--max-batch-bytes', type=int, default=DEFAULT_MAX_BATCH_BYTES)
+    parser.add_argument('--dry-run', action='store_true', help='read and batch the updates without sending them')
+    args = parser.parse_args()
+
+    updates, skipped = read_updates(args.source)
+    if skipped:
+        print(f"Skipped {skipped} rows without a vendor id.", file=sys.stderr)
+
+    if args.dry_run:
+        batches = list(iter_batches(updates, args.batch_size, args.max_batch_bytes))
+        print(f"Would send {len(updates)} updates in {len(batches)} batches.")
+        return
+
+    try:
+        summary = import_updates(updates, args.url, args.batch_size, args.max_batch_bytes)
+    except (OSError, BatchImportError) as error:
+        print(f"Import failed: {error}", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"Imported {summary['updated']} of {len(updates)} updates in {summary['batches']} batches "
+        f"over {summary['connections']} connection(s); store revision {summary['revision']}."
+    )
+    if summary['rejected']:
+        print(f"Rejected update indexes: {summary['rejected']}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import argparse
+import json
+import re
+
+from content_cache import load_json
+
+INDEX_VERSION = 1
+NON_SEARCH_CHARACTERS = re.compile(r'[^0-9a-z]+')
+
+
+def normalize_search_text(text):
+    """Lowercase text and collapse punctuation/whitespace runs into single spaces"""
+    return NON_SEARCH_CHARACTERS.sub(' ', str(text or '').lower()).strip()
+
+
+def get_trigrams(text):
+    """Return the set of padded trigrams for one normalized field"""
+    if not text:
+        return set()
+
+    padded = f' {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def get_vendor_search_fields(vendor, domain_names):
+    """Collect the searchable text fields for a vendor"""
+    fields = [
+        vendor.get('name', ''),
+        vendor.get('booth', ''),
+        vendor.get('description', ''),
+        domain_names.get(vendor.get('domain_id'), '')
+    ]
+    fields.extend(vendor.get('featuredItems') or [])
+    return [normalize_search_text(field) for field in fields]
+
+
+def encode_postings(ordinals):
+    """Delta-encode a sorted list of vendor ordinals"""
+    deltas = []
+    previous = 0
+    for ordinal in ordinals:
+        deltas.append(ordinal - previous)
+        previous = ordinal
+    return deltas
+
+
+def decode_postings(deltas):
+    """Expand delta-encoded postings back into vendor ordinals"""
+    ordinals = []
+    current = 0
+    for delta in deltas:
+        current += delta
+        ordinals.append(current)
+    return ordinals
+
+
+def build_search_index(vendors, domains=()):
+    """Build a compact trigram index over vendor search fields"""
+    domain_names = {domain['id']: domain.get('name', '') for domain in domains}
+    postings = {}
+
+    for ordinal, vendor in enumerate(vendors):
+        vendor_trigrams = set()
+        for field in get_vendor_search_fields(vendor, domain_names):
+            vendor_trigrams.update(get_trigrams(field))
+
+        for trigram in vendor_trigrams:
+            postings.setdefault(trigram, []).append(ordinal)
+
+    return {
+        'version': INDEX_VERSION,
+        'vendors': [[vendor['id'], vendor.get('name', ''), vendor.get('booth', '')] for vendor in vendors],
+        'trigrams': {trigram: encode_postings(postings[trigram]) for trigram in sorted(postings)}
+    }
+
+
+def intersect_sorted(left, right):
+    """Intersect two ascending ordinal lists"""
+    result = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if left[i] == right[j]:
+            result.append(left[i])
+            i += 1
+            j += 1
+        elif left[i] < right[j]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def search_vendor_ordinals(index, query):
+    """Return ascending vendor ordinals whose indexed text contains the query"""
+    normalized_query = normalize_search_text(query)
+    if not normalized_query:
+        return list(range(len(index['vendors'])))
+
+    trigrams = index['trigrams']
+
+    # Queries shorter than a trigram match any trigram containing them.
+    if len(normalized_query) < 3:
+        matches = set()
+        for trigram, deltas in trigrams.items():
+            if normalized_query in trigram:
+                matches.update(decode_postings(deltas))
+        return sorted(matches)
+
+    query_trigrams = {normalized_query[i:i + 3] for i in range(len(normalized_query) - 2)}
+    candidate_lists = []
+    for trigram in query_trigrams:
+        deltas = trigrams.get(trigram)
+        if deltas is None:
+            return []
+        candidate_lists.append(deltas)
+
+    # Intersect the rarest postings first so the candidate set shrinks quickly.
+    candidate_lists.sort(key=len)
+    result = decode_postings(candidate_lists[0])
+    for deltas in candidate_lists[1:]:
+        if not result:
+            break
+        result = intersect_sorted(result, decode_postings(deltas))
+    return result
+
+
+def search_vendors(index, query, limit=None):
+    """Return matching [id, name, booth] rows for a query"""
+    ordinals = search_vendor_ordinals(index, query)
+    if limit is not None:
+        ordinals = ordinals[:limit]
+    return [index['vendors'][ordinal] for ordinal in ordinals]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the vendor trigram search index.')
+    parser.add_argument('--vendors', default='vendors.json')
+    parser.add_argument('--domains', default='technology_domains.json')
+    parser.add_argument('--output', default='vendor_search_index.json')
+    args = parser.parse_args()
+
+    vendors = load_json(args.vendors)
+    domains = load_json(args.domains)
+
+    index = build_search_index(vendors, domains)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(index, f, separators=(',', ':'), ensure_ascii=False)
+
+    print(f"Indexed {len(index['vendors'])} vendors into {len(index['trigrams'])} trigrams.")
+
+
+if __name__ == "__main__":
+    main()
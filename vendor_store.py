@@ -0,0 +1,336 @@
+import argparse
+import json
+import mmap
+import os
+import struct
+
+from content_cache import load_json
+
+# Binary vendor store layout (little-endian):
+#   header       magic, version, record count, table offsets, string pool bounds
+#   order table  u32 record offset per vendor, in source order
+#   id table     (id offset, id length, record offset) sorted by id bytes
+#   records      string refs, extra JSON ref, x/y, field presence flags,
+#                then counted list refs
+#   string pool  deduplicated UTF-8 strings referenced as (offset, length)
+MAGIC = b'TTVS'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHHIIIIII')
+STRING_REF = struct.Struct('<II')
+ID_ENTRY = struct.Struct('<III')
+ORDER_ENTRY = struct.Struct('<I')
+COUNT = struct.Struct('<I')
+COORDS = struct.Struct('<ii')
+FLAGS = struct.Struct('<I')
+INT32_RANGE = range(-2 ** 31, 2 ** 31)
+
+STRING_FIELDS = ('id', 'name', 'booth', 'url', 'description', 'domain_id', 'clueText')
+LIST_FIELDS = ('facts', 'featuredItems', 'announcements')
+COORD_FIELDS = ('x', 'y')
+STORED_FIELDS = STRING_FIELDS + LIST_FIELDS + COORD_FIELDS
+COORDS_OFFSET = STRING_REF.size * (len(STRING_FIELDS) + 1)
+FLAGS_OFFSET = COORDS_OFFSET + COORDS.size
+RECORD_PREFIX_SIZE = FLAGS_OFFSET + FLAGS.size
+
+
+class VendorStoreError(Exception):
+    pass
+
+
+class StringPool:
+    """Deduplicating UTF-8 string pool used while writing a store"""
+
+    def __init__(self):
+        self.refs = {}
+        self.data = bytearray()
+
+    def add(self, value):
+        if value in self.refs:
+            return self.refs[value]
+
+        encoded = value.encode('utf-8')
+        ref = (len(self.data), len(encoded))
+        self.data.extend(encoded)
+        self.refs[value] = ref
+        return ref
+
+
+def check_stored_value(vendor, field, value, valid):
+    # Records hold strings and int32 coordinates only; anything else would not read back as written.
+    if not valid:
+        raise VendorStoreError(f'Vendor {vendor.get("id")!r} field {field!r} cannot be stored exactly: {value!r}')
+
+
+def encode_vendor_record(vendor, pool):
+    """Pack one vendor dict into its binary record"""
+    parts = []
+    for field in STRING_FIELDS:
+        value = vendor.get(field)
+        check_stored_value(vendor, field, value, isinstance(value, str) or (value is None and field != 'id'))
+        parts.append(STRING_REF.pack(*pool.add(value or '')))
+
+    extra = {key: value for key, value in vendor.items() if key not in STORED_FIELDS}
+    extra_json = json.dumps(extra, separators=(',', ':'), ensure_ascii=False) if extra else ''
+    parts.append(STRING_REF.pack(*pool.add(extra_json)))
+    coords = []
+    for field in COORD_FIELDS:
+        value = vendor.get(field)
+        check_stored_value(vendor, field, value, value is None or (type(value) is int and value in INT32_RANGE))
+        coords.append(value or 0)
+    parts.append(COORDS.pack(*coords))
+
+    # Remember which fields the source had so readers can round-trip them.
+    flags = 0
+    for bit, field in enumerate(STORED_FIELDS):
+        if vendor.get(field) is not None:
+            flags |= 1 << bit
+    parts.append(FLAGS.pack(flags))
+
+    for field in LIST_FIELDS:
+        values = vendor.get(field) or []
+        check_stored_value(vendor, field, values, isinstance(values, list) and all(
+            isinstance(value, str) for value in values
+        ))
+        parts.append(COUNT.pack(len(values)))
+        parts.extend(STRING_REF.pack(*pool.add(value)) for value in values)
+
+    return b''.join(parts)
+
+
+def write_vendor_store(vendors, path):
+    """Write vendors to a binary store at path"""
+    pool = StringPool()
+    records = [encode_vendor_record(vendor, pool) for vendor in vendors]
+    ids = [vendor['id'] for vendor in vendors]
+
+    if len(set(ids)) != len(ids):
+        raise VendorStoreError('Vendor ids must be unique.')
+
+    order_table_offset = HEADER.size
+    id_table_offset = order_table_offset + ORDER_ENTRY.size * len(records)
+    records_offset = id_table_offset + ID_ENTRY.size * len(records)
+
+    record_offsets = []
+    cursor = records_offset
+    for record in records:
+        record_offsets.append(cursor)
+        cursor += len(record)
+    pool_offset = cursor
+
+    id_entries = sorted(
+        (vendor_id.encode('utf-8'), pool.refs[vendor_id], record_offsets[ordinal])
+        for ordinal, vendor_id in enumerate(ids)
+    )
+
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(
+            MAGIC, FORMAT_VERSION, 0, len(records),
+            order_table_offset, id_table_offset, records_offset, pool_offset, len(pool.data)
+        ))
+        f.writelines(ORDER_ENTRY.pack(offset) for offset in record_offsets)
+        f.writelines(ID_ENTRY.pack(ref[0], ref[1], offset) for _, ref, offset in id_entries)
+        f.writelines(records)
+        f.write(pool.data)
+    os.replace(temp_path, path)
+
+
+class VendorRecord:
+    """Lazy view of one vendor record; fields are decoded on first access"""
+
+    __slots__ = ('_store', '_offset', '_cache')
+
+    def __init__(self, store, offset):
+        self._store = store
+        self._offset = offset
+        self._cache = {}
+
+    def raw(self, field):
+        """Return a zero-copy memoryview of a string field's UTF-8 bytes"""
+        index = STRING_FIELDS.index(field)
+        offset, length = STRING_REF.unpack_from(self._store.buffer, self._offset + index * STRING_REF.size)
+        return self._store.pool_view(offset, length)
+
+    def __getitem__(self, field):
+        if field not in self._cache:
+            self._cache[field] = self._decode(field)
+        return self._cache[field]
+
+    def get(self, field, default=None):
+        try:
+            return self[field]
+        except KeyError:
+            return default
+
+    def has(self, field):
+        """Return whether the source vendor defined field"""
+        if field in STORED_FIELDS:
+            (flags,) = FLAGS.unpack_from(self._store.buffer, self._offset + FLAGS_OFFSET)
+            return bool(flags & (1 << STORED_FIELDS.index(field)))
+        return field in self._extra()
+
+    def _decode(self, field):
+        store = self._store
+        if field in STORED_FIELDS and not self.has(field):
+            raise KeyError(field)
+
+        if field in STRING_FIELDS:
+            return str(self.raw(field), 'utf-8')
+
+        if field in COORD_FIELDS:
+            x, y = COORDS.unpack_from(store.buffer, self._offset + COORDS_OFFSET)
+            return x if field == 'x' else y
+
+        if field in LIST_FIELDS:
+            cursor = self._offset + RECORD_PREFIX_SIZE
+            for list_field in LIST_FIELDS:
+                (count,) = COUNT.unpack_from(store.buffer, cursor)
+                cursor += COUNT.size
+                if list_field == field:
+                    return [
+                        store.read_string(*STRING_REF.unpack_from(store.buffer, cursor + i * STRING_REF.size))
+                        for i in range(count)
+                    ]
+                cursor += count * STRING_REF.size
+
+        extra = self._extra()
+        if field in extra:
+            return extra[field]
+        raise KeyError(field)
+
+    def _extra(self):
+        if '_extra' not in self._cache:
+            offset = self._offset + len(STRING_FIELDS) * STRING_REF.size
+            extra_json = self._store.read_string(*STRING_REF.unpack_from(self._store.buffer, offset))
+            self._cache['_extra'] = json.loads(extra_json) if extra_json else {}
+        return self._cache['_extra']
+
+    def to_dict(self):
+        """Decode the full vendor back into its JSON dict form"""
+        vendor = {field: self[field] for field in STORED_FIELDS if self.has(field)}
+        vendor.update(self._extra())
+        return vendor
+
+
+class VendorStore:
+    """Read-only, memory-mapped view of a binary vendor store"""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        try:
+            self.buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as error:
+            self._file.close()
+            raise VendorStoreError(f'{path} is empty.') from error
+
+        if len(self.buffer) < HEADER.size:
+            self.buffer.close()
+            self._file.close()
+            raise VendorStoreError(f'{path} is truncated.')
+
+        self._view = memoryview(self.buffer)
+        (
+            magic, version, _, self.count,
+            self._order_table_offset, self._id_table_offset, _,
+            self._pool_offset, self._pool_size
+        ) = HEADER.unpack_from(self.buffer, 0)
+
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise VendorStoreError(f'{path} is not a version {FORMAT_VERSION} vendor store.')
+
+        if self._pool_offset + self._pool_size > len(self.buffer):
+            self.close()
+            raise VendorStoreError(f'{path} is truncated.')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            self.buffer.close()
+            self._file.close()
+
+    def pool_view(self, offset, length):
+        start = self._pool_offset + offset
+        return self._view[start:start + length]
+
+    def read_string(self, offset, length):
+        return str(self.pool_view(offset, length), 'utf-8')
+
+    def _find_record_offset(self, vendor_id):
+        key = str(vendor_id).encode('utf-8')
+        low, high = 0, self.count
+
+        # Binary search the sorted id table without decoding any strings.
+        while low < high:
+            middle = (low + high) // 2
+            id_offset, id_length, record_offset = ID_ENTRY.unpack_from(
+                self.buffer, self._id_table_offset + middle * ID_ENTRY.size
+            )
+            candidate = self.pool_view(id_offset, id_length)
+            if candidate == key:
+                return record_offset
+            if bytes(candidate) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        return None
+
+    def get(self, vendor_id):
+        """Return the VendorRecord for vendor_id, or None when absent"""
+        record_offset = self._find_record_offset(vendor_id)
+        return VendorRecord(self, record_offset) if record_offset is not None else None
+
+    def __contains__(self, vendor_id):
+        return self._find_record_offset(vendor_id) is not None
+
+    def __iter__(self):
+        for ordinal in range(self.count):
+            (record_offset,) = ORDER_ENTRY.unpack_from(
+                self.buffer, self._order_table_offset + ordinal * ORDER_ENTRY.size
+            )
+            yield VendorRecord(self, record_offset)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the binary vendor store.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='write the store from vendors.json')
+    build_parser.add_argument('--vendors', default='vendors.json')
+    build_parser.add_argument('--output', default='vendors.bin')
+
+    get_parser = subparsers.add_parser('get', help='print one vendor by id')
+    get_parser.add_argument('vendor_id')
+    get_parser.add_argument('--store', default='vendors.bin')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        vendors = load_json(args.vendors)
+        try:
+            write_vendor_store(vendors, args.output)
+        except VendorStoreError as error:
+            parser.error(str(error))
+        print(f"Wrote {len(vendors)} vendors to {args.output}.")
+        return
+
+    with VendorStore(args.store) as store:
+        record = store.get(args.vendor_id)
+        if record is None:
+            raise SystemExit(f'Vendor {args.vendor_id} not found in {args.store}.')
+        print(json.dumps(record.to_dict(), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+import argparse
+import asyncio
+import json
+import os
+import ssl
+import sys
+import time
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from content_model import load_vendors, save_vendors
+from http_response import read_response
+
+# Normalizes exhibitor URLs from vendors.json and checks that they still
+# resolve. Checks run concurrently with a global limit plus a per-host limit,
+# idle keep-alive connections are reused per origin, and results are cached on
+# disk so repeat builds only revalidate entries older than the TTL.
+
+DEFAULT_CACHE_PATH = 'url_check_cache.json'
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+PLACEHOLDER_URLS = {'', 'none', 'n/a', 'na', 'null', '-', 'tbd'}
+URL_SEPARATOR_WORDS = {'&', ',', ';', 'and'}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+MAX_DRAIN_BYTES = 256 * 1024
+USER_AGENT = 'TileTest-URLCheck/1.0'
+
+
+def normalize_url(raw):
+    """Return a canonical absolute URL, or None for placeholders like N/A and anything not http(s)"""
+    text = str(raw or '').strip()
+    if text.lower() in PLACEHOLDER_URLS:
+        return None
+
+    if '://' not in text:
+        # 'mailto:a@b.com' and 'a@b.com' are addresses, not sites on b.com.
+        if '@' in text or text.lower().startswith('mailto:'):
+            return None
+        text = f'https://{text.lstrip("/")}'
+
+    parts = urlsplit(text)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if scheme not in ('http', 'https') or '.' not in host or parts.username is not None:
+        return None
+
+    try:
+        port = parts.port
+    except ValueError:
+        return None
+
+    netloc = host
+    if port and port != {'http': 80, 'https': 443}[scheme]:
+        netloc = f'{host}:{port}'
+
+    return urlunsplit((scheme, netloc, parts.path or '/', parts.query, ''))
+
+
+def iter_url_candidates(raw):
+    # Only whitespace separates URLs; '&' and ',' inside a token belong to its query string.
+    for token in str(raw or '').split():
+        candidate = token.strip(',;')
+        if candidate and candidate.lower() not in URL_SEPARATOR_WORDS:
+            yield candidate
+
+
+def split_vendor_urls(raw):
+    """Normalize every URL in a field such as 'cocoman.biz & fairlyamused.com'"""
+    urls = []
+    for candidate in iter_url_candidates(raw):
+        url = normalize_url(candidate)
+        if url and url not in urls:
+            urls.append(url)
+    return urls
+
+
+def find_invalid_urls(raw):
+    """Return the entries of a URL field that are neither placeholders nor usable http(s) URLs"""
+    return [
+        candidate for candidate in iter_url_candidates(raw)
+        if candidate.lower() not in PLACEHOLDER_URLS and normalize_url(candidate) is None
+    ]
+
+
+class UrlCheckCache:
+    """JSON file of check results keyed by normalized URL"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        self.entries = {}
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def get(self, url):
+        return self.entries.get(url)
+
+    def put(self, url, entry):
+        self.entries[url] = entry
+
+    def save(self):
+        if not self.path:
+            return
+
+        temp_path = f'{self.path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+
+class ConnectionPool:
+    """Idle keep-alive connections per origin, capped at per_host live sockets"""
+
+    def __init__(self, per_host=2, timeout=10.0):
+        self.per_host = per_host
+        self.timeout = timeout
+        self.idle = {}
+        self.host_limits = {}
+        self.ssl_context = ssl.create_default_context()
+        self.connections_opened = 0
+
+    def host_limit(self, origin):
+        if origin not in self.host_limits:
+            self.host_limits[origin] = asyncio.Semaphore(self.per_host)
+        return self.host_limits[origin]
+
+    async def acquire(self, origin, fresh=False):
+        """Return (connection, reused), preferring an idle keep-alive connection unless fresh is set"""
+        idle = self.idle.get(origin)
+        while idle and not fresh:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return (reader, writer), True
+            writer.close()
+
+        scheme, host, port = origin
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                host, port,
+                ssl=self.ssl_context if scheme == 'https' else None,
+                server_hostname=host if scheme == 'https' else None
+            ),
+            self.timeout
+        )
+        self.connections_opened += 1
+        return (reader, writer), False
+
+    def release(self, origin, connection, reusable):
+        if reusable:
+            self.idle.setdefault(origin, []).append(connection)
+        else:
+            connection[1].close()
+
+    async def close(self):
+        for connections in self.idle.values():
+            for _, writer in connections:
+                writer.close()
+        self.idle.clear()
+
+    async def request(self, method, url, headers=None):
+        """Send one HTTP/1.1 request over a pooled connection"""
+        parts = urlsplit(url)
+        scheme = parts.scheme
+        port = parts.port or (443 if scheme == 'https' else 80)
+        origin = (scheme, parts.hostname, port)
+        target = urlunsplit(('', '', parts.path or '/', parts.query, ''))
+
+        request_lines = [
+            f'{method} {target} HTTP/1.1',
+            f'Host: {parts.netloc}',
+            f'User-Agent: {USER_AGENT}',
+            'Accept: */*',
+            'Connection: keep-alive'
+        ]
+        request_lines.extend(f'{name}: {value}' for name, value in (headers or {}).items())
+        payload = ('\r\n'.join(request_lines) + '\r\n\r\n').encode('latin-1')
+
+        async with self.host_limit(origin):
+            connection, reused = await self.acquire(origin)
+            try:
+                return await self.send(origin, connection, method, payload)
+            except (OSError, asyncio.IncompleteReadError) as error:
+                if not reused or isinstance(error, asyncio.TimeoutError):
+                    raise
+            # The server dropped the idle keep-alive socket; retry once on a new one.
+            connection, _ = await self.acquire(origin, fresh=True)
+            return await self.send(origin, connection, method, payload)
+
+    async def send(self, origin, connection, method, payload):
+        reusable = False
+        try:
+            reader, writer = connection
+            writer.write(payload)
+            await writer.drain()
+            response, reusable = await asyncio.wait_for(
+                read_response(reader, method, MAX_DRAIN_BYTES), self.timeout
+            )
+            return response
+        finally:
+            self.release(origin, connection, reusable)
+
+
+def is_fresh(entry, now, ttl_seconds):
+    return entry is not None and now - entry.get('checkedAt', 0) < ttl_seconds
+
+
+async def fetch_with_redirects(pool, url, headers):
+    """HEAD a URL (GET when HEAD is refused), following redirects"""
+    current_url = url
+    for _ in range(MAX_REDIRECTS + 1):
+        response = await pool.request('HEAD', current_url, headers)
+        if response.status in (405, 501):
+            response = await pool.request('GET', current_url, headers)
+
+        location = response.headers.get('location')
+        if response.status not in REDIRECT_STATUSES or not location:
+            return response, current_url
+
+        current_url = urljoin(current_url, location)
+        headers = None
+
+    raise ConnectionError(f'Too many redirects from {url}')
+
+
+async def check_url(url, pool, cache, now, ttl_seconds):
+    """Check one normalized URL, reusing or revalidating its cache entry"""
+    entry = cache.get(url)
+    if is_fresh(entry, now, ttl_seconds):
+        return {**entry, 'url': url, 'source': 'cache'}
+
+    headers = {}
+    if entry and entry.get('ok'):
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('lastModified'):
+            headers['If-Modified-Since'] = entry['lastModified']
+
+    target_url = entry.get('finalUrl', url) if headers else url
+    try:
+        response, final_url = await fetch_with_redirects(pool, target_url, headers)
+    except (OSError, asyncio.TimeoutError, ValueError, asyncio.IncompleteReadError) as error:
+        result = {'status': None, 'ok': False, 'finalUrl': url, 'error': str(error) or type(error).__name__}
+        cache.put(url, {**result, 'checkedAt': now})
+        return {**result, 'url': url, 'source': 'network'}
+
+    if response.status == 304 and headers:
+        result = {**entry, 'checkedAt': now}
+        cache.put(url, result)
+        return {**result, 'url': url, 'source': 'revalidated'}
+
+    result = {
+        'status': response.status,
+        'ok': 200 <= response.status < 400,
+        'finalUrl': final_url,
+        'etag': response.headers.get('etag'),
+        'lastModified': response.headers.get('last-modified'),
+        'checkedAt': now
+    }
+    cache.put(url, result)
+    return {**result, 'url': url, 'source': 'network'}
+
+
+async def check_urls(urls, cache=None, ttl_seconds=DEFAULT_TTL_SECONDS, concurrency=16, per_host=2,
+                     timeout=10.0, now=None):
+    """Check many URLs concurrently and return results in input order"""
+    cache = cache if cache is not None else UrlCheckCache(None)
+    now = time.time() if now is None else now
+    pool = ConnectionPool(per_host=per_host, timeout=timeout)
+    limit = asyncio.Semaphore(concurrency)
+
+    async def run(url):
+        async with limit:
+            return await check_url(url, pool, cache, now, ttl_seconds)
+
+    try:
+        return await asyncio.gather(*(run(url) for url in urls))
+    finally:
+        await pool.close()
+
+
+def collect_vendor_urls(vendors):
+    """Map each vendor id to its normalized URLs"""
+    return {vendor.id: split_vendor_urls(vendor.url) for vendor in vendors}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Normalize and check exhibitor URLs.')
+    parser.add_argument('--vendors', default='vendors.json')
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH)
+    parser.add_argument('--ttl-hours', type=float, default=DEFAULT_TTL_SECONDS / 3600)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--per-host', type=int, default=2)
+    parser.add_argument('--timeout', type=float, default=10.0)
+    parser.add_argument('--apply', action='store_true', help='write normalized URLs back to the vendors file')
+    parser.add_argument('--json', action='store_true', help='print the machine-readable report')
+    args = parser.parse_args()
+
+    vendors = load_vendors(args.vendors)
+    urls_by_vendor = collect_vendor_urls(vendors)
+    unique_urls = list(dict.fromkeys(url for urls in urls_by_vendor.values() for url in urls))
+
+    cache = UrlCheckCache(args.cache)
+    results = asyncio.run(check_urls(
+        unique_urls, cache,
+        ttl_seconds=args.ttl_hours * 3600,
+        concurrency=args.concurrency,
+        per_host=args.per_host,
+        timeout=args.timeout
+    ))
+    cache.save()
+    result_by_url = {result['url']: result for result in results}
+
+    report = [
+        {
+            'vendorId': vendor.id,
+            'rawUrl': vendor.url,
+            'checks': [result_by_url[url] for url in urls_by_vendor[vendor.id]],
+            'invalid': find_invalid_urls(vendor.url)
+        }
+        for vendor in vendors
+        if vendor.url
+    ]
+
+    if args.apply:
+        # Invalid entries are kept as written so nothing is lost before someone fixes them.
+        for vendor in vendors:
+            vendor.url = ' '.join(urls_by_vendor[vendor.id] + find_invalid_urls(vendor.url))
+        save_vendors(vendors, args.vendors)
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+
+    for entry in report:
+        for candidate in entry['invalid']:
+            print(f"{entry['vendorId']}: {candidate!r} is not a valid http(s) URL")
+        for check in entry['checks']:
+            if not check['ok']:
+                print(f"{entry['vendorId']}: {check['url']} -> {check['status'] or check.get('error')}")
+    sources = [result['source'] for result in results]
+    print(f"Checked {len(unique_urls)} URLs: {sources.count('network')} fetched, "
+          f"{sources.count('revalidated')} revalidated, {sources.count('cache')} from cache, "
+          f"{sum(1 for result in results if not result['ok'])} failing, "
+          f"{sum(len(entry['invalid']) for entry in report)} invalid.")
+
+
+if __name__ == "__main__":
+    main()
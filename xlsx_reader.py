@@ -0,0 +1,188 @@
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+# Streaming reader for .xlsx exhibitor lists.
+#
+# A workbook is a zip of XML parts. Sheets are parsed incrementally with
+# iterparse and every finished <row> element is cleared, so memory stays flat
+# no matter how many rows or sheets the workbook holds. Only the shared-strings
+# table is kept in memory, since cells refer to it by index.
+
+MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PACKAGE_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+SHARED_STRINGS_TYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings'
+CELL_REF = re.compile(r'([A-Z]+)')
+
+
+class XlsxError(Exception):
+    pass
+
+
+def column_index(cell_ref):
+    """Convert a cell reference such as 'AB12' to a zero-based column index"""
+    match = CELL_REF.match(cell_ref or '')
+    if not match:
+        return None
+
+    index = 0
+    for letter in match.group(1):
+        index = index * 26 + ord(letter) - ord('A') + 1
+    return index - 1
+
+
+def resolve_part(base_dir, target):
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join(base_dir, target))
+
+
+def element_text(element):
+    """Join the <t> runs of a string item, skipping phonetic (<rPh>) runs"""
+    parts = []
+    for child in element:
+        if child.tag == f'{MAIN_NS}t':
+            parts.append(child.text or '')
+        elif child.tag == f'{MAIN_NS}r':
+            parts.extend(run.text or '' for run in child.iter(f'{MAIN_NS}t'))
+    return ''.join(parts)
+
+
+def iter_detached(f, tag):
+    """Yield each finished tag element, then drop it from its parent so memory stays flat"""
+    parents = []
+    for event, element in ET.iterparse(f, events=('start', 'end')):
+        if event == 'start':
+            parents.append(element)
+            continue
+
+        parents.pop()
+        if element.tag == tag:
+            yield element
+            element.clear()
+            if parents:
+                parents[-1].remove(element)
+
+
+def format_number(text):
+    """Render numeric cells the way the tab-separated export did (161, not 161.0)"""
+    try:
+        value = float(text)
+    except ValueError:
+        return text
+    return str(int(value)) if value.is_integer() else text
+
+
+class XlsxWorkbook:
+    """Read-only streaming view of an .xlsx file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.zip = zipfile.ZipFile(path)
+        self._shared_strings = None
+        self.sheets = self._read_sheets()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.zip.close()
+
+    def _relationships(self, part):
+        rels_path = posixpath.join(posixpath.dirname(part), '_rels', posixpath.basename(part) + '.rels')
+        if rels_path not in self.zip.namelist():
+            return {}
+
+        base_dir = posixpath.dirname(part)
+        with self.zip.open(rels_path) as f:
+            return {
+                rel.get('Id'): (rel.get('Type'), resolve_part(base_dir, rel.get('Target')))
+                for rel in ET.parse(f).getroot().iter(f'{PACKAGE_REL_NS}Relationship')
+            }
+
+    def _read_sheets(self):
+        self._workbook_rels = self._relationships('xl/workbook.xml')
+        with self.zip.open('xl/workbook.xml') as f:
+            root = ET.parse(f).getroot()
+
+        sheets = {}
+        for sheet in root.iter(f'{MAIN_NS}sheet'):
+            _, part = self._workbook_rels[sheet.get(f'{REL_NS}id')]
+            sheets[sheet.get('name')] = part
+        return sheets
+
+    @property
+    def shared_strings(self):
+        if self._shared_strings is None:
+            self._shared_strings = []
+            part = next(
+                (part for rel_type, part in self._workbook_rels.values() if rel_type == SHARED_STRINGS_TYPE),
+                None
+            )
+            if part:
+                with self.zip.open(part) as f:
+                    for element in iter_detached(f, f'{MAIN_NS}si'):
+                        self._shared_strings.append(element_text(element))
+        return self._shared_strings
+
+    def _cell_value(self, cell):
+        cell_type = cell.get('t', 'n')
+        if cell_type == 'inlineStr':
+            inline = cell.find(f'{MAIN_NS}is')
+            return element_text(inline) if inline is not None else ''
+
+        value = cell.find(f'{MAIN_NS}v')
+        text = value.text if value is not None and value.text is not None else ''
+        if not text:
+            return ''
+        if cell_type == 's':
+            return self.shared_strings[int(text)]
+        if cell_type == 'b':
+            return 'TRUE' if text == '1' else 'FALSE'
+        if cell_type == 'n':
+            return format_number(text)
+        return text
+
+    def iter_rows(self, sheet_name):
+        """Yield each non-empty row of a sheet as a list of strings, as it is parsed"""
+        if sheet_name not in self.sheets:
+            raise XlsxError(f'{self.path} has no sheet named "{sheet_name}".')
+
+        with self.zip.open(self.sheets[sheet_name]) as f:
+            for element in iter_detached(f, f'{MAIN_NS}row'):
+                row = []
+                for cell in element.iter(f'{MAIN_NS}c'):
+                    index = column_index(cell.get('r'))
+                    if index is None:
+                        index = len(row)
+                    if index >= len(row):
+                        row.extend([''] * (index + 1 - len(row)))
+                    row[index] = self._cell_value(cell)
+
+                while row and not row[-1].strip():
+                    row.pop()
+                if row:
+                    yield row
+
+    def find_sheet(self, required_headers):
+        """Return the first sheet whose header row holds every required column"""
+        required = set(required_headers)
+        for sheet_name in self.sheets:
+            rows = self.iter_rows(sheet_name)
+            header = next(rows, [])
+            rows.close()
+            if required <= {cell.strip() for cell in header}:
+                return sheet_name
+        raise XlsxError(f'{self.path} has no sheet with columns {", ".join(required_headers)}.')
+
+    def iter_dicts(self, sheet_name):
+        """Yield rows keyed by the sheet's header row, like csv.DictReader"""
+        rows = self.iter_rows(sheet_name)
+        header = [cell.strip() for cell in next(rows, [])]
+        for row in rows:
+            yield {column: row[index] if index < len(row) else '' for index, column in enumerate(header)}